@@ -0,0 +1,87 @@
+import os
+import time
+import logging
+import threading
+
+from ffmpeg_tools import BYTES_PER_SAMPLE, SAMPLE_RATE, decode_pcm_to_file
+
+
+class AudioCache:
+    """Disk cache of decoded 16 kHz mono float32 audio, keyed by media fingerprint
+
+    Files are raw little-endian float32 so they can be opened with numpy.memmap
+    and sliced without reading the whole soundtrack into RAM. The file mtime
+    doubles as the LRU timestamp.
+    """
+
+    def __init__(self, root, max_bytes=4 * 1024 * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, fingerprint):
+        return os.path.join(self.root, f"{fingerprint}.f32")
+
+    def _open(self, path):
+        import numpy as np
+        if os.path.getsize(path) < BYTES_PER_SAMPLE:
+            return np.zeros(0, dtype=np.float32)
+        return np.memmap(path, dtype=np.float32, mode="r")
+
+    def get(self, fingerprint):
+        """Return a read-only memmap of the cached audio, or None on a miss"""
+        path = self._path(fingerprint)
+        if not os.path.exists(path):
+            return None
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        logging.info(f"Audio cache hit: {fingerprint}")
+        return self._open(path)
+
+    def put_from_ffmpeg(self, fingerprint, ffmpeg_cmd, media_path, cancel_token=None):
+        """Decode media into the cache and return a memmap of the result"""
+        path = self._path(fingerprint)
+        temp_path = path + ".tmp"
+        start = time.time()
+        try:
+            samples = decode_pcm_to_file(ffmpeg_cmd, media_path, temp_path, cancel_token)
+            os.replace(temp_path, path)
+        except Exception:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        logging.info(f"Audio cached in {time.time() - start:.1f}s: {samples / SAMPLE_RATE:.0f}s of audio for {os.path.basename(media_path)}")
+        self.evict(keep=path)
+        return self._open(path)
+
+    def evict(self, keep=None):
+        """Delete least recently used files until the cache fits its disk budget"""
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.root):
+                if not name.endswith(".f32"):
+                    continue
+                path = os.path.join(self.root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.remove(path)
+                    total -= size
+                    logging.info(f"Evicted cached audio {os.path.basename(path)}")
+                except OSError:
+                    # Still mapped by a running job on Windows; try again next time
+                    pass
@@ -0,0 +1,202 @@
+import os
+import json
+import time
+import shutil
+import logging
+import threading
+import subprocess
+
+# faster-whisper expects 16 kHz mono float32 samples
+SAMPLE_RATE = 16000
+BYTES_PER_SAMPLE = 4
+READ_BLOCK_SIZE = 1 << 20
+
+
+def _candidate_paths(base_path, tool):
+    return [
+        os.path.join(base_path, "ffmpeg", f"{tool}.exe"),  # Bundled ffmpeg folder
+        os.path.join(base_path, f"{tool}.exe"),  # Bundled root folder
+        tool,  # System PATH (fallback)
+        f"C:\\ffmpeg\\bin\\{tool}.exe",  # Common install location
+        os.path.join(os.environ.get('PROGRAMFILES', ''), 'ffmpeg', 'bin', f'{tool}.exe'),  # Program Files
+    ]
+
+
+class ToolResolver:
+    """Finds ffmpeg/ffprobe once and remembers them across launches"""
+
+    def __init__(self, base_path, cache_file=None):
+        self.base_path = base_path
+        self.cache_file = cache_file or os.path.join(os.path.expanduser("~"), ".zestsync_tools.json")
+        self._lock = threading.Lock()
+        self._tools = {}
+        self._persisted = self._load_cache()
+
+    def _load_cache(self):
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            logging.error(f"Error loading tool cache: {e}")
+        return {}
+
+    def _save_cache(self):
+        try:
+            with open(self.cache_file, 'w') as f:
+                json.dump(self._persisted, f, indent=2)
+        except Exception as e:
+            logging.error(f"Error saving tool cache: {e}")
+
+    def _absolute(self, path):
+        if os.path.isabs(path):
+            return path if os.path.isfile(path) else None
+        return shutil.which(path)
+
+    def _is_still_valid(self, info):
+        # The binary is trusted as long as it has not been replaced or touched
+        path = info.get("path")
+        try:
+            return bool(path) and os.path.getmtime(path) == info.get("mtime") and os.path.getsize(path) == info.get("size")
+        except OSError:
+            return False
+
+    def _probe(self, tool):
+        for candidate in _candidate_paths(self.base_path, tool):
+            path = self._absolute(candidate)
+            if not path:
+                continue
+            try:
+                result = subprocess.run([path, "-version"], capture_output=True, text=True, check=True, timeout=10)
+            except Exception:
+                continue
+            info = {
+                "path": path,
+                "mtime": os.path.getmtime(path),
+                "size": os.path.getsize(path),
+                "version": result.stdout.splitlines()[0] if result.stdout else "",
+            }
+            return info
+        return None
+
+    def resolve_info(self, tool):
+        """Return the cached info dict for a tool, probing only when nothing valid is known"""
+        with self._lock:
+            info = self._tools.get(tool)
+            if info is not None:
+                return info
+            info = self._persisted.get(tool)
+            if info is None or not self._is_still_valid(info):
+                start = time.time()
+                info = self._probe(tool)
+                if info is None:
+                    logging.error(f"{tool} not found in any expected location")
+                    return None
+                logging.info(f"Resolved {tool} in {time.time() - start:.2f}s: {info['path']}")
+                self._persisted[tool] = info
+                self._save_cache()
+            self._tools[tool] = info
+            return info
+
+    def resolve(self, tool):
+        info = self.resolve_info(tool)
+        return info["path"] if info else None
+
+    def warm_up(self):
+        """Resolve both tools on a background thread so the first job does not wait"""
+        def _resolve_all():
+            for tool in ("ffmpeg", "ffprobe"):
+                try:
+                    self.resolve_info(tool)
+                except Exception as e:
+                    logging.error(f"Error resolving {tool}: {e}")
+        threading.Thread(target=_resolve_all, name="tool-resolver", daemon=True).start()
+
+
+_tool_resolver = None
+_tool_resolver_lock = threading.Lock()
+
+
+def get_tool_resolver(base_path):
+    """Return the shared ToolResolver for this process"""
+    global _tool_resolver
+    with _tool_resolver_lock:
+        if _tool_resolver is None:
+            _tool_resolver = ToolResolver(base_path)
+        return _tool_resolver
+
+
+def build_pcm_command(ffmpeg_cmd, media_path, start=None, duration=None):
+    """ffmpeg command that writes raw 16 kHz mono float32 PCM to stdout"""
+    command = [ffmpeg_cmd, "-nostdin", "-v", "error"]
+    if start:
+        command += ["-ss", f"{start:.3f}"]
+    command += ["-i", media_path]
+    if duration:
+        command += ["-t", f"{duration:.3f}"]
+    command += ["-vn", "-ac", "1", "-ar", str(SAMPLE_RATE), "-f", "f32le", "-acodec", "pcm_f32le", "-"]
+    return command
+
+
+def _check_decode_result(process, stderr, cancel_token):
+    if cancel_token is not None:
+        cancel_token.detach_process(process)
+        cancel_token.raise_if_cancelled()
+    if process.returncode != 0:
+        error = stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"ffmpeg audio decode failed ({process.returncode}): {error}")
+
+
+def _drain_stderr(process):
+    """Collect stderr on a thread so ffmpeg never blocks on a full pipe while stdout is being read"""
+    chunks = []
+    thread = threading.Thread(target=lambda: chunks.append(process.stderr.read()), name="ffmpeg-stderr", daemon=True)
+    thread.start()
+    return thread, chunks
+
+
+def read_pcm_audio(ffmpeg_cmd, media_path, cancel_token=None):
+    """Decode the whole soundtrack into one float32 numpy array without a temp file"""
+    import numpy as np
+
+    process = subprocess.Popen(build_pcm_command(ffmpeg_cmd, media_path),
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if cancel_token is not None:
+        cancel_token.attach_process(process)
+    # Damaged media can make ffmpeg log an error per packet, more than the pipe buffer holds
+    stderr_thread, stderr_chunks = _drain_stderr(process)
+    buffer = bytearray()
+    try:
+        while True:
+            block = process.stdout.read(READ_BLOCK_SIZE)
+            if not block:
+                break
+            buffer += block
+        process.wait()
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        stderr_thread.join()
+        process.stdout.close()
+        process.stderr.close()
+
+    _check_decode_result(process, b"".join(stderr_chunks), cancel_token)
+
+    usable = len(buffer) - len(buffer) % BYTES_PER_SAMPLE
+    del buffer[usable:]
+    audio = np.frombuffer(buffer, dtype=np.float32)
+    logging.info(f"Decoded {len(audio) / SAMPLE_RATE:.1f}s of audio from {os.path.basename(media_path)}")
+    return audio
+
+
+def decode_pcm_to_file(ffmpeg_cmd, media_path, output_path, cancel_token=None):
+    """Decode 16 kHz mono float32 PCM straight from ffmpeg's stdout into a raw file"""
+    with open(output_path, "wb") as out:
+        process = subprocess.Popen(build_pcm_command(ffmpeg_cmd, media_path),
+                                   stdout=out, stderr=subprocess.PIPE)
+        if cancel_token is not None:
+            cancel_token.attach_process(process)
+        _, stderr = process.communicate()
+    _check_decode_result(process, stderr, cancel_token)
+    return os.path.getsize(output_path) // BYTES_PER_SAMPLE
@@ -0,0 +1,112 @@
+import os
+import time
+import logging
+
+import psutil
+
+from ffmpeg_tools import SAMPLE_RATE
+from inference_worker import audio_job_params
+from jobs import JobCancelled
+
+# Seconds of real audio timed per candidate during calibration
+CALIBRATION_SECONDS = 20
+COMPUTE_TYPES = ["int8", "int8_float32", "float32"]
+
+
+def core_layout():
+    """Return (physical cores, logical cores) as seen by psutil"""
+    logical = psutil.cpu_count() or os.cpu_count() or 1
+    physical = psutil.cpu_count(logical=False) or logical
+    return physical, logical
+
+
+def default_config():
+    """Untuned starting point: one decode thread per physical core, int8 weights"""
+    physical, _ = core_layout()
+    return {"cpu_threads": physical, "compute_type": "int8"}
+
+
+def candidate_configs():
+    """Small set of thread/compute-type combinations worth timing on this machine"""
+    physical, logical = core_layout()
+    threads = sorted({max(1, physical // 2), physical, logical})
+    candidates = [{"cpu_threads": t, "compute_type": "int8"} for t in threads]
+    # int8 is almost always fastest on CPU; only check float weights at the physical core count
+    candidates.append({"cpu_threads": physical, "compute_type": "int8_float32"})
+    return candidates
+
+
+def _calibration_range(audio):
+    """(start, end) samples timed during calibration"""
+    length = int(CALIBRATION_SECONDS * SAMPLE_RATE)
+    if len(audio) <= length:
+        return 0, len(audio)
+    # The middle of the file is more likely to contain speech than the intro
+    start = (len(audio) - length) // 2
+    return start, start + length
+
+
+class HardwareTuner:
+    """Picks cpu_threads/compute_type per accuracy mode and remembers the result"""
+
+    def __init__(self, settings_manager, whisper_worker):
+        self.settings_manager = settings_manager
+        # Candidates are loaded and timed in the Whisper worker process, where the chosen one then stays
+        self.whisper_worker = whisper_worker
+
+    def is_tuned(self, mode):
+        return self.settings_manager.get_tuned_whisper_config(mode) is not None
+
+    def get_config(self, mode):
+        """Tuned values for the mode with any user overrides applied on top"""
+        config = default_config()
+        tuned = self.settings_manager.get_tuned_whisper_config(mode)
+        if tuned:
+            config.update({key: tuned[key] for key in config if key in tuned})
+        for key, value in self.settings_manager.get_whisper_overrides(mode).items():
+            if key in config and value:
+                config[key] = value
+        return config
+
+    def get_realtime_factor(self, mode):
+        tuned = self.settings_manager.get_tuned_whisper_config(mode)
+        return tuned.get("rtf") if tuned else None
+
+    def calibrate(self, mode, model_path, audio, lang_code="en", cancel_token=None):
+        """Time each candidate on a slice of real audio and persist the fastest one"""
+        start, end = _calibration_range(audio)
+        sample_seconds = (end - start) / SAMPLE_RATE
+        if sample_seconds < 5:
+            logging.info("Audio too short to calibrate, keeping default Whisper settings")
+            return default_config()
+
+        physical, logical = core_layout()
+        logging.info(f"Calibrating Whisper ({mode}) on {physical} physical / {logical} logical cores")
+        best = None
+        for config in candidate_configs():
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            try:
+                result = self.whisper_worker.run("transcribe", dict(config, model_path=model_path, lang_code=lang_code,
+                                                                    **audio_job_params(audio, start, end)),
+                                                 cancel_token=cancel_token)
+                rtf = result["elapsed"] / sample_seconds
+            except JobCancelled:
+                raise
+            except Exception as e:
+                logging.warning(f"Calibration candidate {config} failed: {e}")
+                continue
+            logging.info(f"Calibration {config}: real-time factor {rtf:.3f}")
+            if best is None or rtf < best["rtf"]:
+                best = dict(config, rtf=rtf)
+
+        # Drop the losing variants, only the chosen one will be used from now on
+        for config in candidate_configs():
+            if best is None or config["cpu_threads"] != best["cpu_threads"] or config["compute_type"] != best["compute_type"]:
+                self.whisper_worker.run("unload_whisper", dict(config, model_path=model_path), cancel_token=cancel_token)
+        if best is None:
+            return default_config()
+        best["calibrated_at"] = time.time()
+        self.settings_manager.set_tuned_whisper_config(mode, best)
+        logging.info(f"Whisper ({mode}) tuned: {best}")
+        return self.get_config(mode)
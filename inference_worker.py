@@ -0,0 +1,307 @@
+import time
+import logging
+import threading
+import traceback
+import multiprocessing
+
+import psutil
+
+from jobs import JobCancelled
+from ffmpeg_tools import SAMPLE_RATE
+from model_manager import get_model_manager
+from translation_pool import TranslationModelPool
+from translation_backends import EasyNMTBackend
+from translation_planner import approx_tokens
+
+
+class WorkerCrashed(RuntimeError):
+    """The worker process died while a job was running"""
+
+
+# --- Child process side -----------------------------------------------------
+
+def _handle_load_translation(state, params, emit):
+    pool = state["translation_pool"]
+    source_lang = params.get("source_lang", "en")
+    was_loaded = pool.is_loaded(source_lang, params["target_lang"])
+    model = pool.acquire(source_lang, params["target_lang"])
+    stats = pool.get_stats()
+    return {"loaded": f"opus-mt-{source_lang}-{params['target_lang']}", "backend": model.name,
+            "load_time": 0.0 if was_loaded else stats["last_load_time"]}
+
+
+def _benchmark_backends(model, sample, source_lang, target_lang):
+    """Time the loaded backend against the PyTorch path on the same lines, in source tokens/second"""
+    tokens = sum(approx_tokens(line) for line in sample)
+
+    def timed(backend):
+        start = time.time()
+        backend.translate(sample)
+        return tokens / max(time.time() - start, 1e-6)
+
+    speeds = {model.name: timed(model)}
+    if model.name != EasyNMTBackend.name:
+        fallback = EasyNMTBackend(source_lang, target_lang)
+        try:
+            speeds[fallback.name] = timed(fallback)
+        finally:
+            fallback.close()
+    return speeds
+
+
+def _handle_translate(state, params, emit):
+    """Translate pre-planned batches (list of line lists); each batch is one forward pass"""
+    source_lang = params.get("source_lang", "en")
+    # Models stay resident in the pool, so the next file in the same language skips the load
+    model = state["translation_pool"].acquire(source_lang, params["target_lang"])
+    results = []
+    done = 0
+    start = time.time()
+    for batch in params["batches"]:
+        results.append(model.translate(batch))
+        done += len(batch)
+        emit(done)
+    result = {"batches": results, "elapsed": time.time() - start, "backend": model.name,
+              "pool_stats": state["translation_pool"].get_stats()}
+    if params.get("benchmark") and params["batches"]:
+        try:
+            sample = max(params["batches"], key=len)
+            result["benchmark"] = _benchmark_backends(model, sample, source_lang, params["target_lang"])
+        except Exception as e:
+            logging.warning(f"Translation backend benchmark failed: {e}")
+    return result
+
+
+def _whisper_params(params):
+    return params["model_path"], params.get("compute_type", "int8"), params.get("cpu_threads", 0)
+
+
+def load_job_audio(params):
+    """(samples, offset in seconds) of a job: a window of the audio cache file, or samples sent with the job"""
+    if params.get("audio_path"):
+        import numpy as np
+        audio = np.memmap(params["audio_path"], dtype=np.float32, mode="r")
+        return audio[params["start"]:params["end"]], params["start"] / SAMPLE_RATE
+    return params["audio"], params["start"] / SAMPLE_RATE
+
+
+def _handle_load_whisper(state, params, emit):
+    manager = get_model_manager()
+    was_loaded = manager.is_loaded(*_whisper_params(params))
+    start = time.time()
+    manager.get(*_whisper_params(params))
+    return {"loaded": params["model_path"], "load_time": 0.0 if was_loaded else time.time() - start}
+
+
+def _handle_unload_whisper(state, params, emit):
+    return {"unloaded": get_model_manager().unload(*_whisper_params(params))}
+
+
+def _handle_transcribe(state, params, emit):
+    """Decode a span of audio with Whisper, sending each segment back as soon as it is decoded"""
+    audio, offset = load_job_audio(params)
+    lang_code = params.get("lang_code")
+    vad_filter = params.get("vad_filter", False)
+    with get_model_manager().lease(*_whisper_params(params)) as model:
+        # Timed after the lease so calibration measures decoding, not loading
+        start = time.time()
+        segments = None
+        if vad_filter and params.get("batch_size"):
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                logging.warning("Batched inference needs a newer faster-whisper, decoding sequentially")
+            else:
+                # Speech chunks found by VAD are padded into batches and decoded in one forward pass each
+                segments, _ = BatchedInferencePipeline(model=model).transcribe(audio, language=lang_code, vad_filter=True,
+                                                                               batch_size=params["batch_size"])
+        if segments is None:
+            segments, _ = model.transcribe(audio, language=lang_code, vad_filter=vad_filter, beam_size=params.get("beam_size", 5))
+        count = 0
+        for segment in segments:
+            emit({'start': offset + segment.start, 'end': offset + segment.end, 'text': segment.text.strip()})
+            count += 1
+    return {"segments": count, "elapsed": time.time() - start, "cache_stats": get_model_manager().get_stats()}
+
+
+def _handle_split_audio(state, params, emit):
+    """Silence-bounded (start, end) sample ranges; Silero VAD runs here so onnxruntime stays out of the player"""
+    from parallel_transcriber import split_at_silence
+    audio, _ = load_job_audio(params)
+    return {"chunks": split_at_silence(audio, params["target_chunk_seconds"])}
+
+
+HANDLERS = {
+    "load_translation": _handle_load_translation,
+    "translate": _handle_translate,
+    "load_whisper": _handle_load_whisper,
+    "unload_whisper": _handle_unload_whisper,
+    "transcribe": _handle_transcribe,
+    "split_audio": _handle_split_audio,
+}
+
+
+def _worker_main(conn, config):
+    if config.get("torch_threads"):
+        try:
+            import torch
+            torch.set_num_threads(config["torch_threads"])
+        except ImportError:
+            pass
+    if config.get("whisper_idle_timeout"):
+        get_model_manager().idle_timeout = config["whisper_idle_timeout"]
+    state = {
+        "translation_pool": TranslationModelPool(
+            max_models=config.get("translation_pool_size", 3),
+            reserve_mb=config.get("translation_pool_reserve_mb", 1024),
+            backend=config.get("translation_backend", "auto"),
+            cpu_threads=config.get("torch_threads", 0),
+        ),
+    }
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message[0] == "stop":
+            return
+        _, kind, params = message
+        try:
+            result = HANDLERS[kind](state, params, lambda payload: conn.send(("progress", payload)))
+            conn.send(("result", result))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}", traceback.format_exc()))
+
+
+# --- GUI process side -------------------------------------------------------
+
+def audio_job_params(audio, start=0, end=None):
+    """Job parameters naming a span of audio, pass the whole array as returned by the audio cache
+
+    Memory-mapped cache files are sent by path so the worker maps them itself;
+    anything else is sliced and pickled over the pipe.
+    """
+    end = len(audio) if end is None else end
+    path = getattr(audio, "filename", None)
+    if path:
+        return {"audio_path": path, "start": start, "end": end}
+    return {"audio": audio[start:end], "start": start}
+
+class InferenceWorker:
+    """Long-lived subprocess that runs model inference so its memory never lands in the GUI process
+
+    Jobs run one at a time. The process is started lazily, replaced after
+    max_jobs jobs (never, when None) or once its RSS passes max_rss_mb, and
+    killed outright when a job is cancelled.
+    """
+
+    def __init__(self, max_jobs=20, max_rss_mb=6144, poll_interval=0.2, config=None):
+        self.config = config or {}
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._process = None
+        self._conn = None
+        self._jobs_done = 0
+
+    def _start(self):
+        context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_worker_main, args=(child_conn, self.config), name="inference-worker", daemon=True)
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+        self._jobs_done = 0
+        logging.info(f"Inference worker started (pid {self._process.pid})")
+
+    def _shutdown(self, graceful=True):
+        process, conn = self._process, self._conn
+        self._process = None
+        self._conn = None
+        if process is None:
+            return
+        if graceful and process.is_alive():
+            try:
+                conn.send(("stop",))
+                process.join(timeout=5)
+            except Exception:
+                pass
+        if process.is_alive():
+            process.kill()
+            process.join(timeout=5)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def rss_mb(self):
+        process = self._process
+        if process is None or not process.is_alive():
+            return 0
+        try:
+            return psutil.Process(process.pid).memory_info().rss // (1024 * 1024)
+        except psutil.Error:
+            return 0
+
+    def _maybe_recycle(self):
+        rss = self.rss_mb()
+        if (self.max_jobs is not None and self._jobs_done >= self.max_jobs) or rss >= self.max_rss_mb:
+            logging.info(f"Recycling inference worker after {self._jobs_done} jobs at {rss}MB RSS")
+            self._shutdown()
+
+    def run(self, kind, params, on_progress=None, cancel_token=None):
+        """Run one job in the worker and return its result; blocks the calling (non-GUI) thread"""
+        with self._lock:
+            if cancel_token is not None and cancel_token.cancelled:
+                # Cancelled while the previous job ran; killing the worker now would only hit that job's models
+                raise JobCancelled()
+            if self._process is None or not self._process.is_alive():
+                self._start()
+            conn = self._conn
+            conn.send(("job", kind, params))
+            try:
+                while True:
+                    if cancel_token is not None and cancel_token.cancelled:
+                        # The child cannot be interrupted mid-batch, replacing it is instant and frees everything
+                        self._shutdown(graceful=False)
+                        raise JobCancelled()
+                    if not conn.poll(self.poll_interval):
+                        if not self._process.is_alive():
+                            raise WorkerCrashed(f"Inference worker exited with code {self._process.exitcode}")
+                        continue
+                    message = conn.recv()
+                    if message[0] == "progress":
+                        if on_progress:
+                            on_progress(message[1])
+                    elif message[0] == "result":
+                        return message[1]
+                    else:
+                        # The handler failed but the child is idle again, so it is kept
+                        break
+            except (EOFError, OSError) as e:
+                self._shutdown(graceful=False)
+                raise WorkerCrashed(f"Lost connection to inference worker: {e}")
+            except BaseException:
+                # Also covers on_progress raising: the child would otherwise still be mid-job and
+                # send this job's progress and result to the next caller
+                self._shutdown(graceful=False)
+                raise
+            finally:
+                if self._process is not None:
+                    self._jobs_done += 1
+                    self._maybe_recycle()
+            logging.error(f"Inference worker traceback:\n{message[2]}")
+            raise RuntimeError(message[1])
+
+    def stop(self):
+        if self._lock.acquire(timeout=1):
+            try:
+                self._shutdown()
+            finally:
+                self._lock.release()
+        else:
+            # A job is still running; do not block the caller on it
+            process = self._process
+            if process is not None and process.is_alive():
+                process.kill()
@@ -0,0 +1,124 @@
+import time
+import threading
+
+
+class JobProgress:
+    """Thread-safe progress channel written by a worker and polled by the GUI"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = 0
+        self.done = 0
+        self.stage = "starting"
+        self.created_at = time.time()
+        self.started_at = None
+
+    def begin(self, total, stage="running"):
+        """Mark the start of the measurable phase, e.g. after the model is loaded"""
+        with self._lock:
+            self.total = total
+            self.done = 0
+            self.stage = stage
+            self.started_at = time.time()
+
+    def update(self, done):
+        with self._lock:
+            # Out-of-order reports never move the bar backwards
+            self.done = max(self.done, min(done, self.total) if self.total else done)
+
+    def set_stage(self, stage):
+        with self._lock:
+            self.stage = stage
+
+    def snapshot(self):
+        """Return (fraction done, seconds remaining or None, stage)"""
+        with self._lock:
+            if not self.total or self.started_at is None:
+                return 0.0, None, self.stage
+            fraction = self.done / self.total
+            elapsed = time.time() - self.started_at
+            if self.done <= 0 or elapsed <= 0:
+                return fraction, None, self.stage
+            throughput = self.done / elapsed
+            remaining = (self.total - self.done) / throughput
+            return fraction, remaining, self.stage
+
+
+class ProgressGroup:
+    """One JobProgress per key (e.g. target language) that also reads as a single combined job"""
+
+    def __init__(self, keys):
+        self.parts = {key: JobProgress() for key in keys}
+        for part in self.parts.values():
+            part.set_stage("queued")
+
+    def __getitem__(self, key):
+        return self.parts[key]
+
+    def set_stage(self, stage):
+        for part in self.parts.values():
+            part.set_stage(stage)
+
+    def snapshot(self):
+        """Combined (fraction done, seconds remaining or None, stage) across all parts"""
+        snapshots = [part.snapshot() for part in self.parts.values()]
+        if not snapshots:
+            return 0.0, None, "starting"
+        fraction = sum(snap[0] for snap in snapshots) / len(snapshots)
+        remaining = [snap[1] for snap in snapshots if snap[1] is not None]
+        return fraction, max(remaining) if remaining else None, f"{len(snapshots)} languages"
+
+    def describe(self):
+        """Short per-key readout like 'es 40% · fr queued'"""
+        readouts = []
+        for key, part in self.parts.items():
+            fraction, _, stage = part.snapshot()
+            if stage == "Translating":
+                readouts.append(f"{key} {int(fraction * 100)}%")
+            else:
+                readouts.append(f"{key} {stage.lower()}")
+        return " · ".join(readouts)
+
+
+class JobCancelled(Exception):
+    """Raised inside a worker once its CancelToken has been triggered"""
+
+
+class CancelToken:
+    """Cooperative cancellation flag shared between the GUI and a background job"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._processes = []
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        self._event.set()
+        # Child processes cannot poll the flag, so stop them directly
+        with self._lock:
+            processes = list(self._processes)
+        for process in processes:
+            try:
+                if process.poll() is None:
+                    process.kill()
+            except Exception:
+                pass
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise JobCancelled()
+
+    def attach_process(self, process):
+        with self._lock:
+            self._processes.append(process)
+        if self._event.is_set():
+            process.kill()
+
+    def detach_process(self, process):
+        with self._lock:
+            if process in self._processes:
+                self._processes.remove(process)
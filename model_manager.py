@@ -0,0 +1,195 @@
+import os
+import gc
+import time
+import logging
+import threading
+from contextlib import contextmanager
+
+import psutil
+
+
+class WhisperModelManager:
+    """Process-wide cache of loaded WhisperModel instances shared across jobs"""
+
+    def __init__(self, idle_timeout=600, memory_pressure_percent=90, sweep_interval=30):
+        self.idle_timeout = idle_timeout
+        self.memory_pressure_percent = memory_pressure_percent
+        self.sweep_interval = sweep_interval
+        self._lock = threading.Lock()
+        self._models = {}  # key -> {"model", "last_used", "users", "load_time"}
+        self._loading = {}  # key -> Event set when an in-flight load finishes
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "load_times": []}
+        self._sweeper = None
+
+    def _make_key(self, model_path, compute_type, cpu_threads):
+        return (model_path, compute_type, cpu_threads)
+
+    def _load(self, model_path, compute_type, cpu_threads):
+        from faster_whisper import WhisperModel
+        return WhisperModel(model_path, local_files_only=True, device="cpu", compute_type=compute_type,
+                            cpu_threads=cpu_threads)
+
+    def get(self, model_path, compute_type="int8", cpu_threads=0):
+        """Return a cached model, loading it on a miss"""
+        key = self._make_key(model_path, compute_type, cpu_threads)
+        while True:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry is not None:
+                    entry["last_used"] = time.time()
+                    self._stats["hits"] += 1
+                    logging.info(f"Whisper model cache hit: {key}")
+                    return entry["model"]
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = self._loading[key] = threading.Event()
+                    break
+            # Someone (e.g. a pre-warm) is already loading this model, wait for it instead of loading twice
+            loading.wait()
+            with self._lock:
+                if key not in self._models and key not in self._loading:
+                    # That load failed; try it ourselves
+                    continue
+
+        # Load outside the lock so other keys are not blocked by a slow load
+        try:
+            start = time.time()
+            model = self._load(model_path, compute_type, cpu_threads)
+            load_time = time.time() - start
+            with self._lock:
+                self._models[key] = {"model": model, "last_used": time.time(), "users": 0, "load_time": load_time}
+                self._stats["misses"] += 1
+                self._stats["load_times"].append(load_time)
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+            loading.set()
+        logging.info(f"Whisper model loaded in {load_time:.1f}s: {key}")
+        self._ensure_sweeper()
+        return model
+
+    @contextmanager
+    def lease(self, model_path, compute_type="int8", cpu_threads=0):
+        """Context manager that keeps the model pinned while a job uses it"""
+        model = self.get(model_path, compute_type, cpu_threads)
+        key = self._make_key(model_path, compute_type, cpu_threads)
+        with self._lock:
+            if key in self._models:
+                self._models[key]["users"] += 1
+        try:
+            yield model
+        finally:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry is not None:
+                    entry["users"] -= 1
+                    entry["last_used"] = time.time()
+
+    def is_loaded(self, model_path, compute_type="int8", cpu_threads=0):
+        with self._lock:
+            return self._make_key(model_path, compute_type, cpu_threads) in self._models
+
+    def evict_idle(self, force_memory_check=True):
+        """Unload models idle past the timeout, or the least recently used one under memory pressure"""
+        now = time.time()
+        evicted = []
+        with self._lock:
+            for key, entry in list(self._models.items()):
+                if entry["users"] == 0 and now - entry["last_used"] > self.idle_timeout:
+                    del self._models[key]
+                    evicted.append(key)
+
+            if force_memory_check and psutil.virtual_memory().percent >= self.memory_pressure_percent:
+                idle = [(entry["last_used"], key) for key, entry in self._models.items() if entry["users"] == 0]
+                if idle:
+                    _, key = min(idle)
+                    del self._models[key]
+                    evicted.append(key)
+            self._stats["evictions"] += len(evicted)
+
+        if evicted:
+            gc.collect()
+            for key in evicted:
+                logging.info(f"Whisper model unloaded: {key}")
+        return evicted
+
+    def unload(self, model_path, compute_type="int8", cpu_threads=0):
+        """Drop one specific model unless a job is still using it"""
+        key = self._make_key(model_path, compute_type, cpu_threads)
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is None or entry["users"] > 0:
+                return False
+            del self._models[key]
+            self._stats["evictions"] += 1
+        gc.collect()
+        logging.info(f"Whisper model unloaded: {key}")
+        return True
+
+    def get_stats(self):
+        with self._lock:
+            load_times = self._stats["load_times"]
+            requests = self._stats["hits"] + self._stats["misses"]
+            return {
+                "hits": self._stats["hits"],
+                "misses": self._stats["misses"],
+                "hit_rate": self._stats["hits"] / requests if requests else 0.0,
+                "evictions": self._stats["evictions"],
+                "loaded": len(self._models),
+                "avg_load_time": sum(load_times) / len(load_times) if load_times else 0.0,
+                "load_time_saved": self._stats["hits"] * (sum(load_times) / len(load_times)) if load_times else 0.0,
+            }
+
+    def _ensure_sweeper(self):
+        with self._lock:
+            if self._sweeper is not None and self._sweeper.is_alive():
+                return
+            self._sweeper = threading.Thread(target=self._sweep_loop, name="whisper-model-sweeper", daemon=True)
+            self._sweeper.start()
+
+    def _sweep_loop(self):
+        while True:
+            time.sleep(self.sweep_interval)
+            try:
+                self.evict_idle()
+            except Exception as e:
+                logging.error(f"Error evicting idle Whisper models: {e}")
+            with self._lock:
+                if not self._models:
+                    self._sweeper = None
+                    return
+
+
+def estimate_model_memory_mb(model_dir):
+    """Rough resident size of a model: its weight files plus some runtime overhead"""
+    total = 0
+    for root, _, files in os.walk(model_dir):
+        for name in files:
+            if name.endswith((".bin", ".safetensors", ".onnx", ".pt")):
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    pass
+    return int(total * 1.2 / (1024 * 1024))
+
+
+def available_memory_mb():
+    return psutil.virtual_memory().available // (1024 * 1024)
+
+
+def has_memory_for(model_mb, reserve_mb):
+    """True if loading model_mb more still leaves reserve_mb of RAM available"""
+    return available_memory_mb() - model_mb >= reserve_mb
+
+
+_model_manager = None
+_model_manager_lock = threading.Lock()
+
+
+def get_model_manager():
+    """Return the shared WhisperModelManager for this process"""
+    global _model_manager
+    with _model_manager_lock:
+        if _model_manager is None:
+            _model_manager = WhisperModelManager()
+        return _model_manager
@@ -0,0 +1,203 @@
+import os
+import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED, TimeoutError as FutureTimeout
+
+import psutil
+
+from ffmpeg_tools import SAMPLE_RATE
+from inference_worker import audio_job_params, load_job_audio
+
+# Per-process model handle, set up once by the pool initializer
+_worker_model = None
+
+# Target length of the chunks transcribe_parallel spreads across workers
+CHUNK_SECONDS = 120
+
+
+def auto_worker_count(model_memory_mb=1024):
+    """Pick a worker count from physical cores and available memory"""
+    physical_cores = psutil.cpu_count(logical=False) or psutil.cpu_count() or 1
+    available_mb = psutil.virtual_memory().available // (1024 * 1024)
+    by_cores = max(1, physical_cores // 2)
+    by_memory = max(1, int(available_mb // model_memory_mb))
+    return min(by_cores, by_memory)
+
+
+def split_at_silence(audio, target_chunk_seconds=120, min_silence_ms=500):
+    """Split audio into (start, end) sample ranges that are cut only inside VAD silences"""
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    total = len(audio)
+    target = int(target_chunk_seconds * SAMPLE_RATE)
+    if total <= target:
+        return [(0, total)]
+
+    speech = get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=min_silence_ms))
+    if not speech:
+        return []
+
+    chunks = []
+    chunk_start = 0
+    for previous, current in zip(speech, speech[1:]):
+        # Cut in the middle of the silence between two speech regions
+        if current["start"] - chunk_start >= target:
+            cut = (previous["end"] + current["start"]) // 2
+            chunks.append((chunk_start, cut))
+            chunk_start = cut
+    chunks.append((chunk_start, total))
+    return chunks
+
+
+def _lower_priority():
+    try:
+        process = psutil.Process()
+        if hasattr(psutil, "BELOW_NORMAL_PRIORITY_CLASS"):
+            process.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+        else:
+            process.nice(10)
+    except Exception as e:
+        logging.warning(f"Could not lower transcription worker priority: {e}")
+
+
+def _init_worker(model_path, compute_type, cpu_threads, low_priority=False):
+    global _worker_model
+    if low_priority:
+        _lower_priority()
+    from model_manager import get_model_manager
+    _worker_model = get_model_manager().get(model_path, compute_type=compute_type, cpu_threads=cpu_threads)
+
+
+def _start_pool(workers, model_path, compute_type, cpu_threads, low_priority=False):
+    # Spawned, not forked: a fork would copy the GUI process with Qt, mpv and any loaded models
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                               initializer=_init_worker, initargs=(model_path, compute_type, cpu_threads, low_priority))
+
+
+def _stop_pool(pool, abandon):
+    if abandon:
+        # A running chunk cannot check the cancel flag, so end the worker processes outright
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            try:
+                process.terminate()
+            except Exception:
+                pass
+        pool.shutdown(wait=False, cancel_futures=True)
+    else:
+        pool.shutdown(wait=True)
+
+
+def _wait_result(future, cancel_token):
+    while True:
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        try:
+            return future.result(timeout=0.5)
+        except FutureTimeout:
+            continue
+
+
+def _submit_chunk(pool, audio, start, end, lang_code, vad_filter):
+    # Cached audio goes by file path and sample range; the worker maps just that window
+    return pool.submit(_transcribe_chunk, audio_job_params(audio, start, end), lang_code, vad_filter)
+
+
+def _transcribe_chunk(audio_params, lang_code, vad_filter):
+    audio_chunk, offset_seconds = load_job_audio(audio_params)
+    segments, _ = _worker_model.transcribe(audio_chunk, language=lang_code, vad_filter=vad_filter)
+    return [{'start': offset_seconds + segment.start, 'end': offset_seconds + segment.end, 'text': segment.text.strip()}
+            for segment in segments]
+
+
+def transcribe_parallel(audio, chunks, model_path, lang_code, workers, compute_type="int8", vad_filter=True,
+                        on_segment=None, low_priority=False, cancel_token=None, total_threads=None):
+    """Transcribe (start, end) sample chunks across worker processes and return ordered segments
+
+    chunks are normally cut at silences by split_at_silence. on_segment, if given,
+    is called for each segment in timeline order as soon as all earlier chunks
+    have finished. low_priority runs the workers below normal
+    OS priority so background jobs yield the CPU to playback and foreground work.
+    total_threads is the decode thread budget split across workers (default: physical cores).
+    """
+    if not chunks:
+        return []
+    workers = max(1, min(workers, len(chunks)))
+    total_threads = total_threads or psutil.cpu_count(logical=False) or os.cpu_count() or 1
+    cpu_threads = max(1, total_threads // workers)
+    logging.info(f"Parallel transcription: {len(chunks)} chunks on {workers} processes x {cpu_threads} threads")
+
+    if low_priority:
+        cpu_threads = max(1, cpu_threads // 2)
+
+    pool = _start_pool(workers, model_path, compute_type, cpu_threads, low_priority)
+    abandon = True
+    try:
+        # Only a couple of chunks per worker are queued at a time, so pending work stays small
+        remaining = iter(chunks)
+        futures = deque()
+
+        def fill():
+            while len(futures) < workers * 2:
+                chunk = next(remaining, None)
+                if chunk is None:
+                    return
+                futures.append(_submit_chunk(pool, audio, chunk[0], chunk[1], lang_code, vad_filter))
+
+        fill()
+        segments = []
+        while futures:
+            chunk_segments = _wait_result(futures.popleft(), cancel_token)
+            fill()
+            segments.extend(chunk_segments)
+            if on_segment:
+                for segment in chunk_segments:
+                    on_segment(segment)
+        abandon = False
+    finally:
+        _stop_pool(pool, abandon)
+
+    return segments
+
+
+def transcribe_scheduled(audio, scheduler, model_path, lang_code, workers, compute_type="int8", vad_filter=True,
+                         on_chunk=None, cancel_token=None, total_threads=None):
+    """Transcribe the scheduler's windows across worker processes in playhead order
+
+    Windows are submitted one at a time as workers free up, so a seek changes
+    which window runs next. on_chunk(index, segments) is called as each finishes.
+    """
+    workers = max(1, min(workers, len(scheduler.chunks)))
+    total_threads = total_threads or psutil.cpu_count(logical=False) or os.cpu_count() or 1
+    cpu_threads = max(1, total_threads // workers)
+    logging.info(f"Playhead-first transcription: {len(scheduler.chunks)} windows on {workers} processes x {cpu_threads} threads")
+
+    def submit_next(pool, running):
+        index = scheduler.next_chunk()
+        if index is None:
+            return
+        start, end = scheduler.chunks[index]
+        running[_submit_chunk(pool, audio, start, end, lang_code, vad_filter)] = index
+
+    pool = _start_pool(workers, model_path, compute_type, cpu_threads)
+    abandon = True
+    try:
+        running = {}
+        for _ in range(workers):
+            submit_next(pool, running)
+        while running:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            finished, _ = wait(running, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index = running.pop(future)
+                segments = future.result()
+                scheduler.add_result(index, segments)
+                if on_chunk:
+                    on_chunk(index, segments)
+                submit_next(pool, running)
+        abandon = False
+    finally:
+        _stop_pool(pool, abandon)
+
+    return scheduler.merged_segments()
@@ -0,0 +1,3648 @@
+import sys
+import os
+import time
+import subprocess
+import logging
+from datetime import timedelta, datetime
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Thread
+from queue import Queue
+
+# Import settings manager
+from settings_manager import SettingsManager
+from ffmpeg_tools import get_tool_resolver, read_pcm_audio, SAMPLE_RATE
+from model_manager import estimate_model_memory_mb, has_memory_for, available_memory_mb
+from hardware_tuner import HardwareTuner, COMPUTE_TYPES, core_layout
+from parallel_transcriber import CHUNK_SECONDS, auto_worker_count, transcribe_parallel, transcribe_scheduled
+from transcription_scheduler import PlayheadScheduler, split_fixed
+from queue_prefetcher import QueuePrefetcher
+from subtitle_cache import SubtitleStore, media_fingerprint, known_fingerprint
+from audio_cache import AudioCache
+from subtitle_tracks import probe_subtitle_tracks, find_text_track, extract_subtitle_track, LoadedSubtitleTracks
+from subtitles import SrtStreamWriter, partial_path, load_cues, write_text_atomic
+from jobs import JobProgress, ProgressGroup, CancelToken, JobCancelled
+from inference_worker import InferenceWorker, audio_job_params
+from translation_memory import TranslationMemory, normalize_text
+from translation_planner import TranslationPlan
+from translation_pipeline import TranslationPipeline
+from translation_backends import revision_tag
+
+# Make sure these are installed:
+# pip install mpv-python PyQt6 PyQt6-Qtawesome faster-whisper onnxruntime easyNMT nltk
+# You also need to run this once to download the nltk data:
+# python -c "import nltk; nltk.download('punkt_tab')"
+
+# Import MPV after PATH configuration (main.configure_paths runs before this module is imported)
+try:
+    import mpv
+except Exception as e:
+    logging.error(f"Failed to import MPV: {e}")
+    logging.error(f"Current PATH: {os.environ.get('PATH', 'Not set')}")
+    raise
+
+from PyQt6.QtWidgets import (
+    QApplication,
+    QWidget,
+    QMainWindow,
+    QVBoxLayout,
+    QHBoxLayout,
+    QPushButton,
+    QLabel,
+    QComboBox,
+    QProgressBar,
+    QSizePolicy,
+    QSlider,
+    QGridLayout,
+    QMenu,
+    QGraphicsOpacityEffect,
+    QFileDialog,
+    QListWidget,
+    QAbstractItemView,
+    QListWidgetItem,
+    QDialog,
+    QCheckBox,
+    QScrollArea,
+    QFrame,
+    QSpinBox,
+)
+from PyQt6.QtCore import Qt, QSize, QTimer, QEvent, QPropertyAnimation, QEasingCurve, QParallelAnimationGroup, QRectF, QPointF, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QFont, QColor, QIcon, QWheelEvent, QPainter, QBrush, QPen, QKeyEvent, QAction
+import qtawesome as qta
+# Lazy imports for heavy libraries - imported only when needed
+# from faster_whisper import WhisperModel  # Import when needed
+# from easynmt import EasyNMT  # Import when needed
+
+# Defer heavy imports to speed up startup
+def lazy_import_huggingface():
+    try:
+        import os
+        # Disable progress bars that can hang in background threads
+        os.environ["HF_HUB_DISABLE_PROGRESS_BARS"] = "1"
+        from huggingface_hub import snapshot_download
+        return snapshot_download
+    except ImportError as e:
+        logging.error(f"Failed to import huggingface_hub: {e}")
+        return None
+
+class IntroWindow(QWidget):
+    finished = pyqtSignal()
+    
+    def __init__(self):
+        super().__init__()
+        self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
+        self.setWindowFlag(Qt.WindowType.Tool, False)  # Show in taskbar
+        self.setFixedSize(1280, 720)
+        self.center_on_screen()
+        if getattr(sys, 'frozen', False):
+            # Running as EXE - use bundled resource
+            icon_path = os.path.join(sys._MEIPASS, 'icon.ico')
+        else:
+            # Running as script
+            icon_path = 'icon.ico'
+        self.setWindowIcon(QIcon(icon_path))
+        
+        # Get intro video path
+        if getattr(sys, 'frozen', False):
+            intro_path = os.path.join(sys._MEIPASS, 'assets', 'intro.mp4')
+        else:
+            intro_path = os.path.join('assets', 'intro.mp4')
+            
+        # Create MPV player
+        self.mpv_player = mpv.MPV(wid=str(int(self.winId())), hr_seek='yes')
+        
+        # Auto-close timer
+        self.close_timer = QTimer()
+        self.close_timer.setSingleShot(True)
+        self.close_timer.timeout.connect(self.close_intro)
+        
+        # Play intro video
+        if os.path.exists(intro_path):
+            self.mpv_player.play(intro_path)
+            self.close_timer.start(5000)  # 4 seconds
+        else:
+            self.close_timer.start(100)  # Close immediately if no intro
+    
+    def center_on_screen(self):
+        screen = QApplication.primaryScreen().geometry()
+        x = (screen.width() - self.width()) // 2
+        y = (screen.height() - self.height()) // 2
+        self.move(x, y)
+    
+    def close_intro(self):
+        self.mpv_player.terminate()
+        self.finished.emit()
+        self.close()
+
+# Import tutorial window
+from tutorial_window import TutorialWindow
+
+# Language Download Dialog
+class LanguageDownloadDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Language Model Setup")
+        self.setFixedSize(730, 600)
+        self.setModal(True)
+        self.selected_languages = []
+        self.language_sizes = {
+            "English": "300MB",
+            "Spanish": "1.16GB",
+            "French": "1.10GB", 
+            "German": "1.6GB",
+            "Italian": "958MB",
+            "Japanese": "820MB",
+            "Russian": "1.38GB",
+            "Arabic": "1.38GB",
+            "Chinese": "620MB",
+            "Hindi": "587MB",
+            "Dutch": "1.43GB",
+            "Swedish": "1.31GB",
+            "Ukrainian": "585MB",
+            "Urdu": "870MB"
+        }
+        self.checkboxes = {}
+        self.setup_ui()
+        
+    def setup_ui(self):
+        self.setStyleSheet("""
+            QDialog {
+                background-color: #1e1e1e;
+                color: #f0f0f0;
+                font-family: Roboto;
+            }
+            QLabel {
+                color: #f0f0f0;
+            }
+            QCheckBox {
+                color: #f0f0f0;
+                spacing: 10px;
+            }
+            QCheckBox::indicator {
+                width: 18px;
+                height: 18px;
+                border: 2px solid #555;
+                border-radius: 3px;
+                background-color: #2a2a2a;
+            }
+            QCheckBox::indicator:checked {
+                background-color: #e50914;
+                border-color: #e50914;
+            }
+            QCheckBox::indicator:checked:hover {
+                background-color: #f61a27;
+            }
+            QPushButton {
+                background-color: #e50914;
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 10px 20px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #f61a27;
+            }
+            QPushButton:pressed {
+                background-color: #c00814;
+            }
+            QPushButton:disabled {
+                background-color: #555;
+                color: #999;
+            }
+        """)
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(20)
+        layout.setContentsMargins(30, 30, 30, 30)
+        
+        # Header
+        header_label = QLabel("Welcome to Zest Sync Player!")
+        header_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #e50914; margin-bottom: 10px; background-color:transparent")
+        layout.addWidget(header_label)
+        
+        # Description
+        desc_label = QLabel("Select the languages you want to download for subtitle generation. You can always download more languages later from the settings.")
+        desc_label.setWordWrap(True)
+        desc_label.setStyleSheet("font-size: 14px; color: #ccc; margin-bottom: 20px; background-color:transparent")
+        layout.addWidget(desc_label)
+        
+        # Scroll area for languages
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setStyleSheet("""
+            QScrollArea {
+                border: 1px solid #555;
+                border-radius: 8px;
+                background-color: #2a2a2a;
+            }
+            QScrollBar:vertical {
+                background-color: #333;
+                width: 12px;
+                border-radius: 6px;
+            }
+            QScrollBar::handle:vertical {
+                background-color: #e50914;
+                border-radius: 6px;
+                min-height: 20px;
+            }
+        """)
+        
+        scroll_widget = QWidget()
+        scroll_layout = QVBoxLayout(scroll_widget)
+        scroll_layout.setSpacing(8)
+        scroll_layout.setContentsMargins(15, 15, 15, 15)
+        
+        # Add English first (pre-selected)
+        english_cb = QCheckBox(f"English ({self.language_sizes['English']})")
+        english_cb.setChecked(True)
+        english_cb.setEnabled(False)  # English is required
+        english_cb.setStyleSheet("font-size: 14px; font-weight: bold;")
+        self.checkboxes["English"] = english_cb
+        scroll_layout.addWidget(english_cb)
+        
+        # Add separator
+        separator = QFrame()
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setStyleSheet("color: #555; margin: 10px 0;")
+        scroll_layout.addWidget(separator)
+        
+        # Add other languages
+        other_languages = [lang for lang in self.language_sizes.keys() if lang != "English"]
+        other_languages.sort()
+        
+        for language in other_languages:
+            size = self.language_sizes[language]
+            cb = QCheckBox(f"{language} ({size})")
+            cb.setStyleSheet("font-size: 14px;")
+            self.checkboxes[language] = cb
+            scroll_layout.addWidget(cb)
+        
+        scroll_area.setWidget(scroll_widget)
+        layout.addWidget(scroll_area)
+        
+        # Selection info
+        self.info_label = QLabel("Selected: English (300MB)")
+        self.info_label.setStyleSheet("font-size: 12px; color: #aaa; margin-top: 10px; background-color:transparent")
+        layout.addWidget(self.info_label)
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        
+        select_all_btn = QPushButton("Select All")
+        select_all_btn.clicked.connect(self.select_all)
+        select_all_btn.setStyleSheet("background-color: #555; min-width: 100px;")
+        
+        select_none_btn = QPushButton("Select None")
+        select_none_btn.clicked.connect(self.select_none)
+        select_none_btn.setStyleSheet("background-color: #555; min-width: 100px;")
+        
+        self.download_btn = QPushButton("Download Selected")
+        self.download_btn.clicked.connect(self.accept)
+        self.download_btn.setStyleSheet("min-width: 150px;")
+        
+        skip_btn = QPushButton("Skip for Now")
+        skip_btn.clicked.connect(self.reject)
+        skip_btn.setStyleSheet("background-color: #666; min-width: 120px;")
+        
+        button_layout.addWidget(select_all_btn)
+        button_layout.addWidget(select_none_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(skip_btn)
+        button_layout.addWidget(self.download_btn)
+        
+        layout.addLayout(button_layout)
+        
+        # Connect checkboxes to update info
+        for cb in self.checkboxes.values():
+            cb.toggled.connect(self.update_selection_info)
+        
+        self.update_selection_info()
+    
+    def select_all(self):
+        for cb in self.checkboxes.values():
+            if cb.isEnabled():
+                cb.setChecked(True)
+    
+    def select_none(self):
+        for lang, cb in self.checkboxes.items():
+            if lang != "English" and cb.isEnabled():
+                cb.setChecked(False)
+    
+    def update_selection_info(self):
+        selected = []
+        total_size_mb = 0
+        
+        for lang, cb in self.checkboxes.items():
+            if cb.isChecked():
+                selected.append(lang)
+                size_str = self.language_sizes[lang]
+                if "GB" in size_str:
+                    size_mb = float(size_str.replace("GB", "")) * 1024
+                else:
+                    size_mb = float(size_str.replace("MB", ""))
+                total_size_mb += size_mb
+        
+        if total_size_mb >= 1024:
+            total_size_str = f"{total_size_mb/1024:.1f}GB"
+        else:
+            total_size_str = f"{int(total_size_mb)}MB"
+        
+        self.info_label.setText(f"Selected: {len(selected)} languages ({total_size_str})")
+        self.selected_languages = selected
+        
+        # Enable/disable download button
+        self.download_btn.setEnabled(len(selected) > 0)
+
+# Pick several target languages for one multi-language translation run
+class MultiTranslateDialog(QDialog):
+    def __init__(self, languages, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Translate to Multiple Languages")
+        self.setModal(True)
+        self.setMinimumWidth(360)
+        self.checkboxes = {}
+        self.selected_codes = []
+        self.setStyleSheet("""
+            QDialog { background-color: #1e1e1e; color: #f0f0f0; font-family: Roboto; }
+            QLabel { color: #ccc; background-color: transparent; }
+            QCheckBox { color: #f0f0f0; spacing: 10px; font-size: 13px; }
+            QCheckBox::indicator { width: 16px; height: 16px; border: 2px solid #555; border-radius: 3px; background-color: #2a2a2a; }
+            QCheckBox::indicator:checked { background-color: #e50914; border-color: #e50914; }
+            QPushButton { background-color: #e50914; color: white; border: none; border-radius: 8px; padding: 8px 16px; font-weight: bold; }
+            QPushButton:hover { background-color: #f61a27; }
+            QPushButton:disabled { background-color: #555; color: #999; }
+        """)
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        layout.setContentsMargins(20, 20, 20, 20)
+        desc_label = QLabel("The English subtitles are read once and the selected languages are translated side by side.")
+        desc_label.setWordWrap(True)
+        layout.addWidget(desc_label)
+        
+        # languages: list of (name, code) with a downloaded model and no subtitle yet
+        for name, code in languages:
+            cb = QCheckBox(name)
+            cb.toggled.connect(self.update_selection)
+            self.checkboxes[code] = cb
+            layout.addWidget(cb)
+        
+        button_layout = QHBoxLayout()
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.setStyleSheet("background-color: #555;")
+        cancel_btn.clicked.connect(self.reject)
+        self.translate_btn = QPushButton("Translate")
+        self.translate_btn.clicked.connect(self.accept)
+        button_layout.addStretch()
+        button_layout.addWidget(cancel_btn)
+        button_layout.addWidget(self.translate_btn)
+        layout.addLayout(button_layout)
+        self.update_selection()
+    
+    def update_selection(self):
+        self.selected_codes = [code for code, cb in self.checkboxes.items() if cb.isChecked()]
+        self.translate_btn.setEnabled(len(self.selected_codes) > 0)
+
+# Custom toggle switch widget for a modern look
+class SwitchButton(QPushButton):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setCheckable(True)
+        self.setChecked(True)
+        # Responsive switch size based on screen width
+        screen = QApplication.primaryScreen().geometry()
+        switch_width = max(35, min(50, int(screen.width() / 30)))  # 35-50px range
+        switch_height = max(20, min(28, int(switch_width * 0.56)))  # Maintain aspect ratio
+        self.setFixedSize(switch_width, switch_height)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        bg_color = QColor("#e50914") if self.isChecked() else QColor("#555555")
+        handle_color = QColor("#f0f0f0")
+        
+        rect = QRectF(0, 0, self.width(), self.height())
+        painter.setBrush(QBrush(bg_color))
+        painter.setPen(Qt.PenStyle.NoPen)
+        # Responsive border radius
+        border_radius = min(self.height() / 2, 14)
+        painter.drawRoundedRect(rect, border_radius, border_radius)
+        
+        # Responsive handle size and position
+        handle_size = max(12, self.height() - 8)  # Handle size based on switch height
+        handle_margin = (self.height() - handle_size) / 2
+        handle_pos = self.width() - handle_size - handle_margin if self.isChecked() else handle_margin
+        handle_rect = QRectF(handle_pos, handle_margin, handle_size, handle_size)
+        painter.setBrush(QBrush(handle_color))
+        painter.drawEllipse(handle_rect)
+
+class ZestSyncPlayer(QMainWindow):
+    # This signal will safely carry subtitle text from the mpv thread to the main GUI thread
+    subtitle_updated = pyqtSignal(str)
+    # NEW SIGNAL for background process status
+    status_message = pyqtSignal(str)
+    # Signal for model downloads
+    model_download_finished = pyqtSignal(str, str)
+    model_download_started = pyqtSignal(str)
+    # Emitted by the queue prefetcher when an item's subtitle state changes
+    prefetch_updated = pyqtSignal(str)
+    # Emitted from the worker once hardware calibration has stored new values
+    tuning_updated = pyqtSignal()
+    # Emitted from the probe thread once a media file's subtitle tracks are known
+    subtitle_tracks_probed = pyqtSignal(str)
+
+    # Place this method and its helper method at the top of your ZestSyncPlayer class,
+# before the `__init__` method.
+
+    # Place these methods at the top of your ZestSyncPlayer class,
+# before the `__init__` method.
+
+    def _calculate_estimated_time(self, video_duration_seconds, lang_code="en"):
+        if video_duration_seconds <= 0:
+            return 0
+        
+        # Get current accuracy mode
+        accuracy_mode = self.settings_manager.get_accuracy_mode()
+        
+        # Prefer the speed measured on this machine over the reference factors below
+        measured_speed = self.settings_manager.get_measured_speed(self._get_speed_key(lang_code))
+        if measured_speed:
+            return video_duration_seconds * measured_speed
+        
+        # Base transcription time factors (seconds of processing per 10-minute video)
+        if lang_code == "en":  # English transcription
+            if accuracy_mode == "slow":
+                base_factor = 372  # 6.2 minutes for 24-minute video (slow/accurate)
+            else:
+                base_factor = 85   # 1.4 minutes for 10-minute video (fast)
+        else:
+            # Translation time factors (not affected by accuracy mode)
+            translation_factors = {
+                "nl": 77,    # Dutch
+                "fr": 72,    # French
+                "de": 80,    # German
+                "it": 120,   # Italian
+                "jap": 110,  # Japanese
+                "ru": 108,   # Russian
+                "es": 100,   # Spanish
+                "sv": 106,   # Swedish
+                "ur": 62,    # Urdu
+                "hi": 74,    # Hindi
+                "zh": 240,   # Chinese
+                "ar": 195,   # Arabic
+                "uk": 40     # Ukrainian
+            }
+            base_factor = translation_factors.get(lang_code, 85)
+        
+        # Calculate ratio based on test video length
+        test_video_length = 1500 if lang_code == "en" and accuracy_mode == "slow" else 614
+        ratio = base_factor / test_video_length
+        estimated_time = video_duration_seconds * ratio
+        return estimated_time
+    
+    def _get_speed_key(self, lang_code):
+        if lang_code == "en":
+            key = f"en_{self.settings_manager.get_accuracy_mode()}"
+            # Batched decoding runs at a very different speed, learn it separately
+            return f"{key}_batched" if self.settings_manager.get_inference_mode() == "batched" else key
+        return lang_code
+    
+    def _load_manual_srt(self):
+        if self.current_media_index == -1: return
+        file_path, _ = QFileDialog.getOpenFileName(self, "Open Subtitle File", "", "Subtitle Files (*.srt)")
+        if file_path:
+            try:
+                self.loaded_subtitle_tracks.load(file_path)
+                self._show_toast("Subtitle file loaded successfully")
+            except Exception as e:
+                logging.error(f"Error loading manual subtitle file: {e}")
+                self._show_toast("Error loading subtitle file")
+
+    def _delete_selected_media(self):
+        for item in self.media_list_widget.selectedItems():
+            self._delete_item(item)
+
+    def _delete_all_media(self):
+        self._cancel_generation("queue cleared")
+        self._cancel_prewarm()
+        if self.queue_prefetcher is not None:
+            self.queue_prefetcher.cancel_current()
+        self.media_list_widget.clear()
+        self.media_queue.clear()
+        self.mpv_player.command('stop')
+        self.video_label.setVisible(True)
+        self.status_bar_label.setText("Now Playing: None | Ready")
+        self.is_playing = False
+        self.play_pause_btn.setIcon(qta.icon("fa5s.play", color="#f0f0f0"))
+    
+    def _toggle_subtitles(self, checked):
+        self.subtitles_enabled = checked
+        self.subtitle_label.setVisible(checked and bool(self.subtitle_label.text()))
+        self.mpv_player.sub_visibility = checked
+        
+    def _show_media_context_menu(self, pos):
+        item = self.media_list_widget.itemAt(pos)
+        if not item:
+            return
+            
+        context_menu = QMenu(self)
+        delete_action = QAction(qta.icon("fa5s.trash-alt", color="#f0f0f0"), "Delete", self)
+        delete_action.triggered.connect(lambda: self._delete_item(item))
+        context_menu.addAction(delete_action)
+        context_menu.exec(self.media_list_widget.mapToGlobal(pos))
+        
+    def _delete_item(self, item):
+        row = self.media_list_widget.row(item)
+        self.media_list_widget.takeItem(row)
+        if 0 <= row < len(self.media_queue):
+            removed_path = self.media_queue.pop(row)
+            if removed_path == self.generation_media_path:
+                self._cancel_generation("media removed from queue")
+            if self.queue_prefetcher is not None and self.queue_prefetcher.current == removed_path:
+                self.queue_prefetcher.cancel_current()
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self):
+        """Point the background prefetcher at the items after the one playing"""
+        if not self.settings_manager.get_prefetch_queue():
+            if self.queue_prefetcher is not None:
+                self.queue_prefetcher.update_queue([])
+            return
+        if self.queue_prefetcher is None:
+            self.queue_prefetcher = QueuePrefetcher(self._prefetch_media, self._is_generation_running)
+        self.queue_prefetcher.update_queue(self.media_queue[self.current_media_index + 1:])
+
+    def _is_generation_running(self):
+        return self.generation_future is not None and not self.generation_future.done()
+
+    def _prewarm_models(self, media_path):
+        """Speculatively load the Whisper or translation model the next job for this media needs"""
+        if not self.settings_manager.get_speculative_prewarm():
+            return
+        if media_path not in self.embedded_subtitle_tracks:
+            return  # Called again from _on_subtitle_tracks_probed
+        target = None
+        if not os.path.exists(self._get_subtitle_path(media_path, "en")):
+            if self._find_probed_track(media_path, "en") is None:
+                config = self.hardware_tuner.get_config(self.settings_manager.get_accuracy_mode())
+                target = ("whisper", self._get_whisper_model_path(), config["compute_type"], config["cpu_threads"])
+        else:
+            lang_code = self.settings_manager.get_last_translation_language()
+            lang_name = self._get_language_name(lang_code) if lang_code else None
+            if (lang_code and self.download_status.get(lang_name, {}).get("status") == "downloaded"
+                    and not os.path.exists(self._get_subtitle_path(media_path, lang_code))):
+                target = ("opus-mt", lang_code)
+
+        if target == self.prewarm_target and self.prewarm_cancel_token is not None and not self.prewarm_cancel_token.cancelled:
+            return  # Same model is already being prepared
+        self._cancel_prewarm()
+        if target is None:
+            return
+        self.prewarm_target = target
+        self.prewarm_cancel_token = CancelToken()
+        if target[0] == "whisper":
+            Thread(target=self._prewarm_whisper, args=(target[1], target[2], target[3], self.prewarm_cancel_token),
+                   name="whisper-prewarm", daemon=True).start()
+        else:
+            # The model is loaded into the translation pool of the inference_worker subprocess; queued on the
+            # translation thread so it waits behind, instead of racing, a foreground translation
+            self.translation_executor.submit(self._prewarm_translation_model, target[1], self.prewarm_cancel_token)
+
+    def _cancel_prewarm(self):
+        if self.prewarm_cancel_token is not None:
+            self.prewarm_cancel_token.cancel()
+        self.prewarm_target = None
+        self.prewarm_cancel_token = None
+
+    def _prewarm_whisper(self, model_path, compute_type, cpu_threads, cancel_token):
+        needed_mb = estimate_model_memory_mb(model_path)
+        if not has_memory_for(needed_mb, self.settings_manager.get_prewarm_reserve_mb()):
+            logging.info(f"Skipping Whisper pre-warm, not enough free memory for ~{needed_mb}MB")
+            return
+        try:
+            # A no-op when the worker already holds the model; cancelling mid-load ends the worker and frees it
+            result = self.whisper_worker.run("load_whisper", {"model_path": model_path, "compute_type": compute_type,
+                                                              "cpu_threads": cpu_threads}, cancel_token=cancel_token)
+            logging.info(f"Pre-warmed Whisper model {model_path} in {result['load_time']:.1f}s")
+        except JobCancelled:
+            logging.info("Whisper pre-warm cancelled")
+        except Exception as e:
+            logging.error(f"Whisper pre-warm failed: {e}")
+
+    def _prewarm_translation_model(self, lang_code, cancel_token):
+        """Runs on the translation thread: load the opus-mt pair the user last translated to into the worker's pool"""
+        if cancel_token.cancelled:
+            return
+        hf_cache = os.path.join(os.environ.get('HF_HOME', ''), 'hub')
+        needed_mb = estimate_model_memory_mb(os.path.join(hf_cache, f"models--Helsinki-NLP--opus-mt-en-{lang_code}"))
+        if not has_memory_for(needed_mb, self.settings_manager.get_prewarm_reserve_mb()):
+            logging.info(f"Skipping translation pre-warm, not enough free memory for ~{needed_mb}MB")
+            return
+        try:
+            result = self.inference_worker.run("load_translation", {"target_lang": lang_code}, cancel_token=cancel_token)
+            logging.info(f"Pre-warmed {result['loaded']} ({result['backend']}) in {result['load_time']:.1f}s")
+        except JobCancelled:
+            pass
+        except Exception as e:
+            logging.error(f"Translation pre-warm failed: {e}")
+
+    def _cancel_generation(self, reason):
+        """Ask the running transcription/translation to stop at its next checkpoint"""
+        if not self._is_generation_running() or self.generation_cancel_token is None:
+            return
+        if not self.generation_cancel_token.cancelled:
+            logging.info(f"Cancelling subtitle generation for {self.generation_media_path}: {reason}")
+            self.generation_cancel_token.cancel()
+            # Queued but not yet started jobs can be dropped outright
+            self.generation_future.cancel()
+
+    def _get_prefetch_languages(self):
+        languages = self.settings_manager.get_prefetch_languages()
+        if not languages and self.settings_manager.get_last_translation_language():
+            languages = [self.settings_manager.get_last_translation_language()]
+        return [code for code in languages if code != "en"]
+
+    def _prefetch_media(self, media_path, cancel_token):
+        """Runs on the prefetch thread: English base file first, then the preferred translations"""
+        self.prefetch_updated.emit(media_path)
+        english_srt_path = self._get_subtitle_path(media_path, "en")
+        embedded_track = None if os.path.exists(english_srt_path) else self._get_embedded_track(media_path, "en")
+        if embedded_track is not None:
+            embedded_path = self.subtitle_store.path_for(media_fingerprint(media_path), "embedded", "en")
+            if self._extract_embedded_subtitles(media_path, embedded_track, embedded_path, cancel_token=cancel_token):
+                self._register_subtitle(media_path, "en", "embedded")
+                english_srt_path = embedded_path
+                self.prefetch_updated.emit(media_path)
+        if not os.path.exists(english_srt_path):
+            if not self._generate_subtitles_from_audio(media_path, "en", english_srt_path, background=True,
+                                                       cancel_token=cancel_token):
+                self.prefetch_updated.emit(media_path)
+                return
+            self._register_subtitle(media_path, "en")
+            self.prefetch_updated.emit(media_path)
+        
+        for lang_code in self._get_prefetch_languages():
+            if cancel_token.cancelled:
+                break
+            output_path = self._get_subtitle_path(media_path, lang_code)
+            lang_name = self._get_language_name(lang_code)
+            if os.path.exists(output_path) or self.download_status.get(lang_name, {}).get("status") != "downloaded":
+                continue
+            while self._is_generation_running():
+                time.sleep(2)
+            # Shares the translation thread so it never runs alongside a foreground translation
+            future = self.translation_executor.submit(self._translate_subtitles_from_english, english_srt_path, lang_code, output_path,
+                                                      None, cancel_token)
+            if future.result():
+                self._register_subtitle(media_path, lang_code)
+            self.prefetch_updated.emit(media_path)
+
+    @pyqtSlot(str)
+    def _update_queue_item_status(self, media_path):
+        """Show which subtitles are already prepared for a queue item"""
+        for i in range(self.media_list_widget.count()):
+            item = self.media_list_widget.item(i)
+            if item.data(Qt.ItemDataRole.UserRole) != media_path:
+                continue
+            ready = []
+            # Until the probe thread has fingerprinted the file its store entries are unknown
+            if known_fingerprint(media_path) is not None:
+                ready = [name for name, code in self.languages_list.items()
+                         if os.path.exists(self._get_subtitle_path(media_path, code))]
+            if self.queue_prefetcher is not None and self.queue_prefetcher.current == media_path:
+                item.setIcon(qta.icon("fa5s.spinner", color="#aaaaaa"))
+                item.setToolTip(f"{media_path}\nPreparing subtitles in background...")
+            elif ready:
+                item.setIcon(qta.icon("fa5s.closed-captioning", color="#e50914"))
+                item.setToolTip(f"{media_path}\nSubtitles ready: {', '.join(ready)}")
+            else:
+                item.setIcon(QIcon())
+                item.setToolTip(media_path)
+            break
+            
+    def _on_animation_finished(self):
+        if self.opacity_effect.opacity() == 0.0:
+            self.bottom_controls_container.setVisible(False)
+        
+    def _skip_forward(self):
+        if self.current_media_index != -1:
+            self.mpv_player.seek(10, reference='relative')
+
+    def _skip_backward(self):
+        if self.current_media_index != -1:
+            self.mpv_player.seek(-10, reference='relative')
+                
+    def _play_selected_media(self, item):
+        file_path = item.data(Qt.ItemDataRole.UserRole)
+        self.current_media_index = self.media_list_widget.row(item)
+        self._update_playing_item_style()
+        self._play_media(file_path)
+    
+    def _update_playing_item_style(self):
+        # Mark currently playing item with CSS property
+        for i in range(self.media_list_widget.count()):
+            item = self.media_list_widget.item(i)
+            if i == self.current_media_index:
+                item.setData(Qt.ItemDataRole.UserRole + 2, "true")  # Mark as playing
+                # Force style update
+                self.media_list_widget.setStyleSheet(self.media_list_widget.styleSheet())
+            else:
+                item.setData(Qt.ItemDataRole.UserRole + 2, "false")
+    
+    def _on_selection_changed(self):
+        # Update playing item color when selection changes
+        QTimer.singleShot(10, self._update_playing_item_style)  # Delay to let selection settle
+
+    def _play_media(self, file_path):
+        if file_path != self.generation_media_path:
+            # Subtitles for the previous media are no longer needed right now
+            self._cancel_generation("switched media")
+        self.video_label.setVisible(False)
+        self.loaded_subtitle_tracks.reset(file_path)
+        # The language and pre-warm decisions below wait for this when the file has no English subtitle yet
+        self.embedded_subtitle_tracks.pop(file_path, None)
+        self.probe_executor.submit(self._probe_subtitle_tracks, file_path)
+        self.mpv_player.play(file_path)
+        self.mpv_player.pause = False
+        self.is_playing = True
+        self.status_bar_label.setText(f"Now Playing: {os.path.basename(file_path)}")
+        self.play_pause_btn.setIcon(qta.icon("fa5s.pause", color="#f0f0f0"))
+        self.position_timer.start()
+        self._update_playing_item_style()
+
+        # Start loading whatever model this media will need while mpv opens it
+        self._prewarm_models(file_path)
+
+        # Force English selection when media loads
+        for i in range(self.language_selector_combo.count()):
+            if self.language_selector_combo.itemText(i) == "English":
+                self.language_selector_combo.setCurrentIndex(i)
+                break
+        self._on_language_changed("English")
+        self._schedule_prefetch()
+        # Place this method at the top of your ZestSyncPlayer class,
+        # before the `__init__` method.
+    def _change_volume(self, delta):
+        new_volume = max(0, min(100, self.current_volume + delta))
+        self._on_volume_changed(new_volume)
+        self.volume_slider.setValue(new_volume)
+
+    def _on_volume_changed(self, value):
+        self.current_volume = value
+        self.mpv_player.volume = value
+        self.volume_indicator.setText(f"Volume: {value}%")
+        self._update_volume_icon()
+        self._show_volume_indicator()
+
+    def _update_volume_icon(self):
+        if self.is_muted or self.current_volume == 0:
+            icon = "fa5s.volume-mute"
+        elif self.current_volume < 50:
+            icon = "fa5s.volume-down"
+        else:
+            icon = "fa5s.volume-up"
+        self.volume_btn.setIcon(QIcon(qta.icon(icon, color="#f0f0f0").pixmap(16, 16)))
+        
+    def _toggle_mute(self):
+        self.is_muted = not self.is_muted
+        self.mpv_player.mute = self.is_muted
+        self._update_volume_icon()
+        self._show_volume_indicator()
+            
+    def _show_volume_indicator(self):
+        self.volume_indicator.setText("Muted" if self.is_muted else f"Volume: {self.current_volume}%")
+        self.volume_indicator.setVisible(True)
+        self.volume_indicator_timer.start()
+
+    def _handle_volume_wheel(self, e: QWheelEvent):
+        self._change_volume(5 if e.angleDelta().y() > 0 else -5)
+        
+    def _toggle_play_pause(self):
+        if self.current_media_index == -1: return
+        try:
+            self.mpv_player.pause = not self.mpv_player.pause
+            self.is_playing = not self.is_playing
+            icon = "fa5s.play" if not self.is_playing else "fa5s.pause"
+            self.play_pause_btn.setIcon(qta.icon(icon, color="#f0f0f0"))
+            if self.is_playing: self.position_timer.start()
+            else: self.position_timer.stop()
+        except:
+            pass  # Ignore mpv errors when no media loaded
+
+    def _play_next_in_queue(self):
+        if self.current_media_index + 1 < self.media_list_widget.count():
+            self.current_media_index += 1
+            item = self.media_list_widget.item(self.current_media_index)
+            self.media_list_widget.setCurrentItem(item)
+            self._play_selected_media(item)
+        else:
+            self.is_playing = False
+            self.play_pause_btn.setIcon(qta.icon("fa5s.play", color="#f0f0f0"))
+
+    def _play_previous_in_queue(self):
+        if self.current_media_index > 0:
+            self.current_media_index -= 1
+            item = self.media_list_widget.item(self.current_media_index)
+            self.media_list_widget.setCurrentItem(item)
+            self._play_selected_media(item)
+
+    def _set_position(self, value):
+        if self.current_media_index != -1:
+            try:
+                self.mpv_player.time_pos = value
+            except:
+                pass  # Ignore mpv errors when no media loaded
+    
+    def _timeline_click(self, event):
+        if self.current_media_index != -1 and self.media_duration > 0:
+            click_pos = event.position().x()
+            slider_width = self.timeline_slider.width()
+            new_position = int((click_pos / slider_width) * self.media_duration)
+            self.timeline_slider.setValue(new_position)
+            self._set_position(new_position)
+        # Call original mousePressEvent to preserve drag functionality
+        QSlider.mousePressEvent(self.timeline_slider, event)
+    
+    def _timeline_hover(self, event):
+        if self.current_media_index != -1 and self.media_duration > 0:
+            hover_pos = event.position().x()
+            slider_width = self.timeline_slider.width()
+            hover_time = int((hover_pos / slider_width) * self.media_duration)
+            hover_time_str = self._format_time(hover_time)
+            self.timeline_slider.setToolTip(hover_time_str)
+
+    def _create_icon_button(self, icon, size=35, icon_size=16):
+        btn = QPushButton(); btn.setFixedSize(size, size); btn.setIcon(QIcon(qta.icon(icon, color="#f0f0f0").pixmap(icon_size, icon_size))); btn.setIconSize(QSize(icon_size, icon_size)); btn.setStyleSheet("QPushButton { background-color: transparent; border: none; border-radius: 5px; } QPushButton:hover { background-color: #333333; }"); return btn
+
+    def _populate_controls_bar(self):
+        rewind_btn = self._create_icon_button("fa5s.fast-backward"); rewind_btn.clicked.connect(self._play_previous_in_queue)
+        skip_backward_btn = self._create_icon_button("fa5s.undo"); skip_backward_btn.clicked.connect(self._skip_backward)
+        self.play_pause_btn = self._create_icon_button("fa5s.play", size=45, icon_size=20); self.play_pause_btn.clicked.connect(self._toggle_play_pause)
+        skip_forward_btn = self._create_icon_button("fa5s.redo"); skip_forward_btn.clicked.connect(self._skip_forward)
+        forward_btn = self._create_icon_button("fa5s.fast-forward"); forward_btn.clicked.connect(self._play_next_in_queue)
+        
+        volume_layout = QHBoxLayout(); volume_layout.setSpacing(5)
+        self.volume_btn = self._create_icon_button("fa5s.volume-up")
+        self.volume_slider = QSlider(Qt.Orientation.Horizontal); self.volume_slider.setRange(0, 100); self.volume_slider.setValue(self.current_volume)
+        self.volume_slider.setStyleSheet("QSlider::groove:horizontal { border: 1px solid #333; height: 5px; background: #333333; border-radius: 2px; } QSlider::sub-page:horizontal { background: #e50914; border-radius: 2px; } QSlider::handle:horizontal { background: #e50914; border: 1px solid #e50914; width: 12px; height: 12px; margin: -4px 0; border-radius: 6px; }")
+        self.volume_btn.clicked.connect(self._toggle_mute); self.volume_slider.valueChanged.connect(self._on_volume_changed);
+        volume_layout.addWidget(self.volume_btn); volume_layout.addWidget(self.volume_slider)
+        
+        speed_button = QPushButton("1x"); speed_button.setMinimumHeight(35)
+        speed_button.setStyleSheet("QPushButton { background-color: transparent; color: #f0f0f0; border: none; font-weight: bold; min-width: 40px; } QPushButton::menu-indicator { width: 0px; } QPushButton:hover { color: #e50914; }")
+        speed_menu = QMenu(); speed_menu.setStyleSheet("QMenu { background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #333333; border-radius: 8px; padding: 5px; font-size: 15px; min-width: 50px; } QMenu::item { background-color: transparent; padding: 8px 20px ; border-radius: 6px; } QMenu::item:selected { background-color: #333333; color: #e50914; }")
+        
+        for speed in ["0.5x", "1x", "1.5x", "2x", "2.5x"]:
+            action = speed_menu.addAction(speed)
+            action.triggered.connect(lambda checked, s=speed: self._set_speed(s, speed_button))
+            
+        def show_speed_menu():
+            pos = speed_button.mapToGlobal(QPointF(0, 0).toPoint())
+            menu_height = speed_menu.sizeHint().height()
+            speed_menu.move(pos.x(), pos.y() - menu_height)
+            speed_menu.show()
+        speed_button.clicked.connect(show_speed_menu)
+
+        self.fullscreen_btn = self._create_icon_button("fa5s.expand")
+        self.fullscreen_btn.clicked.connect(self._toggle_fullscreen)
+
+        self.controls_bar_layout.addWidget(rewind_btn); self.controls_bar_layout.addWidget(skip_backward_btn)
+        self.controls_bar_layout.addWidget(self.play_pause_btn); self.controls_bar_layout.addWidget(skip_forward_btn)
+        self.controls_bar_layout.addWidget(forward_btn); self.controls_bar_layout.addStretch()
+        self.controls_bar_layout.addWidget(speed_button); self.controls_bar_layout.addLayout(volume_layout)
+        self.controls_bar_layout.addWidget(self.fullscreen_btn)
+        
+    def _show_controls(self): 
+        self.controls_animation_group.stop()
+        self.bottom_controls_container.setVisible(True)
+        self.fade_animation.setDuration(400); self.fade_animation.setStartValue(self.opacity_effect.opacity()); self.fade_animation.setEndValue(1.0)
+        self.slide_animation.setDuration(300); self.slide_animation.setStartValue(self.bottom_controls_container.height()); self.slide_animation.setEndValue(90)
+        self.slide_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.controls_animation_group.start()
+
+    def _hide_controls(self): 
+        self.controls_animation_group.stop()
+        self.fade_animation.setDuration(300); self.fade_animation.setStartValue(self.opacity_effect.opacity()); self.fade_animation.setEndValue(0.0)
+        self.slide_animation.setDuration(400); self.slide_animation.setStartValue(self.bottom_controls_container.height()); self.slide_animation.setEndValue(0)
+        self.slide_animation.setEasingCurve(QEasingCurve.Type.InCubic)
+        self.controls_animation_group.start()
+    
+    def _update_position(self):
+        if self.is_playing and self.media_duration > 0 and self.media_position >= self.media_duration -1:
+            self.position_timer.stop(); self._play_next_in_queue()
+         
+    def _open_sidebar(self):
+        if self.is_sidebar_open:
+            return
+        self.is_sidebar_open = True
+        self.sidebar_animation_group.stop()
+        self.sidebar_min_width_anim.setStartValue(0)
+        self.sidebar_min_width_anim.setEndValue(300)
+        self.sidebar_max_width_anim.setStartValue(0)
+        self.sidebar_max_width_anim.setEndValue(300)
+        self.sidebar_animation_group.start()
+        self.sidebar_toggle_btn.setIcon(qta.icon("fa5s.chevron-right", color="#f0f0f0"))
+        self.sidebar_idle_timer.start()
+
+    def _close_sidebar(self):
+        if not self.is_sidebar_open:
+            return
+        self.is_sidebar_open = False
+        self.sidebar_animation_group.stop()
+        self.sidebar_min_width_anim.setStartValue(300)
+        self.sidebar_min_width_anim.setEndValue(0)
+        self.sidebar_max_width_anim.setStartValue(300)
+        self.sidebar_max_width_anim.setEndValue(0)
+        self.sidebar_animation_group.start()
+        self.sidebar_toggle_btn.setIcon(qta.icon("fa5s.chevron-left", color="#f0f0f0"))
+        self.sidebar_idle_timer.stop()
+
+    def _set_model_cache_path(self):
+        # Use AppData Local for permanent solution - no admin rights needed
+        cache_dir = os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'Zest Sync', 'cache', 'models')
+        os.makedirs(cache_dir, exist_ok=True)
+        
+        os.environ['HF_HOME'] = cache_dir
+        os.environ['HF_HUB_DISABLE_SYMLINKS'] = '1'
+        os.environ['HF_HUB_DISABLE_SYMLINKS_WARNING'] = '1'
+        logging.info(f"Using model cache directory: {cache_dir}")
+
+
+    def __init__(self):
+        super().__init__()
+        self._set_model_cache_path()
+        if getattr(sys, 'frozen', False):
+            # Running as EXE - use bundled resource
+            icon_path = os.path.join(sys._MEIPASS, 'icon.ico')
+        else:
+            # Running as script
+            icon_path = 'icon.ico'
+        self.setWindowIcon(QIcon(icon_path))
+        self.setWindowTitle("Zest Sync")
+        
+        # Use default window frame
+        # Removed custom frameless window
+        
+        # Get screen dimensions and set responsive minimum size
+        from PyQt6.QtWidgets import QApplication
+        screen = QApplication.primaryScreen().geometry()
+        min_width = min(1280, int(screen.width() * 0.7))
+        min_height = min(768, int(screen.height() * 0.7))
+        self.setMinimumSize(min_width, min_height)
+        
+        # Check if this is first run (after window is shown)
+        self.first_run_file = os.path.join(os.path.expanduser("~"), ".zestsync_first_run")
+        self.is_first_run = not os.path.exists(self.first_run_file)
+        
+        # Initialize settings manager
+        self.settings_manager = SettingsManager()
+        
+        # Initialize last used path for imports
+        self.settings_file = os.path.join(os.path.expanduser("~"), ".zestsync_settings")
+        self.last_import_path = self._load_last_import_path()
+
+
+        # --- STATE MANAGEMENT ---
+        self.is_playing = False
+        self.is_sidebar_open = True
+        self.current_volume = 75
+        self.is_muted = False
+        self.volume_before_mute = 75
+        self.subtitles_enabled = True 
+        self.media_queue = [] 
+        self.current_media_index = -1 
+        self.media_position = 0
+        self.media_duration = 0
+        self.is_fullscreen = False
+        self.subtitle_font_size = 24
+        self.subtitle_color = "#ffffff"
+        self.subtitle_stroke = False
+        self.last_mouse_pos = QPointF()
+
+
+        # NEW: Background thread executors
+        self.subtitle_executor = ThreadPoolExecutor(max_workers=1)
+        self.download_executor = ThreadPoolExecutor(max_workers=1)
+        self.translation_executor = ThreadPoolExecutor(max_workers=1)  # Separate thread for translation
+        # Finished subtitles go to mpv from memory; writing and indexing them happens here afterwards
+        self.subtitle_write_executor = ThreadPoolExecutor(max_workers=1)
+        # ffprobe of a newly opened file runs here, never on the GUI thread
+        self.probe_executor = ThreadPoolExecutor(max_workers=1)
+        self.embedded_subtitle_tracks = {}  # media path -> subtitle tracks found by the last probe
+        self.pending_subtitle_writes = {}  # path -> SRT text not yet on disk
+        self.generation_future = None
+        self.generation_progress_timer = QTimer(self)
+        self.generation_progress_timer.setInterval(500) # Update every 500ms
+        self.generation_progress_timer.timeout.connect(self._update_progress_bar)
+        self.generation_start_time = 0
+        self.estimated_total_time = 0
+        self.generation_progress = JobProgress()
+        self.generation_output_path = None
+        self.generation_media_duration = 0
+        self.generation_speed_key = None
+        self.generation_media_path = None
+        self.generation_lang_code = None
+        # Playhead-first ordering for English transcription, fed from time-pos updates
+        self.generation_scheduler = None
+        self.playhead_window_seconds = 60
+        # Set when the user moves on, checked by the worker between segments and batches
+        self.generation_cancel_token = None
+        self.generation_variant = None
+        # (media, language) pairs whose embedded subtitle track could not be extracted
+        self.failed_embedded_tracks = set()
+        # Growing .partial.srt that mpv re-reads while English subtitles are generated
+        self.subtitle_reload_timer = QTimer(self)
+        self.subtitle_reload_timer.setInterval(5000)
+        self.subtitle_reload_timer.timeout.connect(self._reload_partial_subtitles)
+        self.partial_subtitle_path = None
+        self.partial_subtitle_track = None
+        self.partial_subtitle_size = 0
+        self.download_lock = Lock()
+        self.download_status = {} # Stores the download state of each model
+        self.languages_list = self._get_language_map()
+        
+        self.model_download_started.connect(self._handle_model_download_started)
+        self.model_download_finished.connect(self._handle_model_download_finished)
+        self.prefetch_updated.connect(self._update_queue_item_status)
+        self.tuning_updated.connect(self._refresh_tuning_controls)
+        self.subtitle_tracks_probed.connect(self._on_subtitle_tracks_probed)
+        
+        # Opt-in background preparation of subtitles for upcoming queue items
+        self.queue_prefetcher = None
+        
+        # ffmpeg/ffprobe are located once (and remembered across launches) instead of per job
+        self.tool_resolver = get_tool_resolver(self._get_app_base_path())
+        self.tool_resolver.warm_up()
+        
+        # Generated subtitles live in a central store keyed by media content, not file name
+        self.subtitle_store = SubtitleStore(
+            os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'Zest Sync', 'cache', 'subtitles'),
+            max_bytes=self.settings_manager.get_subtitle_cache_max_mb() * 1024 * 1024,
+            mirror_sidecar=self.settings_manager.get_mirror_sidecar_subtitles(),
+        )
+        
+        # Decoded audio is kept on disk so retries and accuracy switches skip ffmpeg
+        self.audio_cache = AudioCache(
+            os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'Zest Sync', 'cache', 'audio'),
+            max_bytes=self.settings_manager.get_audio_cache_max_mb() * 1024 * 1024,
+        )
+        
+        # Whisper runs in its own worker process, which keeps the model loaded across jobs and unloads it after sitting idle
+        self.whisper_worker = InferenceWorker(
+            # Playhead-first transcription sends one job per window, so only memory decides when to recycle
+            max_jobs=None,
+            max_rss_mb=self.settings_manager.get_inference_worker_max_rss_mb(),
+            config={"whisper_idle_timeout": self.settings_manager.get_model_idle_timeout()},
+        )
+        # Per-machine cpu_threads/compute_type, calibrated on first transcription
+        self.hardware_tuner = HardwareTuner(self.settings_manager, self.whisper_worker)
+        # Speculative model loading started when media opens, so Generate does not wait on it
+        self.prewarm_target = None
+        self.prewarm_cancel_token = None
+        
+        # Lines translated before (series intros, credits, catchphrases) are reused instead of re-translated
+        self.translation_memory = TranslationMemory(
+            os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'Zest Sync', 'cache', 'translation_memory.sqlite')
+        )
+        # Backend each language was last translated with; part of the translation memory revision
+        self.translation_backends_used = {}
+        
+        # Translation runs in a recycled subprocess so model memory never stays in the player
+        self.inference_worker = InferenceWorker(
+            max_jobs=self.settings_manager.get_inference_worker_max_jobs(),
+            max_rss_mb=self.settings_manager.get_inference_worker_max_rss_mb(),
+            config={
+                "translation_pool_size": self.settings_manager.get_translation_pool_size(),
+                "translation_pool_reserve_mb": self.settings_manager.get_translation_pool_reserve_mb(),
+                "translation_backend": self.settings_manager.get_translation_backend(),
+            },
+        )
+        # Pipelined translation sends one small job per batch of cues, so like Whisper only memory decides
+        # when to recycle; it keeps its model between files and leaves most cores to Whisper
+        self.pipeline_worker = InferenceWorker(
+            max_jobs=None,
+            max_rss_mb=self.settings_manager.get_inference_worker_max_rss_mb(),
+            config={
+                "translation_pool_size": 1,
+                "translation_pool_reserve_mb": self.settings_manager.get_translation_pool_reserve_mb(),
+                "translation_backend": self.settings_manager.get_translation_backend(),
+                "torch_threads": max(1, core_layout()[0] // 4),
+            },
+        )
+        
+        # Timer to update UI during downloads
+        self.ui_update_timer = QTimer(self)
+        self.ui_update_timer.timeout.connect(self._update_language_list_ui)
+        self.ui_update_timer.setInterval(5000)  # Update every 5 seconds
+
+        # --- TIMERS ---
+        self.mouse_idle_timer = QTimer(self)
+        self.mouse_idle_timer.setSingleShot(True)
+        self.mouse_idle_timer.timeout.connect(self._hide_controls)
+        self.mouse_idle_timer.setInterval(3000)
+
+ 
+        
+        self.position_timer = QTimer(self)
+        self.position_timer.setInterval(1000)
+        self.position_timer.timeout.connect(self._update_position)
+        
+        # --- Core UI Setup ---
+        self.setStyleSheet(
+            "background-color: #121212; color: #f0f0f0; font-family: Roboto;"
+        )
+
+        self.central_widget = QWidget()
+        self.setCentralWidget(self.central_widget)
+        self.window_layout = QVBoxLayout(self.central_widget)
+        self.window_layout.setContentsMargins(0, 0, 0, 0)
+        self.window_layout.setSpacing(0)
+        
+
+        
+        # Main content area
+        self.content_widget = QWidget()
+        self.main_layout = QHBoxLayout(self.content_widget)
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_layout.setSpacing(0)
+        self.window_layout.addWidget(self.content_widget)
+
+        # --- Video Panel Section ---
+        self.video_panel = QWidget()
+        self.video_panel_layout = QVBoxLayout(self.video_panel)
+        self.video_panel_layout.setContentsMargins(0, 0, 0, 0)
+        self.video_panel_layout.setSpacing(0)
+
+        self.video_container = QWidget()
+        self.video_container.setStyleSheet("background-color: black;")
+        self.video_container.setSizePolicy(
+            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
+        )
+        self.video_container.setMouseTracking(True)
+        self.video_container.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.video_container.installEventFilter(self)
+        
+        # --- CRITICAL FIX: MPV Player MUST be initialized BEFORE any buttons that call it.
+        # This resolves the `AttributeError: 'ZestSyncPlayer' object has no attribute 'mpv_player'`
+        self.mpv_player = mpv.MPV(
+            wid=str(int(self.video_container.winId())),
+            hr_seek='yes', ytdl=True
+        )
+        # Suppress cover type warnings
+        self.mpv_player.msg_level = 'all=error'
+        self.mpv_player.sub_font_size = self.subtitle_font_size
+        self.mpv_player.sub_color = self.subtitle_color
+        # Remove black stroke/outline from subtitles by default
+        self.mpv_player.sub_border_size = 0 if not self.subtitle_stroke else 2
+        self.mpv_player.sub_shadow_offset = 0 if not self.subtitle_stroke else 1
+        self.mpv_player.observe_property('time-pos', self._on_time_update)
+        self.mpv_player.observe_property('duration', self._on_duration_update)
+        self.mpv_player.observe_property('sub-text', self._on_subtitle_update)
+        # Subtitle tracks added for the current media, so re-selecting a language reuses its track
+        self.loaded_subtitle_tracks = LoadedSubtitleTracks(self.mpv_player, self._subtitle_available)
+
+        self.video_layout = QGridLayout(self.video_container)
+        self.video_layout.setContentsMargins(0, 0, 0, 0)
+        self.video_layout.setSpacing(0)
+        
+        self.video_label = QLabel("Import media using the '+' button in the sidebar")
+        self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.video_label.setStyleSheet("color: #aaaaaa; font-size: 24px;")
+        
+        self.status_bar_label = QLabel("Now Playing: None | Ready")
+        self.status_bar_label.setStyleSheet(
+            "color: rgba(255,255,255,0.6); background-color: rgba(0, 0, 0, 0.5); padding: 10px; font-size: 11px;"
+        )
+
+        self.toast_label = QLabel("Subtitles Ready! ✅")
+        self.toast_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.toast_label.setStyleSheet(
+            "background-color: #1e1e1e; color: #f0f0f0; border-radius: 5px; padding: 10px; border: 1px solid #333333;"
+        )
+        self.toast_label.setVisible(False)
+
+        self.volume_indicator = QLabel("Volume: 75%")
+        self.volume_indicator.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.volume_indicator.setStyleSheet(
+            "background-color: transparent; color: white; border: none; padding: 15px 25px; font-size: 24px; font-weight: bold; text-shadow: 2px 2px 4px rgba(0,0,0,0.8);"
+        )
+        self.volume_indicator.setVisible(False)
+
+        self.volume_indicator_timer = QTimer(self)
+        self.volume_indicator_timer.setSingleShot(True)
+        self.volume_indicator_timer.timeout.connect(lambda: self.volume_indicator.setVisible(False))
+        self.volume_indicator_timer.setInterval(1500)
+
+        self.video_layout.addWidget(self.video_label, 0, 0, 3, 3)
+
+        self.controls_bar = QWidget()
+        self.controls_bar.setStyleSheet("background-color: transparent;")
+        self.controls_bar_layout = QHBoxLayout(self.controls_bar)
+        self.controls_bar_layout.setSpacing(10)
+        self.controls_bar_layout.setContentsMargins(20, 5, 20, 10)
+        
+        self._populate_controls_bar()
+
+        self.bottom_controls_container = QWidget()
+        self.bottom_controls_container.setStyleSheet("background-color: #181818;")
+        self.bottom_controls_container.setMinimumHeight(90)
+        self.bottom_controls_container.setMaximumHeight(90)
+        self.bottom_controls_container.setVisible(False)
+        self.bottom_controls_container.installEventFilter(self)
+
+        self.controls_animation_group = QParallelAnimationGroup(self)
+        self.opacity_effect = QGraphicsOpacityEffect(self.bottom_controls_container)
+        self.bottom_controls_container.setGraphicsEffect(self.opacity_effect)
+        
+        self.fade_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
+        self.slide_animation = QPropertyAnimation(self.bottom_controls_container, b"maximumHeight")
+
+        self.controls_animation_group.addAnimation(self.fade_animation)
+        self.controls_animation_group.addAnimation(self.slide_animation)
+        self.controls_animation_group.finished.connect(self._on_animation_finished)
+
+        bottom_container_layout = QVBoxLayout(self.bottom_controls_container)
+        bottom_container_layout.setContentsMargins(0, 5, 0, 0)
+        bottom_container_layout.setSpacing(5)
+
+        self.timeline_container = QWidget()
+        timeline_layout = QHBoxLayout(self.timeline_container)
+        timeline_layout.setContentsMargins(10, 0, 10, 0)
+        timeline_layout.setSpacing(10)
+
+        self.current_time_label = QLabel("00:00")
+        self.timeline_slider = QSlider(Qt.Orientation.Horizontal)
+        self.timeline_slider.setStyleSheet("QSlider::groove:horizontal { border: 1px solid #444; height: 5px; background: #444; border-radius: 2px; } QSlider::sub-page:horizontal { background: #e50914; border-radius: 2px; } QSlider::handle:horizontal { background: #e50914; border: 1px solid #e50914; width: 14px; height: 14px; margin: -5px 0; border-radius: 7px; }")
+        self.timeline_slider.sliderMoved.connect(self._set_position)
+        self.timeline_slider.sliderPressed.connect(self.position_timer.stop)
+        self.timeline_slider.sliderReleased.connect(self.position_timer.start)
+        self.timeline_slider.mousePressEvent = self._timeline_click
+        self.timeline_slider.setMouseTracking(True)
+        self.timeline_slider.mouseMoveEvent = self._timeline_hover
+
+        self.total_duration_label = QLabel("00:00")
+        
+        timeline_layout.addWidget(self.current_time_label)
+        timeline_layout.addWidget(self.timeline_slider)
+        timeline_layout.addWidget(self.total_duration_label)
+
+        bottom_container_layout.addWidget(self.timeline_container)
+        bottom_container_layout.addWidget(self.controls_bar, 0, Qt.AlignmentFlag.AlignHCenter)
+
+        self.overlay_container = QWidget()
+        self.overlay_container.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.overlay_container.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+
+        overlay_layout = QVBoxLayout(self.overlay_container)
+        overlay_layout.setContentsMargins(10, 10, 10, 20)
+        overlay_layout.setSpacing(10)
+        overlay_layout.addStretch(1)
+
+        self.subtitle_label = QLabel("")
+        self.subtitle_label.setStyleSheet(
+            f"font-size: {self.subtitle_font_size}px; "
+            "background-color: rgba(0, 0, 0, 0.5); color: white; padding: 5px 10px; border-radius: 5px;"
+        )
+        overlay_layout.addWidget(self.subtitle_label, 0, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom)
+        overlay_layout.addSpacing(20)
+
+        self.video_layout.addWidget(self.overlay_container, 0, 0, 3, 3)
+        self.video_layout.addWidget(self.status_bar_label, 0, 0, 1, 3, Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignCenter)
+        self.video_layout.addWidget(self.toast_label, 2, 2, 1, 1, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight)
+        self.video_layout.addWidget(self.volume_indicator, 1, 1, 1, 1, Qt.AlignmentFlag.AlignCenter)
+        self.overlay_container.raise_()
+        
+        self.video_panel_layout.addWidget(self.video_container)
+        self.video_panel_layout.addWidget(self.bottom_controls_container)
+        self.main_layout.addWidget(self.video_panel, 1)
+
+        # --- NEW SIDEBAR ANIMATION LOGIC ---
+        self.sidebar = QWidget()
+        # Responsive sidebar width based on screen size
+        screen = QApplication.primaryScreen().geometry()
+        sidebar_width = max(250, min(350, int(screen.width() * 0.22)))
+        self.sidebar.setFixedWidth(sidebar_width)
+        self.sidebar.setStyleSheet("background-color: #1e1e1e;")
+        self.sidebar_layout = QVBoxLayout(self.sidebar)
+        self._populate_sidebar()
+
+        self.sidebar_handle = QWidget()
+        self.sidebar_handle.setFixedWidth(25)
+        self.sidebar_handle.setStyleSheet("""background-color: #121212; """)
+        self.sidebar_handle.setCursor(Qt.CursorShape.PointingHandCursor)
+        handle_layout = QVBoxLayout(self.sidebar_handle)
+        handle_layout.setContentsMargins(0, 10, 0, 0)
+        
+        handle_layout.addStretch()
+
+        self.sidebar_toggle_btn = self._create_icon_button("fa5s.chevron-right", size=25, icon_size=20)
+        self.sidebar_toggle_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #121212; 
+                border: none;
+                padding: 5px;
+                border-radius:3px;
+                
+            }
+            QPushButton:hover {
+                background-color: black;
+            }
+        """)
+        self.sidebar_toggle_btn.clicked.connect(self._toggle_sidebar)
+        handle_layout.addWidget(self.sidebar_toggle_btn)
+        self.sidebar_toggle_btn.installEventFilter(self)
+        
+        self._setup_button_animations()
+        
+        handle_layout.addStretch()
+
+        self.sidebar.installEventFilter(self)
+        self.sidebar_handle.installEventFilter(self)
+
+
+
+        self.main_layout.addWidget(self.sidebar_handle)
+        self.main_layout.addWidget(self.sidebar)
+        # --- END OF NEW LOGIC ---
+        
+        # Connect signals after UI is ready
+        QTimer.singleShot(50, self._connect_signals)
+    
+    def _connect_signals(self):
+        """Connect signals after UI initialization"""
+        self.subtitle_updated.connect(self._update_subtitle_label)
+        self.status_message.connect(self._update_status_bar)
+
+        # Delay initial model status check
+        QTimer.singleShot(200, self._update_language_list_ui)
+    
+    def show_tutorial_window(self):
+        """Show the tutorial window on first run"""
+        tutorial = TutorialWindow(self)
+        tutorial.center_on_screen()
+        tutorial.finished.connect(lambda: QTimer.singleShot(500, self.show_language_download_dialog))
+        tutorial.show()
+    
+    def show_language_download_dialog(self):
+        """Show the language download dialog on first run"""
+        dialog = LanguageDownloadDialog(self)
+        result = dialog.exec()
+        
+        if result == QDialog.DialogCode.Accepted:
+            # User clicked "Download Selected"
+            selected_languages = dialog.selected_languages
+            QTimer.singleShot(1000, lambda: self.start_initial_downloads(selected_languages))
+        
+        # Mark first run as complete
+        try:
+            with open(self.first_run_file, 'w') as f:
+                f.write("first_run_complete")
+        except Exception as e:
+            logging.error(f"Could not create first run file: {e}")
+    
+    def start_initial_downloads(self, languages):
+        """Start downloading selected languages in background"""
+        if not languages:
+            return
+            
+        # Show toast notification
+        lang_count = len([l for l in languages if l != "English"])
+        if lang_count > 0:
+            logging.info(f"Starting download of {lang_count} language models...")
+        
+        # Start downloads for non-English languages
+        for language in languages:
+            if language != "English":  # English doesn't need download
+                lang_code = self._get_language_code(language)
+                logging.info(f"Starting download for {language} ({lang_code})")
+                future = self.download_executor.submit(self._download_model_in_background, lang_code)
+
+
+    def _setup_button_animations(self):
+        # Animation for when the mouse enters the button
+        self.btn_grow_anim = QPropertyAnimation(self.sidebar_toggle_btn, b"size")
+        self.btn_grow_anim.setDuration(150) # Duration in milliseconds for the animation
+        self.btn_grow_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+
+        # Animation for when the mouse leaves the button
+        self.btn_shrink_anim = QPropertyAnimation(self.sidebar_toggle_btn, b"size")
+        self.btn_shrink_anim.setDuration(150)
+        self.btn_shrink_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+        
+    def _is_video_area_child(self, obj):
+        """Check if the object is a child of the video area"""
+        parent = obj
+        while parent:
+            if parent == self.video_container:
+                return True
+            parent = parent.parent()
+        return False
+    
+    def _is_mouse_over_sidebar_children(self):
+        """Check if mouse is over sidebar or any of its child widgets/dialogs"""
+        app = QApplication.instance()
+        widget_under_mouse = app.widgetAt(app.primaryScreen().availableGeometry().topLeft() + app.primaryScreen().availableGeometry().center())
+        if not widget_under_mouse:
+            return False
+        
+        # Check if widget is part of sidebar hierarchy
+        parent = widget_under_mouse
+        while parent:
+            if parent == self.sidebar or parent == self.sidebar_handle:
+                return True
+            # Check for file dialogs and combo box popups
+            if isinstance(parent, (QFileDialog, QMenu)):
+                return True
+            parent = parent.parent()
+        return False
+    
+    def _set_speed(self, speed_text, button):
+        """Set playback speed"""
+        speed_value = float(speed_text.replace('x', ''))
+        self.mpv_player.speed = speed_value
+        button.setText(speed_text)
+
+    def _format_time(self, seconds):
+        """Format seconds into HH:MM:SS format"""
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        seconds = seconds % 60
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    
+    def _on_time_update(self, name, value):
+        if value is not None and self.generation_scheduler is not None:
+            self.generation_scheduler.set_playhead(value)
+        if value is not None and not self.timeline_slider.isSliderDown():
+            self.media_position = int(value)
+            self.timeline_slider.setValue(int(value))
+            self.current_time_label.setText(self._format_time(int(value)))
+
+    def _on_duration_update(self, name, value):
+        if value is not None:
+            self.media_duration = int(value)
+            self.timeline_slider.setRange(0, int(value))
+            self.total_duration_label.setText(self._format_time(int(value)))
+
+    @pyqtSlot(str)
+    def _update_subtitle_label(self, text):
+        """This method is a slot that safely updates the subtitle label from the main GUI thread."""
+        if text and self.subtitles_enabled:
+            self.subtitle_label.setText(text)
+            self.subtitle_label.setVisible(True)
+        else:
+            self.subtitle_label.setVisible(False)
+            
+    def _on_subtitle_update(self, name, value):
+        """
+        This method is called from the mpv background thread.
+        It must NOT interact with the GUI directly.
+        Instead, it emits a signal to be handled by the main thread.
+        """
+        try:
+            if hasattr(self, 'subtitle_updated'):
+                text = value if value is not None else ""
+                self.subtitle_updated.emit(text)
+        except RuntimeError:
+            # Object has been deleted, ignore
+            pass
+
+    def _create_setting_box(self, title):
+        box = QWidget()
+        box.setStyleSheet("""
+            QWidget {
+                background-color: #2a2a2a;
+                border-radius: 8px;
+            }
+        """)
+        # Responsive margins and spacing
+        screen = QApplication.primaryScreen().geometry()
+        margin = max(8, int(screen.width() / 160))  # 8-12px based on screen
+        spacing = max(6, int(screen.height() / 140))  # 6-10px based on screen
+        
+        box_layout = QVBoxLayout(box)
+        box_layout.setContentsMargins(margin, margin, margin, margin)
+        box_layout.setSpacing(spacing)
+
+        if title:
+            title_label = QLabel(title)
+            font_size = max(9, int(screen.width() / 180))  # 9-11px based on screen
+            title_label.setFont(QFont("Roboto", font_size, QFont.Weight.Bold))
+            title_label.setStyleSheet("background-color: transparent; border: none;")
+            box_layout.addWidget(title_label)
+        
+        return box, box_layout
+
+    def _get_language_map(self):
+        return {
+            "English": "en", "Spanish": "es", "French": "fr", "German": "de",
+            "Italian": "it", "Japanese": "jap", "Russian": "ru",
+            "Arabic": "ar", "Chinese": "zh", "Hindi": "hi",
+            "Dutch": "nl", "Swedish": "sv", "Ukrainian": "uk", "Urdu": "ur"
+        }
+
+    def _get_easy_nmt_cache_path(self, lang_code):
+        cache_base = os.path.join(Path.home(), ".cache", "torch", "easynmt_v2")
+        return os.path.join(cache_base, "opus-mt")
+
+    def _check_model_status(self):
+        status = {}
+        model_sizes = {
+            "en": "300MB", "es": "1.16GB", "fr": "1.10GB", "de": "1.6GB",
+            "it": "958MB", "jap": "820MB", "ru": "1.38GB",
+            "ar": "1.38GB", "zh": "620MB", "hi": "587MB",
+            "nl": "1.43GB", "sv": "1.31GB", "uk": "585MB", "ur": "870MB"
+        }
+        
+        # Check Hugging Face cache for individual models - use same path as download
+        hf_cache = os.path.join(os.environ.get('HF_HOME'), 'hub')
+        logging.info(f"🔍 CACHE PATH: {hf_cache}")
+        
+        downloaded_models = []
+        
+        for lang, code in self.languages_list.items():
+            # English doesn't need a translation model - it's always available
+            if lang == "English":
+                status[lang] = {"code": code, "status": "downloaded"}
+                downloaded_models.append(f"{lang} ({code})")
+                logging.info(f"🔍 ENGLISH: Always available ({code})")
+                continue
+            
+            is_downloading = self.download_status.get(lang, {}).get("status") == "downloading"
+            
+            # Check if model exists in Hugging Face cache
+            model_name = f"models--Helsinki-NLP--opus-mt-en-{code}"
+            model_path = os.path.join(hf_cache, model_name)
+            
+            # Check both snapshots and blobs folders (Windows symlink workaround)
+            snapshots_path = os.path.join(model_path, "snapshots")
+            blobs_path = os.path.join(hf_cache, "blobs")
+            
+            # Simple check: if model directory exists, it's downloaded
+            is_downloaded = os.path.exists(model_path) and os.path.isdir(model_path)
+            
+            # Additional verification: check if it has actual content
+            if is_downloaded:
+                try:
+                    # Check snapshots folder
+                    snapshots_path = os.path.join(model_path, "snapshots")
+                    if os.path.exists(snapshots_path):
+                        snapshot_dirs = [d for d in os.listdir(snapshots_path) if os.path.isdir(os.path.join(snapshots_path, d))]
+                        if snapshot_dirs:
+                            is_downloaded = True
+                    # Check blobs folder as fallback
+                    elif os.path.exists(os.path.join(model_path, "blobs")):
+                        is_downloaded = True
+                    else:
+                        is_downloaded = False
+                except:
+                    # If we can't check contents, assume it's downloaded if directory exists
+                    is_downloaded = True
+
+            if is_downloading:
+                status[lang] = {"code": code, "status": "downloading", "size": model_sizes.get(code, "Unknown")}
+                logging.info(f"🔍 DOWNLOADING: {lang} ({code})")
+            elif is_downloaded:
+                status[lang] = {"code": code, "status": "downloaded"}
+                downloaded_models.append(f"{lang} ({code})")
+                logging.info(f"🔍 FOUND MODEL: {lang} at {model_path}")
+            else:
+                status[lang] = {"code": code, "status": "not_downloaded", "size": model_sizes.get(code, "Unknown")}
+                logging.info(f"🔍 NOT FOUND: {lang} ({code}) - {model_path}")
+        
+        logging.info(f"🔍 DOWNLOADED MODELS: {', '.join(downloaded_models) if downloaded_models else 'None found'}")
+        logging.info(f"🔍 TOTAL STATUS: Downloaded={len([s for s in status.values() if s['status'] == 'downloaded'])}, Downloading={len([s for s in status.values() if s.get('status') == 'downloading'])}, Not Downloaded={len([s for s in status.values() if s['status'] == 'not_downloaded'])}")
+        
+        return status
+
+    def _update_language_list_ui(self):
+        try:
+            self.language_selector_combo.currentTextChanged.disconnect(self._on_language_changed)
+        except TypeError:
+            pass # Signal was not connected yet
+        
+        current_language = self.language_selector_combo.currentText()
+        self.language_selector_combo.clear()
+
+        self.download_status = self._check_model_status()
+        
+        downloaded = sorted([k for k, v in self.download_status.items() if v["status"] == "downloaded"])
+        downloading = sorted([k for k, v in self.download_status.items() if v.get("status") == "downloading"])
+        not_downloaded = sorted([k for k, v in self.download_status.items() if v["status"] == "not_downloaded"])
+
+        for lang in downloaded:
+            self.language_selector_combo.addItem(qta.icon("fa5s.check-circle", color="green"), lang)
+        
+        if downloaded and (downloading or not_downloaded):
+            self.language_selector_combo.insertSeparator(len(downloaded))
+            
+        for lang in downloading:
+            size = self.download_status[lang]["size"]
+            self.language_selector_combo.addItem(qta.icon("fa5s.spinner", color="blue"), f"{lang} ({size})")
+        
+        if downloading and not_downloaded:
+            self.language_selector_combo.insertSeparator(len(downloaded) + len(downloading) + 1)
+            
+        for lang in not_downloaded:
+            size = self.download_status[lang]["size"]
+            self.language_selector_combo.addItem(qta.icon("fa5s.download", color="red"), f"{lang} ({size})")
+        
+        self.language_selector_combo.currentTextChanged.connect(self._on_language_changed)
+        
+        # Set English as default, otherwise preserve selection
+        clean_current = current_language.split(' (')[0] if ' (' in current_language else current_language
+        english_found = False
+        
+        # First try to find English
+        for i in range(self.language_selector_combo.count()):
+            item_text = self.language_selector_combo.itemText(i)
+            clean_item = item_text.split(' (')[0] if ' (' in item_text else item_text
+            if clean_item == "English":
+                self.language_selector_combo.setCurrentIndex(i)
+                english_found = True
+                break
+        
+        # If English not found or we have a valid current selection, try to preserve it
+        if not english_found or clean_current:
+            for i in range(self.language_selector_combo.count()):
+                item_text = self.language_selector_combo.itemText(i)
+                clean_item = item_text.split(' (')[0] if ' (' in item_text else item_text
+                if clean_item == clean_current:
+                    self.language_selector_combo.setCurrentIndex(i)
+                    break
+
+    @pyqtSlot(str)
+    def _handle_model_download_started(self, lang_code):
+        lang_name = self._get_language_name(lang_code)
+        model_sizes = {
+            "en": "300MB", "es": "1.16GB", "fr": "1.10GB", "de": "1.6GB",
+            "it": "958MB", "jap": "820MB", "ru": "1.38GB",
+            "ar": "1.38GB", "zh": "620MB", "hi": "587MB",
+            "nl": "1.43GB", "sv": "1.31GB", "uk": "585MB", "ur": "870MB"
+        }
+        size = model_sizes.get(lang_code, "Unknown")
+        with self.download_lock:
+            self.download_status[lang_name] = {"code": lang_code, "status": "downloading", "size": size}
+        logging.info(f"Updated download status for {lang_name}: downloading")
+        self._update_language_list_ui()
+        self.ui_update_timer.start()  # Start periodic UI updates
+        self._show_toast(f"📥 Downloading {lang_name} model ({size})...")
+        # Update button state during download for 10 seconds
+        QTimer.singleShot(1000, self._update_language_list_ui)
+        QTimer.singleShot(5000, self._update_language_list_ui)
+        QTimer.singleShot(10000, self._update_language_list_ui)
+
+    @pyqtSlot(str, str)
+    def _handle_model_download_finished(self, lang_code, result):
+        lang_name = self._get_language_name(lang_code)
+        with self.download_lock:
+            if result == "success":
+                self.download_status[lang_name] = {"code": lang_code, "status": "downloaded"}
+            else:
+                if lang_name in self.download_status:
+                    del self.download_status[lang_name]
+        logging.info(f"Updated download status for {lang_name}: {result}")
+        
+        # Check if all downloads are complete
+        downloading_count = sum(1 for status in self.download_status.values() if status.get("status") == "downloading")
+        if downloading_count == 0:
+            self.ui_update_timer.stop()  # Stop periodic UI updates only when all downloads complete
+        
+        self._update_language_list_ui()
+        if result == "success":
+            self._show_toast(f"✅ {lang_name} model downloaded successfully!")
+            # Force UI refresh after 3 seconds with 10 second update cycle
+            QTimer.singleShot(3000, self._update_language_list_ui)
+            QTimer.singleShot(10000, self._update_language_list_ui)
+            # Note: Auto-start disabled to prevent infinite loops
+            # User can manually click Generate button after download completes
+        else:
+            self._show_toast(f"❌ Download failed for {lang_name}. You can retry later.")
+
+    def _download_model_in_background(self, lang_code):
+        logging.info(f"Download method called for {lang_code}")
+        logging.info(f"Starting download for language: {lang_code}")
+        try:
+            # Test network connectivity first
+            import urllib.request
+            try:
+                urllib.request.urlopen('https://huggingface.co', timeout=10)
+                logging.info("Network connectivity confirmed")
+            except Exception as net_error:
+                logging.error(f"Network connectivity failed: {net_error}")
+                raise Exception(f"No internet connection: {net_error}")
+            
+            logging.info("Setting environment variables...")
+            import os
+            os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
+            os.environ["HF_HUB_DISABLE_SYMLINKS"] = "1"
+            os.environ["HF_HUB_DISABLE_PROGRESS_BARS"] = "1"  # Disable progress bars that can hang
+            
+            logging.info("Emitting download started signal...")
+            self.model_download_started.emit(lang_code)
+            logging.info(f"Starting model download for {lang_code}...")
+            
+            # Use huggingface_hub to download the specific model
+            snapshot_download = lazy_import_huggingface()
+            if not snapshot_download:
+                raise Exception("huggingface_hub not available")
+            model_id = f"Helsinki-NLP/opus-mt-en-{lang_code}"
+            logging.info(f"Attempting to download model: {model_id}")
+            
+            try:
+                # Use explicit cache directory to ensure consistency
+                cache_dir = os.path.join(os.environ.get('HF_HOME'), 'hub')
+                logging.info(f"Using cache directory: {cache_dir}")
+                
+                # Add progress logging
+                import time
+                start_time = time.time()
+                logging.info(f"Download started at {time.strftime('%H:%M:%S')}")
+                
+                # Force no symlinks by using local_files_only after first download attempt
+                try:
+                    path = snapshot_download(
+                        repo_id=model_id, 
+                        cache_dir=cache_dir, 
+                        local_files_only=False,
+                        resume_download=True,  # Resume if interrupted
+                        force_download=False   # Don't re-download if exists
+                    )
+                except OSError as symlink_error:
+                    if "privilege" in str(symlink_error).lower():
+                        logging.warning(f"Symlink error, retrying with local_files_only: {symlink_error}")
+                        # Try to use already downloaded files
+                        path = snapshot_download(repo_id=model_id, cache_dir=cache_dir, local_files_only=True)
+                    else:
+                        raise symlink_error
+                
+                elapsed_time = time.time() - start_time
+                logging.info(f"Download completed in {elapsed_time:.1f} seconds")
+                logging.info(f"Model downloaded to: {path}")
+                
+            except Exception as download_error:
+                logging.warning(f"Download error (checking cache): {download_error}")
+                # Check if model exists in cache anyway
+                hf_cache = os.path.join(os.environ.get('HF_HOME', os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'Zest Sync', 'cache', 'models')), 'hub')
+                cache_path = os.path.join(hf_cache, f"models--Helsinki-NLP--opus-mt-en-{lang_code}")
+                if os.path.exists(cache_path):
+                    logging.info(f"Model found in cache: {cache_path}")
+                else:
+                    raise download_error
+            
+            # Skip EasyNMT initialization during download to prevent crashes
+            logging.info("Model download completed successfully")
+            logging.info(f"Model download completed for {lang_code}")
+            
+            self.model_download_finished.emit(lang_code, "success")
+            return True
+        except Exception as e:
+            logging.error(f"ERROR downloading model for Language[Code:]{lang_code}: {e}")
+            logging.error(f"Download failed for {lang_code}: {e}")
+            try:
+                import traceback
+                logging.error(f"Full traceback: {traceback.format_exc()}")
+            except:
+                pass
+            self.model_download_finished.emit(lang_code, "failure")
+
+    def _populate_sidebar(self):
+        while self.sidebar_layout.count():
+            item = self.sidebar_layout.takeAt(0)
+            widget = item.widget()
+            if widget is not None:
+                widget.deleteLater()
+
+        # Responsive sidebar margins and spacing
+        screen = QApplication.primaryScreen().geometry()
+        sidebar_margin = max(10, int(screen.width() / 100))  # 10-19px
+        sidebar_spacing = max(10, int(screen.height() / 60))  # 10-18px
+        self.sidebar_layout.setContentsMargins(sidebar_margin, sidebar_margin, sidebar_margin, sidebar_margin)
+        self.sidebar_layout.setSpacing(sidebar_spacing)
+
+        top_container = QWidget()
+        top_layout = QVBoxLayout(top_container)
+        top_layout.setContentsMargins(0, 0, 0, 0)
+        top_layout.setSpacing(10)
+        
+        queue_header_layout = QHBoxLayout()
+        queue_header_label = QLabel("Media Queue")
+        header_font_size = max(10, int(screen.width() / 140))  # 10-16px
+        queue_header_label.setFont(QFont("Roboto", header_font_size, QFont.Weight.Bold))
+        queue_header_layout.addWidget(queue_header_label)
+        queue_header_layout.addStretch()
+        self.import_media_btn = self._create_icon_button("fa5s.plus", size=28, icon_size=12)
+        self.import_media_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #e50914; /* Main background color */
+                border-radius: 8px;
+                border: none;
+            }
+            QPushButton:hover {
+                background-color: #f61a27; /* Lighter color on hover */
+            }
+            QPushButton:pressed {
+                background-color: #c00814; /* Darker color when pressed */
+            }
+        """)
+        self.import_media_btn.setToolTip("Import Media Files or Folder")
+        self.import_media_btn.clicked.connect(self._import_media)
+        self.import_media_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        queue_header_layout.addWidget(self.import_media_btn)
+
+        self.media_list_widget = QListWidget()
+        self.media_list_widget.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.media_list_widget.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
+        self.media_list_widget.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+        self.media_list_widget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.media_list_widget.customContextMenuRequested.connect(self._show_media_context_menu)
+        self.media_list_widget.setStyleSheet("""
+            QListWidget { 
+                border: 1px solid #474747; 
+                border-radius: 10px; 
+                padding: 8px; 
+                background-color: #2a2a2a;
+            }
+            QListWidget::item { 
+                padding: 3px; 
+                border-radius: 3px; 
+                margin: 1px;
+            }
+            QListWidget::item:hover { 
+                background-color: #333; 
+                cursor: pointer; 
+            }
+            QListWidget::item:selected { 
+                background-color: #0066cc; 
+                color: white; 
+            }
+            QListWidget::item[playing="true"] {
+                background-color: rgba(229, 4, 9, 80);
+                border: 2px solid #e50409;
+                color: white;
+            }
+            QListWidget::item[playing="true"]:selected {
+                background-color: #0066cc;
+                border: 2px solid #e50409;
+                color: white;
+            }
+            QScrollBar:vertical {
+                background-color: #e50409;
+                width: 8px;
+                border-radius: 4px;
+                margin: 2px;
+            }
+            QScrollBar::handle:vertical {
+                background-color: #ffffff;
+                border-radius: 4px;
+                min-height: 20px;
+                margin: 2px;
+            }
+            QScrollBar::handle:vertical:hover {
+                background-color: #f61a27;
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                border: none;
+                background: none;
+            }
+        """)
+        self.media_list_widget.setCursor(Qt.CursorShape.OpenHandCursor)
+        self.media_list_widget.itemDoubleClicked.connect(self._play_selected_media)
+        self.media_list_widget.itemSelectionChanged.connect(self._on_selection_changed)
+        
+        top_layout.addLayout(queue_header_layout)
+        top_layout.addWidget(self.media_list_widget)
+
+        queue_controls_layout = QHBoxLayout()
+        delete_selected_btn = QPushButton(" Delete Selected")
+        delete_selected_btn.setIcon(qta.icon("fa5s.trash-alt", color="#f0f0f0"))
+        delete_selected_btn.clicked.connect(self._delete_selected_media)
+        delete_all_btn = QPushButton(" Delete All")
+        delete_all_btn.setIcon(qta.icon("fa5s.trash", color="#f0f0f0"))
+        delete_all_btn.clicked.connect(self._delete_all_media)
+        
+        for btn in [delete_selected_btn, delete_all_btn]:
+             btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+             # Compressed styling - smaller font, less padding, reduced height
+             btn_font_size = max(8, int(screen.width() / 140))  # 2px smaller than before
+             btn_padding = max(2, int(screen.width() / 600))    # Much less padding
+             btn.setStyleSheet(f"QPushButton {{ text-align: center; padding: {btn_padding}px; background-color: #2a2a2a; border: 1px solid #474747; border-radius: 3px; font-size: {btn_font_size}px; min-height: 20px; max-height: 25px; }} QPushButton:hover {{ border-color: #e50914; }}")
+        
+        queue_controls_layout.addWidget(delete_selected_btn)
+        queue_controls_layout.addWidget(delete_all_btn)
+        top_layout.addLayout(queue_controls_layout)
+        
+        # Create scroll area for settings
+        settings_scroll = QScrollArea()
+        settings_scroll.setWidgetResizable(True)
+        settings_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        settings_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        settings_scroll.setStyleSheet("""
+            QScrollArea {
+                border: none;
+                background-color: #000000;
+            }
+            QScrollBar:vertical {
+                background-color: #e50409;
+                width: 8px;
+                border-radius: 4px;
+                margin: 2px;
+            }
+            QScrollBar::handle:vertical {
+                background-color: #e50409;
+                border-radius: 4px;
+                min-height: 20px;
+                margin: 2px;
+            }
+            QScrollBar::handle:vertical:hover {
+                background-color: #000000;
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                border: none;
+                background: none;
+            }
+        """)
+        
+        bottom_container = QWidget()
+        bottom_layout = QVBoxLayout(bottom_container)
+        bottom_layout.setContentsMargins(5, 5, 5, 5)  # Add padding from scrollbar
+        bottom_layout.setSpacing(12)  # Reduced spacing for compressed layout
+
+        settings_header_label = QLabel("Settings")
+        settings_header_label.setFont(QFont("Roboto", header_font_size, QFont.Weight.Bold))
+        margin_top = max(8, int(screen.height() / 90))  # 8-12px
+        settings_header_label.setStyleSheet(f"margin-top: {margin_top}px;")
+
+        display_box, display_layout = self._create_setting_box("Subtitles Display")
+        
+        display_content_layout = QHBoxLayout(); display_content_layout.setContentsMargins(0,0,0,0)
+        display_label = QLabel("Display Subtitles"); display_label.setStyleSheet("background-color: transparent; border: none;")
+        self.subtitle_switch = SwitchButton(); self.subtitle_switch.toggled.connect(self._toggle_subtitles)
+        display_content_layout.addWidget(display_label); display_content_layout.addStretch(); display_content_layout.addWidget(self.subtitle_switch)
+        display_layout.addLayout(display_content_layout)
+
+        font_size_layout = QHBoxLayout()
+        font_size_label = QLabel("Font Size")
+        font_size_label.setStyleSheet("background: transparent; border: none;")
+        self.font_size_slider = QSlider(Qt.Orientation.Horizontal)
+        self.font_size_slider.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.font_size_slider.setStyleSheet("QSlider::groove:horizontal { border: 1px solid #333; height: 5px; background: #333333; border-radius: 2px; } QSlider::sub-page:horizontal { background: #e50914; border-radius: 2px; } QSlider::handle:horizontal { background: #e50914; border: 1px solid #e50914; width: 12px; height: 12px; margin: -4px 0; border-radius: 6px; }")
+        self.font_size_slider.setRange(14, 72)
+        self.font_size_slider.setValue(self.subtitle_font_size)
+        self.font_size_slider.valueChanged.connect(self._set_subtitle_font_size)
+        font_size_layout.addWidget(font_size_label)
+        font_size_layout.addWidget(self.font_size_slider)
+        display_layout.addLayout(font_size_layout)
+        
+        # Font color selection
+        color_layout = QHBoxLayout()
+        color_label = QLabel("Font Color")
+        color_label.setStyleSheet("background: transparent; border: none;")
+        self.font_color_combo = QComboBox()
+        self.font_color_combo.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        colors = [("Black", "#000000"), ("Blue", "#0080ff"), ("Green", "#00ff00"), ("Orange", "#ffa500"), ("Red", "#ff0000"), ("White", "#ffffff"), ("Yellow", "#ffff00")]
+        for name, hex_color in colors:
+            self.font_color_combo.addItem(name)
+        self.font_color_combo.setStyleSheet("QComboBox { background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #474747; border-radius: 5px; padding: 2px 5px; } QComboBox:hover { border-color: #e50914; } QComboBox QAbstractItemView { background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #474747; }")
+        self.font_color_combo.currentTextChanged.connect(self._set_subtitle_color)
+        color_layout.addWidget(color_label)
+        color_layout.addWidget(self.font_color_combo)
+        display_layout.addLayout(color_layout)
+        
+        # Stroke on/off
+        stroke_layout = QHBoxLayout()
+        stroke_layout.setContentsMargins(0,0,0,0)
+        stroke_label = QLabel("Text Stroke")
+        stroke_label.setStyleSheet("background-color: transparent; border: none;")
+        self.stroke_switch = SwitchButton()
+        self.stroke_switch.setChecked(False)
+        self.stroke_switch.toggled.connect(self._toggle_stroke)
+        stroke_layout.addWidget(stroke_label)
+        stroke_layout.addStretch()
+        stroke_layout.addWidget(self.stroke_switch)
+        display_layout.addLayout(stroke_layout)
+        
+        generation_box, generation_layout = self._create_setting_box("Subtitle Generation")
+        
+        # Accuracy switch
+        accuracy_layout = QHBoxLayout()
+        accuracy_layout.setContentsMargins(0, 0, 0, 0)
+        
+        accuracy_info_layout = QVBoxLayout()
+        accuracy_info_layout.setContentsMargins(0, 0, 0, 0)
+        accuracy_info_layout.setSpacing(2)
+        
+        accuracy_title = QLabel("Accuracy Mode")
+        accuracy_title.setStyleSheet("background-color: transparent; border: none; font-weight: bold;")
+        
+        accuracy_desc = QLabel("Fast: Good for movies/series. Slow: Better for anime/dubbed content. But takes time.")
+        accuracy_desc.setStyleSheet("background-color: transparent; border: none; color: #aaa; font-size: 9px;")
+        accuracy_desc.setWordWrap(True)
+        
+        accuracy_info_layout.addWidget(accuracy_title)
+        accuracy_info_layout.addWidget(accuracy_desc)
+        
+        accuracy_switch_layout = QHBoxLayout()
+        accuracy_switch_layout.setContentsMargins(0, 0, 0, 0)
+        accuracy_switch_layout.setSpacing(8)
+        
+        fast_label = QLabel("Fast")
+        fast_label.setStyleSheet("background-color: transparent; border: none; font-size: 10px; color: #aaa;")
+        
+        self.accuracy_switch = SwitchButton()
+        # True = Slow (right), False = Fast (left)
+        current_mode = self.settings_manager.get_accuracy_mode()
+        self.accuracy_switch.setChecked(current_mode == "slow")
+        self.accuracy_switch.toggled.connect(self._on_accuracy_changed)
+        
+        slow_label = QLabel("Slow")
+        slow_label.setStyleSheet("background-color: transparent; border: none; font-size: 10px; color: #aaa;")
+        
+        accuracy_switch_layout.addWidget(fast_label)
+        accuracy_switch_layout.addWidget(self.accuracy_switch)
+        accuracy_switch_layout.addWidget(slow_label)
+        
+        accuracy_layout.addLayout(accuracy_info_layout)
+        accuracy_layout.addStretch()
+        accuracy_layout.addLayout(accuracy_switch_layout)
+        
+        generation_layout.addLayout(accuracy_layout)
+        
+        # Note about accuracy mode
+        accuracy_note = QLabel("Note: Only affects English subtitle generation. Translation speed remains the same.")
+        accuracy_note.setStyleSheet("background-color: transparent; border: none; color: #888; font-size: 9px; margin-top: 5px;")
+        accuracy_note.setWordWrap(True)
+        generation_layout.addWidget(accuracy_note)
+        
+        # Batched decoding of VAD speech chunks, used alongside either accuracy mode
+        batched_layout = QHBoxLayout()
+        batched_layout.setContentsMargins(0, 0, 0, 0)
+        batched_label = QLabel("Batched Inference")
+        batched_label.setStyleSheet("background-color: transparent; border: none;")
+        batched_label.setToolTip("Decode several speech chunks per pass. Much faster for long files on many-core CPUs, uses more RAM")
+        self.batch_size_spin = QSpinBox()
+        self.batch_size_spin.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
+        self.batch_size_spin.setRange(1, 32)
+        self.batch_size_spin.setPrefix("Batch ")
+        self.batch_size_spin.setValue(self.settings_manager.get_batch_size())
+        self.batch_size_spin.setEnabled(self.settings_manager.get_inference_mode() == "batched")
+        self.batch_size_spin.setStyleSheet("QSpinBox { background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #474747; border-radius: 5px; padding: 2px 5px; } QSpinBox:hover { border-color: #e50914; } QSpinBox:disabled { color: #666; }")
+        self.batch_size_spin.valueChanged.connect(self.settings_manager.set_batch_size)
+        self.batched_switch = SwitchButton()
+        self.batched_switch.setChecked(self.settings_manager.get_inference_mode() == "batched")
+        self.batched_switch.toggled.connect(self._on_batched_toggled)
+        batched_layout.addWidget(batched_label)
+        batched_layout.addStretch()
+        batched_layout.addWidget(self.batch_size_spin)
+        batched_layout.addWidget(self.batched_switch)
+        generation_layout.addLayout(batched_layout)
+        
+        # Background preparation of upcoming queue items
+        prefetch_layout = QHBoxLayout()
+        prefetch_layout.setContentsMargins(0, 0, 0, 0)
+        prefetch_label = QLabel("Prepare Upcoming Queue")
+        prefetch_label.setStyleSheet("background-color: transparent; border: none;")
+        prefetch_label.setToolTip("Generate English (and your last translation language) subtitles for the next items in the background")
+        self.prefetch_switch = SwitchButton()
+        self.prefetch_switch.setChecked(self.settings_manager.get_prefetch_queue())
+        self.prefetch_switch.toggled.connect(self._on_prefetch_toggled)
+        prefetch_layout.addWidget(prefetch_label)
+        prefetch_layout.addStretch()
+        prefetch_layout.addWidget(self.prefetch_switch)
+        generation_layout.addLayout(prefetch_layout)
+        
+        # Calibrated decode settings for the current accuracy mode, each overridable
+        tuning_title = QLabel("Performance")
+        tuning_title.setStyleSheet("background-color: transparent; border: none; font-weight: bold; margin-top: 5px;")
+        self.tuning_label = QLabel()
+        self.tuning_label.setStyleSheet("background-color: transparent; border: none; color: #aaa; font-size: 9px;")
+        self.tuning_label.setWordWrap(True)
+        generation_layout.addWidget(tuning_title)
+        generation_layout.addWidget(self.tuning_label)
+        
+        spin_style = "QSpinBox { background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #474747; border-radius: 5px; padding: 2px 5px; } QSpinBox:hover { border-color: #e50914; }"
+        combo_style = "QComboBox { background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #474747; border-radius: 5px; padding: 2px 5px; } QComboBox:hover { border-color: #e50914; } QComboBox QAbstractItemView { background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #474747; }"
+        _, logical_cores = core_layout()
+        
+        threads_layout = QHBoxLayout()
+        threads_label = QLabel("CPU Threads")
+        threads_label.setStyleSheet("background-color: transparent; border: none;")
+        self.threads_spin = QSpinBox()
+        self.threads_spin.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
+        self.threads_spin.setRange(0, logical_cores)
+        self.threads_spin.setSpecialValueText("Auto")
+        self.threads_spin.setStyleSheet(spin_style)
+        self.threads_spin.valueChanged.connect(lambda value: self._on_tuning_override("cpu_threads", value))
+        threads_layout.addWidget(threads_label)
+        threads_layout.addStretch()
+        threads_layout.addWidget(self.threads_spin)
+        generation_layout.addLayout(threads_layout)
+        
+        compute_layout = QHBoxLayout()
+        compute_label = QLabel("Compute Type")
+        compute_label.setStyleSheet("background-color: transparent; border: none;")
+        self.compute_type_combo = QComboBox()
+        self.compute_type_combo.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.compute_type_combo.addItems(["Auto"] + COMPUTE_TYPES)
+        self.compute_type_combo.setStyleSheet(combo_style)
+        self.compute_type_combo.currentTextChanged.connect(
+            lambda text: self._on_tuning_override("compute_type", None if text == "Auto" else text))
+        compute_layout.addWidget(compute_label)
+        compute_layout.addStretch()
+        compute_layout.addWidget(self.compute_type_combo)
+        generation_layout.addLayout(compute_layout)
+        
+        self.recalibrate_button = QPushButton("Recalibrate")
+        self.recalibrate_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.recalibrate_button.setToolTip("Measure the fastest settings again on the next English generation")
+        self.recalibrate_button.setStyleSheet("QPushButton { background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #474747; border-radius: 5px; padding: 3px; } QPushButton:hover { border-color: #e50914; }")
+        self.recalibrate_button.clicked.connect(self._on_recalibrate_clicked)
+        generation_layout.addWidget(self.recalibrate_button)
+        self._refresh_tuning_controls()
+        
+        self.language_selector_combo = QComboBox()
+        self.language_selector_combo.setMinimumHeight(35)
+        self.language_selector_combo.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.language_selector_combo.currentTextChanged.connect(self._on_language_changed)
+        script_dir = os.path.dirname(os.path.abspath(__file__)); chevron_icon_path = os.path.join(script_dir, 'chevron-down.png').replace('\\', '/')
+        if not os.path.exists(chevron_icon_path): qta.icon('fa5s.chevron-down', color='#f0f0f0').pixmap(QSize(16, 16)).save(chevron_icon_path)
+        self.language_selector_combo.setStyleSheet(f"QComboBox {{ background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #474747; border-radius: 10px; padding-left: 10px; padding-right: 10px; }} QComboBox:hover {{ border-color: #e50914; }} QComboBox::drop-down {{ subcontrol-origin: padding; subcontrol-position: top right; width: 25px; border-left-width: 1px; border-left-color: #474747; border-left-style: solid; border-top-right-radius: 10px; border-bottom-right-radius: 10px; }} QComboBox::down-arrow {{ image: url({chevron_icon_path}); width: 12px; height: 12px; }} QComboBox QAbstractItemView {{ background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #474747; border-radius: 10px; selection-background-color: #333333; padding: 5px; }} QComboBox QAbstractItemView::item {{ height: 30px; border-radius: 5px; }} QComboBox QAbstractItemView::item:hover {{ background-color: #333333; color: #e50914; }}")
+        
+        self.generate_button = QPushButton("Generate")
+        self.generate_button.setMinimumHeight(35)
+        self.generate_button.setFont(QFont("Roboto", 9, QFont.Weight.Bold))
+        self.generate_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.generate_button.setStyleSheet("QPushButton { background-color: #e50914; color: white; border: none; border-radius: 8px; } QPushButton:hover { background-color: #f61a27; } QPushButton:pressed { background-color: #c00814; }")
+        self.generate_button.clicked.connect(self._start_subtitle_generation)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)  # Indeterminate progress for animation
+        self.progress_bar.setValue(0)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setStyleSheet("QProgressBar { border: 1px solid #333333; border-radius: 8px; background-color: #1e1e1e; height: 16px;} QProgressBar::chunk { background-color: #e50914; border-radius: 7px; }")
+        self.progress_bar.setVisible(False)
+        
+        self.progress_text = QLabel("Generating Subtitles: ...")
+        self.progress_text.setStyleSheet("background-color: transparent; border: none; font-size: 9pt; color: #aaa;")
+        self.progress_text.setVisible(False)
+        
+        self.multi_translate_button = QPushButton("  Translate to Multiple...")
+        self.multi_translate_button.setIcon(qta.icon("fa5s.language", color="#f0f0f0"))
+        self.multi_translate_button.setMinimumHeight(30)
+        self.multi_translate_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.multi_translate_button.setStyleSheet("QPushButton { background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #474747; border-radius: 8px; } QPushButton:hover { border-color: #e50914; } QPushButton:disabled { color: #666; }")
+        self.multi_translate_button.clicked.connect(self._show_multi_translate_dialog)
+        
+        generation_layout.addWidget(self.language_selector_combo)
+        generation_layout.addWidget(self.generate_button)
+        generation_layout.addWidget(self.multi_translate_button)
+        generation_layout.addWidget(self.progress_bar)
+        generation_layout.addWidget(self.progress_text)
+        
+        manual_box, manual_layout = self._create_setting_box("Manual Override")
+        self.load_srt_button = QPushButton("  Load .SRT File")
+        self.load_srt_button.setIcon(qta.icon("fa5s.folder-open", color="#f0f0f0"))
+        self.load_srt_button.clicked.connect(self._load_manual_srt)
+        self.load_srt_button.setMinimumHeight(35)
+        self.load_srt_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.load_srt_button.setStyleSheet("QPushButton { text-align: left; padding-left: 10px; background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #474747; border-radius: 10px; } QPushButton:hover { border-color: #e50914; }")
+        manual_layout.addWidget(self.load_srt_button)
+        
+        # credits_container = QWidget(); credits_container.setStyleSheet("border-top: 1px solid #404040; padding-top: 10px; ")
+        # credits_layout = QVBoxLayout(credits_container); credits_layout.setContentsMargins(0,0,0,0); credits_layout.setSpacing(0)
+        # credit_label = QLabel("Built with purpose by Anurag 💝"); credit_label.setFont(QFont("Roboto", 9)); credit_label.setStyleSheet("border: none; padding: 0; color: #999;")
+        # github_link = QLabel("<a href='https://github.com/anu277' style='color: #f0f0f0; text-decoration: none;'>GitHub Profile</a>"); github_link.setFont(QFont("Roboto", 9, QFont.Weight.Bold)); github_link.setOpenExternalLinks(True); github_link.setStyleSheet("border: none; padding: 0;")
+        # help_link = QLabel("<a href='https://github.com/anu277' style='color: #f0f0f0; text-decoration: none;'>Help & Support</a>"); help_link.setFont(QFont("Roboto", 9, QFont.Weight.Bold)); help_link.setOpenExternalLinks(True); help_link.setStyleSheet("border: none; padding: 0;")
+        # credits_layout.addWidget(credit_label, 0, Qt.AlignmentFlag.AlignCenter); credits_layout.addWidget(github_link, 0, Qt.AlignmentFlag.AlignCenter); credits_layout.addWidget(help_link, 0, Qt.AlignmentFlag.AlignCenter)
+
+        # # Performance disclaimer
+        # disclaimer_container = QWidget(); disclaimer_container.setStyleSheet("border-top: 1px solid #404040; padding-top: 10px;")
+        # disclaimer_layout = QVBoxLayout(disclaimer_container); disclaimer_layout.setContentsMargins(0,0,0,0); disclaimer_layout.setSpacing(0)
+        # disclaimer_label = QLabel("⚠️ Estimated times based on i5-10300H (4C/8T, 10th Gen) with ~600MB RAM usage.\nPerformance may vary by CPU speed, cores/threads, and RAM.")
+        # disclaimer_label.setFont(QFont("Roboto", 8)); disclaimer_label.setStyleSheet("border: none; padding: 0; color: #888; text-align: center;")
+        # disclaimer_label.setAlignment(Qt.AlignmentFlag.AlignCenter); disclaimer_label.setWordWrap(True)
+        # disclaimer_layout.addWidget(disclaimer_label, 0, Qt.AlignmentFlag.AlignCenter)
+        
+        # Combined Credits and Disclaimer Section
+        bottom_info_container = QWidget()
+        bottom_info_layout = QVBoxLayout(bottom_info_container)
+        bottom_info_layout.setContentsMargins(0, 10, 0, 0)
+        bottom_info_layout.setSpacing(20) # More vertical space for a clean separation
+
+        # Credits Sub-section
+        credits_layout = QVBoxLayout()
+        credits_layout.setContentsMargins(0,0,0,0)
+        credits_layout.setSpacing(5) # Tighter spacing for links
+        credits_label = QLabel("Built with purpose by Anurag 💝")
+        credits_label.setFont(QFont("Roboto", 8, QFont.Weight.Bold))
+        credits_label.setStyleSheet("""
+            QLabel {
+                border-top: 1px dotted #888888;
+                padding-top: 10px;
+                color: #e50914;
+            }
+        """)
+        credits_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        github_link = QLabel("<a href='https://github.com/anu277' style='color: #f0f0f0; text-decoration: underline;'>GitHub Profile</a>");
+        github_link.setFont(QFont("Roboto", 8));
+        github_link.setOpenExternalLinks(True);
+        github_link.setStyleSheet("border: none; padding: 0;");
+        github_link.setAlignment(Qt.AlignmentFlag.AlignCenter);
+
+        credits_layout.addWidget(credits_label)
+        credits_layout.addWidget(github_link)
+        
+        # Disclaimer Sub-section
+        disclaimer_layout = QVBoxLayout()
+        disclaimer_layout.setContentsMargins(0,0,0,0)
+        disclaimer_layout.setSpacing(5)
+        disclaimer_header = QLabel("Performance Note")
+        disclaimer_header.setFont(QFont("Roboto", 7, QFont.Weight.Bold))
+        disclaimer_header.setStyleSheet("""
+            QLabel {
+                border-top: 1px dotted #888888;
+                padding-top: 10px;
+                color: #f0f0f0;
+            }
+        """)
+        disclaimer_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        disclaimer_text = QLabel("⚠️ Estimated times based on i5-10300H (4C/8T, 10th Gen) with ~600MB RAM usage. Performance may vary by CPU speed, cores/threads, and RAM.")
+        disclaimer_text.setFont(QFont("Roboto", 7))
+        disclaimer_text.setStyleSheet("border: none; padding: 0; color: #888; text-align: center;")
+        disclaimer_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        disclaimer_text.setWordWrap(True)
+
+        disclaimer_layout.addWidget(disclaimer_header)
+        disclaimer_layout.addWidget(disclaimer_text)
+
+        bottom_info_layout.addLayout(disclaimer_layout)
+        bottom_info_layout.addLayout(credits_layout)
+        
+        bottom_layout.addWidget(settings_header_label)
+        bottom_layout.addWidget(display_box)
+        bottom_layout.addWidget(generation_box)
+        bottom_layout.addWidget(manual_box)
+        bottom_layout.addStretch()
+        bottom_layout.addWidget(bottom_info_container)
+        bottom_layout.addWidget(bottom_info_container)
+        
+        # Set the bottom container in scroll area
+        settings_scroll.setWidget(bottom_container)
+        
+        self.sidebar_layout.addWidget(top_container, 1)
+        self.sidebar_layout.addWidget(settings_scroll, 1)  # Make scrollable settings take remaining space
+    
+
+    def _import_media(self):
+        menu = QMenu(self)
+        menu.setStyleSheet("QMenu { background-color: #1e1e1e; color: #f0f0f0; border: 1px solid #333; } QMenu::item:selected { background-color: #333; }")
+        files_action = menu.addAction("Import Files")
+        folder_action = menu.addAction("Import Folder")
+        action = menu.exec(self.import_media_btn.mapToGlobal(QPointF(0, self.import_media_btn.height()).toPoint()))
+        if action == files_action: self._import_files()
+        elif action == folder_action: self._import_folder()
+    
+    def _load_last_import_path(self):
+        try:
+            if os.path.exists(self.settings_file):
+                with open(self.settings_file, 'r') as f:
+                    return f.read().strip()
+        except:
+            pass
+        return os.path.expanduser("~/Videos")
+    
+    def _save_last_import_path(self, path):
+        try:
+            with open(self.settings_file, 'w') as f:
+                f.write(path)
+        except:
+            pass
+    
+    def _import_files(self): 
+        files, _ = QFileDialog.getOpenFileNames(self, "Import Media", self.last_import_path, "Media Files (*.mp4 *.mkv *.avi *.mov *.wmv *.flv *.webm *.m4v *.3gp *.ogv *.ts *.mts *.m2ts *.vob *.asf *.rm *.rmvb)")
+        if files: 
+            self.last_import_path = os.path.dirname(files[0])
+            self._save_last_import_path(self.last_import_path)
+            self._add_media_files(files)
+            
+    def _import_folder(self): 
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder", self.last_import_path)
+        if folder: 
+            self.last_import_path = folder
+            self._save_last_import_path(self.last_import_path)
+            self._scan_folder_for_videos(folder)
+
+    def _scan_folder_for_videos(self, path):
+        ext = ('.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', '.m4v', '.3gp', '.ogv', '.ts', '.mts', '.m2ts', '.vob', '.asf', '.rm', '.rmvb'); files = [os.path.join(r, f) for r, _, fs in os.walk(path) for f in fs if f.lower().endswith(ext)]; files.sort(); self._add_media_files(files)
+
+    def _add_media_files(self, file_paths):
+        new_files = False
+        for path in file_paths:
+            if path not in self.media_queue:
+                self.media_queue.append(path); item = QListWidgetItem(os.path.basename(path))
+                item.setData(Qt.ItemDataRole.UserRole, path); item.setToolTip(path)
+                item.setForeground(QColor("#f0f0f0"))  # Set default text color
+                self.media_list_widget.addItem(item); new_files = True
+                self._fingerprint_in_background(path)
+        if new_files and self.current_media_index == -1 and self.media_list_widget.count() > 0:
+            first_item = self.media_list_widget.item(0)
+            self.media_list_widget.setCurrentItem(first_item); self._play_selected_media(first_item)
+        elif new_files:
+            self._schedule_prefetch()
+    
+    def _play_next_in_queue(self):
+        if self.current_media_index + 1 < self.media_list_widget.count():
+            self.current_media_index += 1
+            item = self.media_list_widget.item(self.current_media_index)
+            self.media_list_widget.setCurrentItem(item); self._play_selected_media(item)
+        else:
+            self.is_playing = False
+            self.play_pause_btn.setIcon(qta.icon("fa5s.play", color="#f0f0f0"))
+
+    def _play_previous_in_queue(self):
+        if self.current_media_index > 0:
+            self.current_media_index -= 1
+            item = self.media_list_widget.item(self.current_media_index)
+            self.media_list_widget.setCurrentItem(item); self._play_selected_media(item)
+            
+    def _toggle_sidebar(self):
+        if self.is_sidebar_open:
+            self.is_sidebar_open = False
+            self.sidebar.setVisible(False)
+            self.sidebar_toggle_btn.setIcon(qta.icon("fa5s.chevron-left", color="#f0f0f0"))
+        else:
+            self.is_sidebar_open = True
+            self.sidebar.setVisible(True)
+            self.sidebar_toggle_btn.setIcon(qta.icon("fa5s.chevron-right", color="#f0f0f0"))
+    
+    def eventFilter(self, obj, event):
+        if not hasattr(self, 'sidebar'):
+            return super().eventFilter(obj, event)
+
+        if obj is self.video_container:
+            if event.type() == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
+                if self.current_media_index != -1:
+                    self._toggle_play_pause()
+                return True
+            if event.type() == QEvent.Type.MouseButtonDblClick and event.button() == Qt.MouseButton.LeftButton:
+                self._toggle_fullscreen()
+                return True
+            if event.type() == QEvent.Type.MouseMove:
+                current_pos = event.position()
+                distance = (current_pos - self.last_mouse_pos).manhattanLength()
+                if distance > 5:
+                    self._show_controls()
+                    self.mouse_idle_timer.start()
+                self.last_mouse_pos = current_pos
+                return False
+            if event.type() == QEvent.Type.Enter:
+                self.last_mouse_pos = event.position()
+                self._show_controls()
+                self.mouse_idle_timer.start()
+                return False
+        
+        if obj is self.bottom_controls_container:
+            if event.type() == QEvent.Type.Enter:
+                self.mouse_idle_timer.stop()
+                return False
+            elif event.type() == QEvent.Type.Leave:
+                self.mouse_idle_timer.start()
+                return False
+
+        if event.type() == QEvent.Type.Wheel and self._is_video_area_child(obj):
+            self._handle_volume_wheel(event)
+            return True
+
+
+        
+        if obj is self.sidebar_handle:
+            if event.type() == QEvent.Type.MouseButtonPress and event.button() == Qt.MouseButton.LeftButton:
+                self._toggle_sidebar()
+                return True
+            
+        if obj is self.sidebar_toggle_btn:
+            if event.type() == QEvent.Type.Enter:
+                self.btn_shrink_anim.stop()
+                self.btn_grow_anim.setStartValue(self.sidebar_toggle_btn.size())
+                self.btn_grow_anim.setEndValue(QSize(30, 30))
+                self.btn_grow_anim.start()
+                return True
+            elif event.type() == QEvent.Type.Leave:
+                self.btn_grow_anim.stop()
+                self.btn_shrink_anim.setStartValue(self.sidebar_toggle_btn.size())
+                self.btn_shrink_anim.setEndValue(QSize(25, 25))
+                self.btn_shrink_anim.start()
+                return True
+
+        return super().eventFilter(obj, event)
+    
+    def _create_icon_button(self, icon, size=35, icon_size=16):
+        btn = QPushButton(); btn.setFixedSize(size, size); btn.setIcon(QIcon(qta.icon(icon, color="#f0f0f0").pixmap(icon_size, icon_size))); btn.setIconSize(QSize(icon_size, icon_size)); btn.setStyleSheet("QPushButton { background-color: transparent; border: none; border-radius: 5px; } QPushButton:hover { background-color: #333333; }"); return btn
+    
+
+    
+    def _toggle_fullscreen(self):
+        self.is_fullscreen = not self.is_fullscreen
+        if self.is_fullscreen:
+            self.showFullScreen(); self.fullscreen_btn.setIcon(qta.icon("fa5s.compress", color="#f0f0f0"))
+        else:
+            self.showNormal(); self.fullscreen_btn.setIcon(qta.icon("fa5s.expand", color="#f0f0f0"))
+
+    def _on_accuracy_changed(self, is_slow):
+        mode = "slow" if is_slow else "fast"
+        self.settings_manager.set_accuracy_mode(mode)
+        
+        # Disable switch during English generation
+        if hasattr(self, 'generation_future') and self.generation_future and self.generation_future.running():
+            current_language = self.language_selector_combo.currentText().split(' (')[0]
+            if current_language == "English":
+                # Revert the switch and show warning
+                self.accuracy_switch.setChecked(not is_slow)
+                self._show_toast("Cannot change accuracy during English subtitle generation")
+                return
+        
+        logging.info(f"Accuracy mode changed to: {mode}")
+        self._show_toast(f"Accuracy set to {mode.title()} mode")
+        self._refresh_tuning_controls()
+    
+    def _refresh_tuning_controls(self):
+        """Show the values in effect for the current accuracy mode and any overrides"""
+        mode = self.settings_manager.get_accuracy_mode()
+        config = self.hardware_tuner.get_config(mode)
+        rtf = self.hardware_tuner.get_realtime_factor(mode)
+        if rtf is None:
+            measured = "not calibrated yet, runs on the first English generation"
+        else:
+            measured = f"{rtf:.2f}x real-time ({1 / rtf:.1f} min of video per minute)" if rtf > 0 else "measured"
+        self.tuning_label.setText(f"{mode.title()} mode: {config['cpu_threads']} threads, "
+                                  f"{config['compute_type']} - {measured}")
+        
+        overrides = self.settings_manager.get_whisper_overrides(mode)
+        self.threads_spin.blockSignals(True)
+        self.threads_spin.setValue(overrides.get("cpu_threads", 0))
+        self.threads_spin.blockSignals(False)
+        self.compute_type_combo.blockSignals(True)
+        self.compute_type_combo.setCurrentText(overrides.get("compute_type") or "Auto")
+        self.compute_type_combo.blockSignals(False)
+
+    def _on_tuning_override(self, key, value):
+        mode = self.settings_manager.get_accuracy_mode()
+        self.settings_manager.set_whisper_override(mode, key, value)
+        self._refresh_tuning_controls()
+
+    def _on_recalibrate_clicked(self):
+        mode = self.settings_manager.get_accuracy_mode()
+        self.settings_manager.clear_tuned_whisper_config(mode)
+        self._refresh_tuning_controls()
+        self._show_toast(f"{mode.title()} mode will be recalibrated on the next generation")
+
+    def _on_batched_toggled(self, enabled):
+        self.settings_manager.set_inference_mode("batched" if enabled else "sequential")
+        self.batch_size_spin.setEnabled(enabled)
+        self._show_toast("Batched inference on" if enabled else "Batched inference off")
+
+    def _on_prefetch_toggled(self, enabled):
+        self.settings_manager.set_prefetch_queue(enabled)
+        self._schedule_prefetch()
+        self._show_toast("Preparing upcoming queue in background" if enabled else "Queue preparation off")
+    
+    def _set_subtitle_font_size(self, size):
+        self.subtitle_font_size = size
+        self.mpv_player.sub_font_size = size
+        self._update_subtitle_style()
+    
+    def _set_subtitle_color(self, color_name):
+        colors = {"Black": "#000000", "Blue": "#0080ff", "Green": "#00ff00", "Orange": "#ffa500", "Red": "#ff0000", "White": "#ffffff", "Yellow": "#ffff00"}
+        self.subtitle_color = colors.get(color_name, "#ffffff")
+        self.mpv_player.sub_color = self.subtitle_color
+        self._update_subtitle_style()
+    
+    def _toggle_stroke(self, enabled):
+        self.subtitle_stroke = enabled
+        self.mpv_player.sub_border_size = 2 if enabled else 0
+        self.mpv_player.sub_shadow_offset = 1 if enabled else 0
+    
+    def _update_subtitle_style(self):
+        self.subtitle_label.setStyleSheet(
+            f"font-size: {self.subtitle_font_size}px; background-color: rgba(0, 0, 0, 0.5); color: {self.subtitle_color}; padding: 5px 10px; border-radius: 5px;"
+        )
+
+    def keyPressEvent(self, event: QKeyEvent):
+        key = event.key()
+        if key == Qt.Key.Key_K: self._toggle_play_pause()
+        elif key == Qt.Key.Key_L: self._skip_forward()
+        elif key == Qt.Key.Key_J: self._skip_backward()
+        elif key == Qt.Key.Key_I: self._change_volume(5)
+        elif key == Qt.Key.Key_U: self._change_volume(-5)
+        elif key == Qt.Key.Key_F: self._toggle_fullscreen()
+        elif key in [Qt.Key.Key_Tab, Qt.Key.Key_Backtab]: return
+        else: super().keyPressEvent(event)
+    
+    def closeEvent(self, event):
+        """Clean up resources when window closes"""
+        try:
+            if hasattr(self, 'mpv_player'):
+                self.mpv_player.terminate()
+            if hasattr(self, 'generation_cancel_token'):
+                self._cancel_generation("application closing")
+            if hasattr(self, 'prewarm_cancel_token'):
+                self._cancel_prewarm()
+            if hasattr(self, 'subtitle_executor'):
+                self.subtitle_executor.shutdown(wait=False)
+            if hasattr(self, 'download_executor'):
+                self.download_executor.shutdown(wait=False)
+            if hasattr(self, 'translation_executor'):
+                self.translation_executor.shutdown(wait=False)
+            if hasattr(self, 'probe_executor'):
+                self.probe_executor.shutdown(wait=False)
+            if hasattr(self, 'subtitle_write_executor'):
+                # Finished subtitles must reach the disk before the store index is flushed
+                self.subtitle_write_executor.shutdown(wait=True)
+            if getattr(self, 'queue_prefetcher', None) is not None:
+                self.queue_prefetcher.stop()
+            if hasattr(self, 'inference_worker'):
+                self.inference_worker.stop()
+            if hasattr(self, 'whisper_worker'):
+                self.whisper_worker.stop()
+            if hasattr(self, 'pipeline_worker'):
+                self.pipeline_worker.stop()
+            if hasattr(self, 'subtitle_store'):
+                self.subtitle_store.flush()
+            if hasattr(self, 'translation_memory'):
+                self.translation_memory.close()
+        except:
+            pass
+        event.accept()
+
+    def _on_language_changed(self, language):
+        logging.info(f"🔄 LANGUAGE CHANGE: User selected '{language}'")
+        self.language_selector_combo.clearFocus()
+        
+        # Extract clean language name (remove size suffix like "(300MB)")
+        clean_language = language.split(' (')[0] if ' (' in language else language
+        logging.info(f"🔄 LANGUAGE CHANGE: Clean language name: '{clean_language}'")
+        
+        if self.current_media_index == -1:
+            self.generate_button.setVisible(False)
+            self.progress_bar.setVisible(False)
+            self.progress_text.setVisible(False)
+            return
+
+        current_file_path = self.media_queue[self.current_media_index]
+        if current_file_path not in self.embedded_subtitle_tracks:
+            # Decided again from _on_subtitle_tracks_probed once the file is fingerprinted and probed
+            self.generate_button.setVisible(False)
+            self.progress_bar.setVisible(False)
+            self.progress_text.setVisible(True)
+            self.progress_text.setText("Reading subtitle tracks...")
+            return
+        english_srt_path = self._get_subtitle_path(current_file_path, "en")
+        lang_code = self._get_language_code(clean_language)
+        subtitle_path = self._get_subtitle_path(current_file_path, lang_code)
+        
+        # Check if English base subtitle exists
+        english_exists = os.path.exists(english_srt_path)
+        
+        # Without an English base the target can still come from a track embedded in the file
+        embedded_track = None
+        if not self._subtitle_available(subtitle_path) and (current_file_path, lang_code) not in self.failed_embedded_tracks:
+            embedded_track = self._find_probed_track(current_file_path, lang_code)
+        
+        # If not English and no English base, force English selection
+        if clean_language != "English" and not english_exists and embedded_track is None:
+            if (self.settings_manager.get_pipelined_translation()
+                    and self.download_status.get(clean_language, {}).get("status") == "downloaded"):
+                # Both files can be produced in one pipelined pass, translation trailing transcription
+                self.generate_button.setText("Generate with English")
+                self.generate_button.setEnabled(True)
+                self.generate_button.setVisible(True)
+                self.progress_bar.setVisible(False)
+                self.progress_text.setVisible(False)
+                return
+            # Calculate estimated time for English transcription
+            video_duration = self.media_duration
+            estimated_time = self._calculate_estimated_time(video_duration, "en")
+            estimated_minutes = int(estimated_time / 60)
+            estimated_seconds = int(estimated_time % 60)
+            
+            # Show waiting message
+            self.generate_button.setVisible(False)
+            self.progress_bar.setVisible(False)
+            self.progress_text.setVisible(True)
+            self.progress_text.setText(f"Need English base subtitle first. Est. time: {estimated_minutes}m {estimated_seconds}s")
+            
+            # Force English selection
+            for i in range(self.language_selector_combo.count()):
+                if self.language_selector_combo.itemText(i) == "English":
+                    self.language_selector_combo.setCurrentIndex(i)
+                    break
+            return
+        
+        # Check if the model is downloaded for the selected language
+        model_status = self.download_status.get(clean_language, {"status": "not_downloaded"})
+        logging.info(f"🔄 LANGUAGE CHANGE: {clean_language} model status: {model_status}")
+
+        if self._subtitle_available(subtitle_path):
+            self.generate_button.setVisible(False)
+            self.progress_bar.setVisible(False)
+            self.progress_text.setVisible(False)
+            try:
+                self._load_subtitle_track(subtitle_path, lang_code)
+                self._show_toast(f"Subtitle file for {clean_language} already exists. Loaded successfully.")
+            except Exception as e:
+                logging.error(f"Error loading subtitle file: {e}")
+                self._show_toast(f"Error loading subtitle file for {clean_language}")
+        else:
+            # For English, hide generate button and auto-start
+            if clean_language == "English":
+                self.generate_button.setVisible(False)
+                if not english_exists:
+                    # Show progress during transcription
+                    self.progress_bar.setVisible(True)
+                    self.progress_text.setVisible(True)
+                    video_duration = self.media_duration
+                    estimated_time = self._calculate_estimated_time(video_duration, "en")
+                    estimated_minutes = int(estimated_time / 60)
+                    estimated_seconds = int(estimated_time % 60)
+                    if embedded_track is not None:
+                        self.progress_text.setText("Extracting embedded English subtitles...")
+                    else:
+                        self.progress_text.setText(f"Generating English subtitles... Est: {estimated_minutes}m {estimated_seconds}s")
+                    self._start_subtitle_generation()
+                else:
+                    self.progress_bar.setVisible(False)
+                    self.progress_text.setVisible(False)
+            else:
+                self.generate_button.setVisible(True)
+                self.progress_bar.setVisible(False)
+                self.progress_text.setVisible(False)
+                
+                if embedded_track is not None:
+                    self.generate_button.setText("Use Embedded Subtitles")
+                    self.generate_button.setEnabled(True)
+                elif model_status["status"] == "downloaded":
+                    self.generate_button.setText("Generate")
+                    self.generate_button.setEnabled(True)
+                elif model_status["status"] == "downloading":
+                    self.generate_button.setText("Downloading...")
+                    self.generate_button.setEnabled(False)
+                else:
+                    size = model_status.get('size', 'Unknown')
+                    self.generate_button.setText(f"Download ({size})")
+                    self.generate_button.setEnabled(True)
+
+
+    def _start_subtitle_generation(self):
+        logging.info(f"🔘 BUTTON CLICK: Generate/Download button clicked")
+        if self.current_media_index == -1: 
+            self._show_toast("No media loaded.")
+            return
+
+        current_language = self.language_selector_combo.currentText()
+        # Extract clean language name (remove size suffix like "(300MB)")
+        clean_language = current_language.split(' (')[0] if ' (' in current_language else current_language
+        lang_code = self._get_language_code(clean_language)
+        logging.info(f"🔘 BUTTON CLICK: Processing {clean_language} (code: {lang_code})")
+        logging.info(f"🔘 BUTTON CLICK: Current download status: {self.download_status.get(clean_language, 'Not found')}")
+        
+        current_file_path = self.media_queue[self.current_media_index]
+        if current_file_path not in self.embedded_subtitle_tracks:
+            self._show_toast("Still reading the file's subtitle tracks, try again in a moment.")
+            return
+        # A text track already inside the file beats both Whisper and translation, and needs no model
+        embedded_track = None
+        if (not self._subtitle_available(self._get_subtitle_path(current_file_path, lang_code))
+                and (current_file_path, lang_code) not in self.failed_embedded_tracks):
+            embedded_track = self._find_probed_track(current_file_path, lang_code)
+        
+        if embedded_track is None and self.download_status.get(clean_language, {}).get("status") == "not_downloaded" and clean_language != "English":
+            # Check if download is already in progress
+            if self.download_status.get(clean_language, {}).get("status") == "downloading":
+                logging.info(f"🔘 BUTTON CLICK: Download already in progress for {clean_language}")
+                return
+            # Start download instead of generation
+            logging.info(f"🔘 BUTTON CLICK: Starting download for {clean_language} (code: {lang_code})")
+            future = self.download_executor.submit(self._download_model_in_background, lang_code)
+            logging.info(f"🔘 BUTTON CLICK: Download thread submitted, future: {future}")
+            self.generate_button.setText("Downloading...")
+            self.generate_button.setEnabled(False)
+            return
+
+        if self.generation_future and self.generation_future.running():
+            self._show_toast("Subtitle generation is already in progress.")
+            return
+        
+        english_srt_path = self._get_subtitle_path(current_file_path, "en")
+        output_path = self._get_subtitle_path(current_file_path, lang_code)
+
+        task_type = ""
+        if embedded_track is not None:
+            task_type = "extract"
+            output_path = self.subtitle_store.path_for(media_fingerprint(current_file_path), "embedded", lang_code)
+            self._show_toast(f"Using the {clean_language} subtitle track embedded in this file...")
+        elif not os.path.exists(english_srt_path) and self.queue_prefetcher is not None and self.queue_prefetcher.current == current_file_path:
+            # Already being transcribed in the background, pick it up once that finishes
+            self.progress_text.setVisible(True)
+            self.progress_text.setText("Preparing English subtitles in background...")
+            QTimer.singleShot(3000, lambda: self._on_language_changed(self.language_selector_combo.currentText()))
+            return
+        elif not os.path.exists(english_srt_path):
+            if (clean_language != "English" and self.settings_manager.get_pipelined_translation()
+                    and self.download_status.get(clean_language, {}).get("status") == "downloaded"):
+                task_type = "pipeline"
+                self.settings_manager.set_last_translation_language(lang_code)
+                self._show_toast(f"Generating English and {clean_language} subtitles together...")
+            else:
+                task_type = "transcribe"
+                self._show_toast("English subtitles not found. Generating English base file...")
+        elif clean_language != "English":
+            task_type = "translate"
+            self.settings_manager.set_last_translation_language(lang_code)
+            self._show_toast(f"Generating {clean_language} subtitles by translation...")
+        else:
+            self._show_toast("English subtitles already exist. Skipping generation.")
+            self.generate_button.setVisible(False)
+            return
+            
+        self.generate_button.setEnabled(False)
+        self.generate_button.setVisible(False)  # Hide button completely during generation
+        self.progress_bar.setVisible(True)
+        self.progress_text.setVisible(True)
+        self.progress_bar.setValue(0)
+        
+        # Disable language dropdown and accuracy switch during any subtitle generation
+        self.language_selector_combo.setEnabled(False)
+        self.accuracy_switch.setEnabled(False)
+        self.batched_switch.setEnabled(False)
+        self.multi_translate_button.setEnabled(False)
+        
+        self.progress_bar.setRange(0, 100)
+
+        # Get video duration, use fallback if not available yet
+        video_duration_seconds = self.media_duration
+        if video_duration_seconds <= 0:
+            try:
+                video_duration_seconds = self.mpv_player.duration or 600  # 10 min fallback
+            except:
+                video_duration_seconds = 600  # 10 min fallback
+        
+        self.estimated_total_time = self._calculate_estimated_time(video_duration_seconds, lang_code)
+        self.generation_media_duration = video_duration_seconds
+        self.generation_speed_key = self._get_speed_key(lang_code if task_type == "translate" else "en")
+        self.generation_variant = None
+        if task_type == "pipeline":
+            # The stages overlap, so the slower one sets the pace
+            self.estimated_total_time = max(self._calculate_estimated_time(video_duration_seconds, "en"),
+                                            self.estimated_total_time)
+            self.generation_speed_key = None
+        if task_type == "extract":
+            # Demuxing is near-instant and says nothing about transcription speed
+            self.estimated_total_time = 5
+            self.generation_speed_key = None
+            self.generation_variant = "embedded"
+        
+        logging.debug(f"Video duration: {video_duration_seconds}s, Lang: {lang_code}, Estimated time: {self.estimated_total_time}s")
+        
+        estimated_time_str = str(timedelta(seconds=int(self.estimated_total_time)))
+        self.progress_text.setText(f"Estimated time: {estimated_time_str}")
+        self.generation_start_time = time.time()
+        self.generation_progress = JobProgress()
+        self.generation_output_path = output_path
+        self.generation_media_path = current_file_path
+        self.generation_lang_code = "en" if task_type == "transcribe" else lang_code
+        self.generation_scheduler = None
+        self.generation_cancel_token = CancelToken()
+
+        if task_type == "extract":
+            self.generation_future = self.subtitle_executor.submit(
+                self._extract_embedded_subtitles,
+                current_file_path,
+                embedded_track,
+                output_path,
+                self.generation_progress,
+                self.generation_cancel_token,
+            )
+        elif task_type == "transcribe":
+            if self.settings_manager.get_playhead_first():
+                self.generation_scheduler = PlayheadScheduler(playhead=self.media_position)
+            self.generation_future = self.subtitle_executor.submit(
+                self._generate_subtitles_from_audio,
+                current_file_path,
+                "en",
+                english_srt_path,
+                self.generation_progress,
+                self.generation_scheduler,
+                False,
+                self.generation_cancel_token,
+            )
+        elif task_type == "pipeline":
+            if self.settings_manager.get_playhead_first():
+                self.generation_scheduler = PlayheadScheduler(playhead=self.media_position)
+            self.generation_future = self.subtitle_executor.submit(
+                self._generate_pipelined,
+                current_file_path,
+                lang_code,
+                english_srt_path,
+                output_path,
+                self.generation_progress,
+                self.generation_scheduler,
+                self.generation_cancel_token,
+            )
+        elif task_type == "translate":
+            self.generation_future = self.translation_executor.submit(
+                self._translate_subtitles_from_english,
+                english_srt_path,
+                lang_code,
+                output_path,
+                self.generation_progress,
+                self.generation_cancel_token,
+                False,
+            )
+        
+        # Show initial progress message in subtitle area
+        estimated_minutes = int(self.estimated_total_time / 60)
+        estimated_seconds = int(self.estimated_total_time % 60)
+        if task_type == "extract":
+            self.subtitle_label.setText("EXTRACTING EMBEDDED SUBTITLES....")
+        elif task_type in ("transcribe", "pipeline"):
+            self.subtitle_label.setText(f"GENERATING SUBTITLES.... ({estimated_minutes}m {estimated_seconds}s estimated)")
+        else:
+            self.subtitle_label.setText(f"TRANSLATING SUBTITLES.... ({estimated_minutes}m {estimated_seconds}s estimated)")
+        self.subtitle_label.setVisible(True)
+        
+        self.generation_progress_timer.start()
+        
+        # In pipelined mode the growing file is the translated one
+        if task_type in ("transcribe", "pipeline") and self.settings_manager.get_live_subtitle_reload():
+            self.partial_subtitle_path = partial_path(output_path)
+            self.partial_subtitle_size = 0
+            self.subtitle_reload_timer.start()
+
+    def _show_multi_translate_dialog(self):
+        if self.current_media_index == -1:
+            self._show_toast("No media loaded.")
+            return
+        if self._is_generation_running():
+            self._show_toast("Subtitle generation is already in progress.")
+            return
+        current_file_path = self.media_queue[self.current_media_index]
+        if current_file_path not in self.embedded_subtitle_tracks:
+            self._show_toast("Still reading the file's subtitle tracks, try again in a moment.")
+            return
+        if not os.path.exists(self._get_subtitle_path(current_file_path, "en")):
+            self._show_toast("Generate English subtitles first.")
+            return
+        languages = [(name, code) for name, code in self.languages_list.items()
+                     if code != "en" and self.download_status.get(name, {}).get("status") == "downloaded"
+                     and not self._subtitle_available(self._get_subtitle_path(current_file_path, code))]
+        if not languages:
+            self._show_toast("No downloaded languages left to translate for this file.")
+            return
+        dialog = MultiTranslateDialog(languages, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted and dialog.selected_codes:
+            self._start_multi_translation(dialog.selected_codes)
+
+    def _start_multi_translation(self, lang_codes):
+        current_file_path = self.media_queue[self.current_media_index]
+        english_srt_path = self._get_subtitle_path(current_file_path, "en")
+        
+        self.generate_button.setVisible(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
+        self.progress_text.setVisible(True)
+        self.progress_text.setText(f"Translating into {len(lang_codes)} languages...")
+        self.language_selector_combo.setEnabled(False)
+        self.accuracy_switch.setEnabled(False)
+        self.batched_switch.setEnabled(False)
+        self.multi_translate_button.setEnabled(False)
+        
+        # The slowest language decides the wall time when they run side by side
+        self.estimated_total_time = max(self._calculate_estimated_time(self.media_duration, code) for code in lang_codes)
+        self.generation_start_time = time.time()
+        self.generation_progress = ProgressGroup(lang_codes)
+        self.generation_output_path = None
+        self.generation_media_path = current_file_path
+        self.generation_media_duration = self.media_duration
+        self.generation_lang_code = None
+        self.generation_speed_key = None
+        self.generation_variant = None
+        self.generation_scheduler = None
+        self.generation_cancel_token = CancelToken()
+        self.generation_future = self.translation_executor.submit(
+            self.translate_to_languages,
+            english_srt_path,
+            current_file_path,
+            lang_codes,
+            self.generation_progress,
+            self.generation_cancel_token,
+        )
+        self.subtitle_label.setText("TRANSLATING SUBTITLES....")
+        self.subtitle_label.setVisible(True)
+        self.generation_progress_timer.start()
+
+    def _reload_partial_subtitles(self):
+        """Load or refresh the growing subtitle file so finished cues show while generation runs"""
+        path = self.partial_subtitle_path
+        if not path or not os.path.exists(path):
+            return
+        size = os.path.getsize(path)
+        if size == 0 or size == self.partial_subtitle_size:
+            return
+        self.partial_subtitle_size = size
+        try:
+            if self.partial_subtitle_track is None:
+                self.mpv_player.sub_add(path.replace('\\', '/'))
+                self.partial_subtitle_track = self.mpv_player.sid
+                logging.info(f"Live subtitle track added: {path}")
+            else:
+                self.mpv_player.command('sub-reload', self.partial_subtitle_track)
+        except Exception as e:
+            logging.error(f"Error reloading partial subtitle file: {e}")
+
+    def _drop_partial_subtitles(self):
+        """Stop live reloading and remove the temporary track from mpv"""
+        self.subtitle_reload_timer.stop()
+        if self.partial_subtitle_track is not None:
+            try:
+                self.mpv_player.command('sub-remove', self.partial_subtitle_track)
+            except Exception as e:
+                logging.error(f"Error removing partial subtitle track: {e}")
+        self.partial_subtitle_path = None
+        self.partial_subtitle_track = None
+        self.partial_subtitle_size = 0
+
+    def _update_progress_bar(self):
+        future = self.generation_future
+        output_path = self.generation_output_path
+        if future is None:
+            self.generation_progress_timer.stop()
+            return
+        if future.done():
+            self.generation_progress_timer.stop()
+            self.progress_bar.setValue(100)
+            self.subtitle_label.setVisible(False)  # Hide progress message
+            self._finalize_generation(future, output_path)
+        else:
+            # Real progress reported by the worker; ETA comes from its measured throughput
+            fraction, remaining_time, stage = self.generation_progress.snapshot()
+            if remaining_time is None:
+                # Nothing measured yet (audio decode, model load), fall back to the rough estimate
+                elapsed_time = time.time() - self.generation_start_time
+                remaining_time = max(0, self.estimated_total_time - elapsed_time)
+            progress_percentage = int(fraction * 100)
+            self.progress_bar.setValue(progress_percentage)
+            remaining_minutes = int(remaining_time / 60)
+            remaining_seconds = int(remaining_time % 60)
+            if isinstance(self.generation_progress, ProgressGroup):
+                self.progress_text.setText(f"{self.generation_progress.describe()} - {remaining_minutes}m {remaining_seconds}s left")
+            else:
+                self.progress_text.setText(f"{stage}... Remaining: {remaining_minutes}m {remaining_seconds}s ({progress_percentage}%)")
+            # Show progress in subtitle area, unless live subtitles are already showing there
+            if self.partial_subtitle_track is None:
+                current_language = self.language_selector_combo.currentText().split(' (')[0]
+                if current_language == "English":
+                    self.subtitle_label.setText(f"GENERATING SUBTITLES.... {progress_percentage}% ({remaining_minutes}m {remaining_seconds}s remaining)")
+                else:
+                    self.subtitle_label.setText(f"TRANSLATING SUBTITLES.... {progress_percentage}% ({remaining_minutes}m {remaining_seconds}s remaining)")
+                self.subtitle_label.setVisible(True)
+
+    def _finalize_generation(self, future, output_path):
+        self._drop_partial_subtitles()
+        self.generation_scheduler = None
+        if self.generation_cancel_token is not None and self.generation_cancel_token.cancelled:
+            # The user moved on; nothing to load for the media now playing
+            self.progress_text.setText("Generation cancelled")
+            self._cleanup_generation_ui()
+            return
+        # Keep UI disabled until SRT is loaded
+        try:
+            result = future.result()
+            if isinstance(result, dict):
+                # Multi-language run: files are already written and registered by the worker
+                done = [self._get_language_name(code) for code, ok in result.items() if ok]
+                failed = [self._get_language_name(code) for code, ok in result.items() if not ok]
+                self.progress_text.setText(f"Translated: {', '.join(done) or 'none'}" + (f" | Failed: {', '.join(failed)}" if failed else ""))
+                self._show_toast(f"✅ {len(done)} of {len(result)} languages translated")
+                self._update_queue_item_status(self.generation_media_path)
+                self._cleanup_generation_ui()
+            elif result:
+                subtitle_data = result if isinstance(result, str) else None
+                # Learn this machine's real speed for the next estimate
+                if self.generation_speed_key and self.generation_media_duration > 0:
+                    elapsed_time = time.time() - self.generation_start_time
+                    self.settings_manager.record_measured_speed(self.generation_speed_key, elapsed_time / self.generation_media_duration)
+                
+                # Show loading message
+                self.progress_text.setText("Loading subtitle file...")
+                
+                try:
+                    if subtitle_data or (os.path.exists(output_path) and os.path.getsize(output_path) > 0):
+                        self._load_subtitle_track(output_path, self.generation_lang_code, subtitle_data)
+                        logging.info(f"Subtitle loaded successfully: {output_path}")
+                        self._show_toast("✅ Subtitles generated and loaded!")
+                    else:
+                        logging.error(f"Subtitle file is empty or doesn't exist: {output_path}")
+                        self._show_toast("Subtitle file is empty or corrupted")
+                except Exception as e:
+                    logging.error(f"Error loading generated subtitle: {e}")
+                    self._show_toast("Subtitles generated but failed to load")
+                # Written (if still only in memory) and indexed off the GUI thread
+                self._persist_subtitle(output_path, subtitle_data, self.generation_media_path,
+                                       self.generation_lang_code, self.generation_variant)
+                self._cleanup_generation_ui()
+                if self.generation_lang_code == "en":
+                    self._prewarm_models(self.generation_media_path)
+            else:
+                if self.generation_variant == "embedded":
+                    # Fall back to Whisper/translation next time instead of retrying the broken track
+                    self.failed_embedded_tracks.add((self.generation_media_path, self.generation_lang_code))
+                self.progress_text.setText("❌ Generation failed.")
+                self._show_toast("Error generating subtitles. Check console for details.")
+                self._cleanup_generation_ui()
+        except Exception as e:
+            if "cancelled" in str(e).lower() or "interrupted" in str(e).lower():
+                self._show_toast("⚠️ Subtitle generation interrupted")
+                self.progress_text.setText("Generation interrupted")
+            else:
+                self._show_toast(f"An error occurred: {str(e)}")
+                self.progress_text.setText(f"Error: {e}")
+            self._cleanup_generation_ui()
+    
+    def _cleanup_generation_ui(self):
+        """Clean up generation UI elements after completion"""
+        self.generate_button.setEnabled(True)
+        self.generate_button.setVisible(True)
+        self.language_selector_combo.setEnabled(True)
+        self.accuracy_switch.setEnabled(True)
+        self.batched_switch.setEnabled(True)
+        self.multi_translate_button.setEnabled(True)
+        
+        # Delay hiding progress elements to avoid flicker
+        QTimer.singleShot(1000, lambda: [
+            self.progress_bar.setVisible(False), 
+            self.progress_text.setVisible(False),
+            self._on_language_changed(self.language_selector_combo.currentText())
+        ])
+
+    def _get_app_base_path(self):
+        # Get correct base path for both script and EXE
+        if getattr(sys, 'frozen', False):
+            return sys._MEIPASS
+        return os.path.dirname(os.path.abspath(__file__))
+
+    def _get_whisper_model_path(self):
+        model_subdir = "small" if self.settings_manager.get_accuracy_mode() == "slow" else "base"
+        return os.path.join(self._get_app_base_path(), "whisper", model_subdir)
+
+    def _load_audio(self, ffmpeg_cmd, media_path, cancel_token=None):
+        """16 kHz mono float32 audio, memory-mapped from the audio cache when possible"""
+        if self.audio_cache.max_bytes > 0:
+            try:
+                fingerprint = media_fingerprint(media_path)
+                audio = self.audio_cache.get(fingerprint)
+                if audio is None:
+                    audio = self.audio_cache.put_from_ffmpeg(fingerprint, ffmpeg_cmd, media_path, cancel_token)
+                return audio
+            except OSError as e:
+                logging.warning(f"Audio cache unavailable, decoding in memory: {e}")
+        # Decode straight to 16 kHz mono float32 PCM, no lossy re-encode or temp file
+        return read_pcm_audio(ffmpeg_cmd, media_path, cancel_token)
+
+    def _transcribe_in_worker(self, audio, start, end, model_path, whisper_config, lang_code, vad_filter, on_segment, cancel_token):
+        """Decode audio[start:end] in the Whisper worker, sequential or batched per the inference mode setting
+
+        on_segment receives each segment dict as the worker decodes it.
+        """
+        params = dict(whisper_config, model_path=model_path, lang_code=lang_code, vad_filter=vad_filter,
+                      **audio_job_params(audio, start, end))
+        if vad_filter and self.settings_manager.get_inference_mode() == "batched":
+            params["batch_size"] = self.settings_manager.get_batch_size()
+        return self.whisper_worker.run("transcribe", params, on_progress=on_segment, cancel_token=cancel_token)
+
+    def _split_audio(self, audio, target_chunk_seconds, vad_filter, cancel_token):
+        """(start, end) sample chunks of about target_chunk_seconds, cut inside silences when VAD is available
+
+        VAD runs in the Whisper worker so onnxruntime is never loaded into the player.
+        """
+        if not vad_filter:
+            return split_fixed(len(audio), target_chunk_seconds)
+        params = dict(audio_job_params(audio), target_chunk_seconds=target_chunk_seconds)
+        return self.whisper_worker.run("split_audio", params, cancel_token=cancel_token)["chunks"]
+
+    def _generate_subtitles_from_audio(self, video_path, lang_code, output_path, progress=None, scheduler=None, background=False, cancel_token=None, pipeline=None):
+        try:
+            logging.info("Starting audio transcribe process.")
+            progress = progress or JobProgress()
+            cancel_token = cancel_token or CancelToken()
+            progress.set_stage("Extracting audio")
+            ffmpeg_cmd = self.tool_resolver.resolve("ffmpeg")
+            if not ffmpeg_cmd:
+                raise FileNotFoundError("FFmpeg not found in any expected location")
+            
+            audio = self._load_audio(ffmpeg_cmd, video_path, cancel_token)
+            cancel_token.raise_if_cancelled()
+            logging.info("Audio extraction successful.")
+            
+            # Get accuracy mode and set model path
+            accuracy_mode = self.settings_manager.get_accuracy_mode()
+            model_path = self._get_whisper_model_path()
+            
+            logging.info(f"Using {accuracy_mode} mode with model: {model_path}")
+            
+            if not background and not self.hardware_tuner.is_tuned(accuracy_mode):
+                progress.set_stage("Calibrating for this PC")
+                self.hardware_tuner.calibrate(accuracy_mode, model_path, audio, lang_code, cancel_token)
+                self.tuning_updated.emit()
+            whisper_config = self.hardware_tuner.get_config(accuracy_mode)
+            logging.info(f"Whisper settings: {whisper_config}")
+            
+            # Check if ONNX is available for VAD filtering
+            try:
+                import onnxruntime
+                vad_available = True
+            except:
+                vad_available = False
+                logging.warning("VAD filtering disabled (ONNX not available)")
+            
+            # Cues are appended to a .partial.srt as they are decoded so mpv can show them early
+            with SrtStreamWriter(output_path) as srt_writer:
+                writer = srt_writer
+                if pipeline is not None:
+                    # Every cue written here is also queued for translation
+                    writer = pipeline.tee(writer)
+                # Long media is split at silences and decoded across worker processes
+                workers = self.settings_manager.get_parallel_workers() or auto_worker_count()
+                audio_duration = len(audio) / SAMPLE_RATE
+                # Batched mode already keeps every core busy in one process, so it replaces the pool
+                batched = self.settings_manager.get_inference_mode() == "batched" and vad_available
+                use_pool = (not batched and workers > 1 and vad_available
+                            and audio_duration >= self.settings_manager.get_parallel_min_duration())
+                # In batched mode each window should hold about one full batch of 30 s speech chunks
+                window_seconds = max(self.playhead_window_seconds, 30 * self.settings_manager.get_batch_size()) if batched else self.playhead_window_seconds
+                if background:
+                    # Queue prefetch: one low-priority worker process so playback keeps the CPU
+                    progress.begin(audio_duration, "Transcribing")
+                    chunks = self._split_audio(audio, CHUNK_SECONDS, vad_available, cancel_token)
+                    transcribe_parallel(audio, chunks, model_path, lang_code, 1, whisper_config["compute_type"], vad_filter=vad_available,
+                                        low_priority=True, total_threads=whisper_config["cpu_threads"],
+                                        on_segment=lambda segment: writer.write(segment['start'], segment['end'], segment['text']),
+                                        cancel_token=cancel_token)
+                elif scheduler is not None and audio_duration > 2 * window_seconds:
+                    # Windows around the playhead go first; the file is rewritten in order as each lands
+                    scheduler.set_chunks(self._split_audio(audio, window_seconds, vad_available, cancel_token))
+                    def on_chunk(index, segments):
+                        writer.rewrite(scheduler.merged_segments())
+                        progress.update(scheduler.covered_seconds())
+                    progress.begin(audio_duration, "Transcribing")
+                    if use_pool:
+                        transcribe_scheduled(audio, scheduler, model_path, lang_code, workers, whisper_config["compute_type"],
+                                             vad_filter=vad_available, on_chunk=on_chunk, cancel_token=cancel_token,
+                                             total_threads=whisper_config["cpu_threads"])
+                    else:
+                        index = scheduler.next_chunk()
+                        while index is not None:
+                            cancel_token.raise_if_cancelled()
+                            start, end = scheduler.chunks[index]
+                            segments = []
+                            self._transcribe_in_worker(audio, start, end, model_path, whisper_config, lang_code, vad_available,
+                                                       segments.append, cancel_token)
+                            scheduler.add_result(index, segments)
+                            on_chunk(index, segments)
+                            index = scheduler.next_chunk()
+                elif use_pool:
+                    def on_segment(segment):
+                        writer.write(segment['start'], segment['end'], segment['text'])
+                        progress.update(segment['end'])
+                    progress.begin(audio_duration, "Transcribing")
+                    chunks = self._split_audio(audio, CHUNK_SECONDS, vad_available, cancel_token)
+                    transcribe_parallel(audio, chunks, model_path, lang_code, workers, whisper_config["compute_type"],
+                                        vad_filter=vad_available, on_segment=on_segment, cancel_token=cancel_token,
+                                        total_threads=whisper_config["cpu_threads"])
+                else:
+                    def on_segment(segment):
+                        writer.write(segment['start'], segment['end'], segment['text'])
+                        progress.update(segment['end'])
+                    progress.begin(audio_duration, "Transcribing")
+                    # The worker reuses its loaded model instead of loading it per job
+                    result = self._transcribe_in_worker(audio, 0, len(audio), model_path, whisper_config, lang_code, vad_available,
+                                                        on_segment, cancel_token)
+                    
+                    stats = result["cache_stats"]
+                    logging.info(f"Whisper model cache: {stats['hits']} hits, {stats['misses']} misses, "
+                                 f"avg load {stats['avg_load_time']:.1f}s, ~{stats['load_time_saved']:.1f}s saved")
+            logging.info("Transcribe complete.")
+            # The text goes to mpv as is; True still marks success when nothing was spoken
+            return srt_writer.text() or True
+            
+        except JobCancelled:
+            # Cancelling ended the worker process, so no model is left resident
+            logging.info(f"Transcription cancelled: {os.path.basename(video_path)}")
+            return False
+        except Exception as e:
+            error_msg = f"THREAD LOG: ERROR: An unexpected error occurred: {str(e)}"
+            logging.error(error_msg)
+            print(error_msg)
+            return False
+
+    def _generate_pipelined(self, media_path, lang_code, english_srt_path, output_path, progress=None, scheduler=None, cancel_token=None):
+        """Transcribe English and translate its cues as they land, so both SRTs grow together
+
+        Wall time is roughly the slower of the two stages instead of their sum.
+        Translation runs on pipeline_worker, so the per-batch jobs neither
+        queue behind nor recycle the shared inference worker.
+        """
+        progress = progress or JobProgress()
+        cancel_token = cancel_token or CancelToken()
+        worker = self.pipeline_worker
+        # Filled by every pipeline batch, recorded as one speed sample once the job is done
+        measurements = {}
+        pipeline = TranslationPipeline(
+            output_path,
+            lambda texts: self._translate_lines(texts, lang_code, worker, JobProgress(), cancel_token, measurements),
+            cancel_token,
+        )
+        try:
+            logging.info(f"Pipelined English transcription and {lang_code} translation: {os.path.basename(media_path)}")
+            if not self._generate_subtitles_from_audio(media_path, "en", english_srt_path, progress, scheduler, False,
+                                                       cancel_token, pipeline):
+                pipeline.abort()
+                return False
+            self._register_subtitle(media_path, "en")
+            progress.set_stage("Translating last lines")
+            pipeline.finish()
+            logging.info(f"Pipelined translation wrote {pipeline.translated} {lang_code} cues")
+            if measurements.get("backend"):
+                self._record_translation_speed(lang_code, measurements["backend"], measurements["tokens"],
+                                               measurements["elapsed"], measurements.get("benchmark", {}))
+            return pipeline.text() or True
+        except JobCancelled:
+            logging.info(f"Pipelined translation to {lang_code} cancelled.")
+            return False
+        except Exception as e:
+            logging.error(f"ERROR: Pipelined translation to {lang_code} failed: {e}")
+            return False
+
+    def _get_translation_model_revision(self, lang_code, backend=None):
+        """Hugging Face snapshot of the opus-mt pair and the backend decoding it
+
+        A model update or a backend switch then invalidates remembered lines.
+        backend defaults to the one that last translated this language, else the configured one.
+        """
+        backend = backend or self.translation_backends_used.get(lang_code) or self.settings_manager.get_translation_backend()
+        refs_file = os.path.join(os.environ.get('HF_HOME', ''), 'hub', f"models--Helsinki-NLP--opus-mt-en-{lang_code}", 'refs', 'main')
+        try:
+            with open(refs_file, 'r') as f:
+                return f"opus-mt@{f.read().strip()}/{revision_tag(backend)}"
+        except OSError:
+            return f"opus-mt/{revision_tag(backend)}"
+
+    def _parse_srt_for_translation(self, english_srt_path):
+        cues = load_cues(english_srt_path)
+        logging.info(f"Parsed {len(cues)} subtitle segments.")
+        return cues
+
+    def _record_translation_speed(self, target_lang_code, backend, tokens, elapsed, benchmark):
+        """Store the measured speed of the backend used, plus any benchmark of the other one"""
+        if elapsed > 0:
+            tokens_per_second = tokens / elapsed
+            logging.info(f"Translated to {target_lang_code} with {backend} at ~{tokens_per_second:.0f} source tokens/s")
+            self.settings_manager.record_translation_speed(target_lang_code, backend, tokens_per_second)
+        for other_backend, tokens_per_second in benchmark.items():
+            if other_backend != backend:
+                self.settings_manager.record_translation_speed(target_lang_code, other_backend, tokens_per_second)
+        if benchmark:
+            logging.info(f"Translation backend comparison ({target_lang_code}): "
+                         + ", ".join(f"{name} ~{speed:.0f} tokens/s" for name, speed in benchmark.items()))
+
+    def _translate_lines(self, all_english_text, target_lang_code, worker, progress, cancel_token, measurements=None):
+        """Translation memory lookup, then planned batches for the misses on the given inference worker
+
+        Speeds are recorded per call. A caller translating one file in many small
+        calls passes a measurements dict instead, which collects the totals for it to record once.
+        """
+        progress.begin(len(all_english_text), "Translating")
+        
+        # Look every line up in the translation memory first, only misses go to the model
+        revision = self._get_translation_model_revision(target_lang_code)
+        remembered = self.translation_memory.lookup_many(all_english_text, target_lang_code, revision)
+        line_keys = [normalize_text(text) for text in all_english_text]
+        miss_keys = [key for key in line_keys if key not in remembered]
+        hit_lines = len(line_keys) - len(miss_keys)
+        progress.update(hit_lines)
+        
+        if miss_keys:
+            # Identical lines collapse and similar lengths share a batch, so less padding is decoded
+            plan = TranslationPlan(miss_keys, max_batch_lines=32, max_batch_tokens=1024)
+            logging.info(f"Translation plan ({target_lang_code}): {plan.summary()}")
+            # Worker progress counts unique lines; scale it to subtitle lines for the bar
+            scale = len(miss_keys) / len(plan.unique)
+            # Until both backends have been timed for this language, compare them once on a sample batch
+            benchmark = (self.settings_manager.get_translation_backend() != "easynmt"
+                         and len(self.settings_manager.get_translation_speed(target_lang_code)) < 2
+                         and not (measurements or {}).get("benchmark"))
+            result = worker.run(
+                "translate",
+                {"batches": plan.batch_texts(), "target_lang": target_lang_code, "benchmark": benchmark},
+                on_progress=lambda done: progress.update(hit_lines + int(done * scale)),
+                cancel_token=cancel_token,
+            )
+            translated_unique = plan.scatter(result["batches"])
+            # "auto" can fall back to EasyNMT, so the lines are stored under the backend that actually ran
+            self.translation_backends_used[target_lang_code] = result["backend"]
+            store_revision = self._get_translation_model_revision(target_lang_code, result["backend"])
+            self.translation_memory.store_many(zip(miss_keys, translated_unique), target_lang_code, store_revision)
+            remembered.update(zip(miss_keys, translated_unique))
+            logging.info(f"Translated {len(plan.unique)} unique lines to {target_lang_code} in {result['elapsed']:.1f}s")
+            if measurements is None:
+                self._record_translation_speed(target_lang_code, result["backend"], plan.real_tokens, result["elapsed"],
+                                               result.get("benchmark", {}))
+            else:
+                measurements["backend"] = result["backend"]
+                measurements["tokens"] = measurements.get("tokens", 0) + plan.real_tokens
+                measurements["elapsed"] = measurements.get("elapsed", 0.0) + result["elapsed"]
+                if result.get("benchmark"):
+                    measurements["benchmark"] = result["benchmark"]
+            stats = result["pool_stats"]
+            logging.info(f"Translation model pool: {stats['hit_rate']:.0%} hit rate ({stats['hits']} hits, "
+                         f"{stats['misses']} loads, avg load {stats['avg_load_time']:.1f}s), loaded: {stats['loaded']}")
+        
+        memory_stats = self.translation_memory.get_stats(target_lang_code)
+        logging.info(f"Translation memory: {hit_lines}/{len(all_english_text)} lines reused in this file, "
+                     f"{memory_stats['hit_rate']:.0%} of {memory_stats['lookups']} lines overall for {target_lang_code}")
+        return [remembered[key] for key in line_keys]
+
+    def _translate_subtitles_from_english(self, english_srt_path, target_lang_code, output_path, progress=None, cancel_token=None, persist=True):
+        """Translate the English SRT and return the translated SRT text
+
+        With persist=False nothing is written; the caller loads the text into
+        mpv and saves it with _persist_subtitle.
+        """
+        try:
+            logging.info(f"Starting translation from English SRT to {target_lang_code}.")
+            progress = progress or JobProgress()
+            cancel_token = cancel_token or CancelToken()
+            progress.set_stage("Loading model")
+            
+            cues = self._parse_srt_for_translation(english_srt_path)
+            
+            logging.info("Starting batch translation...")
+            translated_text_block = self._translate_lines(cues.texts, target_lang_code, self.inference_worker,
+                                                          progress, cancel_token)
+            logging.info("Batch translation completed.")
+            
+            srt_text = cues.to_srt(translated_text_block)
+            if persist:
+                write_text_atomic(output_path, srt_text)
+
+            logging.info(f"Translation to {target_lang_code} complete.")
+            return srt_text or True
+
+        except JobCancelled:
+            # The worker process was killed, which also released the model
+            logging.info(f"Translation to {target_lang_code} cancelled.")
+            return False
+        except Exception as e:
+            logging.error(f"ERROR: An unexpected error occurred during translation: {str(e)}")
+            import traceback
+            logging.error(f"Full traceback: {traceback.format_exc()}")
+            return False
+
+    def _fanout_concurrency(self, lang_codes):
+        """Languages to translate at once: bounded by physical cores and by RAM for one model each"""
+        physical_cores, _ = core_layout()
+        by_cores = max(1, physical_cores // 2)
+        hf_cache = os.path.join(os.environ.get('HF_HOME', ''), 'hub')
+        model_mb = max([estimate_model_memory_mb(os.path.join(hf_cache, f"models--Helsinki-NLP--opus-mt-en-{code}"))
+                        for code in lang_codes] + [1])
+        available_mb = available_memory_mb() - self.settings_manager.get_prewarm_reserve_mb()
+        by_memory = max(1, int(available_mb // model_mb))
+        return max(1, min(len(lang_codes), by_cores, by_memory))
+
+    def translate_to_languages(self, english_srt_path, media_path, lang_codes, progress=None, cancel_token=None):
+        """Translate one English SRT into several languages, parsing it once and running languages concurrently
+
+        Every finished language is written and registered like a single
+        translation. progress, if given, is a ProgressGroup keyed by language
+        code. Returns {lang_code: success}.
+        """
+        progress = progress or ProgressGroup(lang_codes)
+        cancel_token = cancel_token or CancelToken()
+        cues = self._parse_srt_for_translation(english_srt_path)
+
+        concurrency = self._fanout_concurrency(lang_codes)
+        logging.info(f"Translating {os.path.basename(media_path)} into {lang_codes}, {concurrency} at a time")
+        if concurrency == 1:
+            workers = [self.inference_worker]
+        else:
+            # Temporary workers, each limited to its share of the cores so they do not fight over them
+            physical_cores, _ = core_layout()
+            workers = [InferenceWorker(max_jobs=len(lang_codes), config={
+                "translation_pool_size": 1,
+                "translation_pool_reserve_mb": self.settings_manager.get_translation_pool_reserve_mb(),
+                "translation_backend": self.settings_manager.get_translation_backend(),
+                "torch_threads": max(1, physical_cores // concurrency),
+            }) for _ in range(concurrency)]
+        idle_workers = Queue()
+        for worker in workers:
+            idle_workers.put(worker)
+
+        def translate_one(lang_code):
+            worker = idle_workers.get()
+            try:
+                translated = self._translate_lines(cues.texts, lang_code, worker, progress[lang_code], cancel_token)
+                cues.write_srt(self._get_subtitle_path(media_path, lang_code), translated)
+                self._register_subtitle(media_path, lang_code)
+                progress[lang_code].set_stage("Done")
+                return True
+            except JobCancelled:
+                progress[lang_code].set_stage("Cancelled")
+                return False
+            except Exception as e:
+                logging.error(f"Translation to {lang_code} failed: {e}")
+                progress[lang_code].set_stage("Failed")
+                return False
+            finally:
+                idle_workers.put(worker)
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = dict(zip(lang_codes, executor.map(translate_one, lang_codes)))
+        finally:
+            if concurrency > 1:
+                for worker in workers:
+                    worker.stop()
+        logging.info(f"Multi-language translation finished: {results}")
+        return results
+
+    def _update_status_bar(self, message):
+        logging.info(f"GUI_STATUS: {message}")
+
+    def _show_toast(self, message):
+        self.toast_label.setText(message)
+        self.toast_label.setVisible(True)
+        QTimer.singleShot(3000, lambda: self.toast_label.setVisible(False))
+
+    def _get_language_name(self, code):
+        for name, c in self.languages_list.items():
+            if c == code:
+                return name
+        return code
+
+    def _get_language_code(self, language):
+        language_map = {
+            "English": "en", "Spanish": "es", "French": "fr", "German": "de",
+            "Italian": "it", "Japanese": "jap", "Russian": "ru",
+            "Arabic": "ar", "Chinese": "zh", "Hindi": "hi",
+            "Dutch": "nl", "Swedish": "sv", "Ukrainian": "uk", "Urdu": "ur"
+        }
+        return language_map.get(language, "en")
+    
+    def _get_sidecar_path(self, video_path, lang_code):
+        base_name = os.path.splitext(os.path.basename(video_path))[0]
+        directory = os.path.dirname(video_path)
+        return os.path.join(directory, f"{base_name}.{lang_code}.srt")
+
+    def _get_subtitle_variant(self, lang_code):
+        # English depends on the Whisper model; translations also on the English they came from
+        variant = f"whisper-{self.settings_manager.get_accuracy_mode()}"
+        return variant if lang_code == "en" else f"{variant}.opus-mt"
+
+    def _get_subtitle_path(self, video_path, lang_code):
+        """Central store entry if one is indexed, otherwise a sidecar next to the media, otherwise the new store path
+
+        The store copy is the one loaded into mpv as it was generated; the
+        sidecar mirror of it is for other players and must not count as a different file.
+        """
+        sidecar_path = self._get_sidecar_path(video_path, lang_code)
+        try:
+            # GUI callers wait for the probe thread to fingerprint the file; only worker threads hash it here
+            fingerprint = known_fingerprint(video_path) or media_fingerprint(video_path)
+        except OSError:
+            return sidecar_path
+        # Tracks demuxed from the file itself are preferred over anything generated
+        embedded = self.subtitle_store.lookup(fingerprint, "embedded", lang_code)
+        if embedded:
+            return embedded
+        variant = self._get_subtitle_variant(lang_code)
+        stored = self.subtitle_store.lookup(fingerprint, variant, lang_code)
+        if stored:
+            return stored
+        if os.path.exists(sidecar_path):
+            return sidecar_path
+        return self.subtitle_store.path_for(fingerprint, variant, lang_code)
+
+    def _fingerprint_in_background(self, media_path):
+        """Fingerprint a queued file on the probe thread, then refresh its queue entry"""
+        def fingerprint():
+            try:
+                media_fingerprint(media_path)
+            except OSError as e:
+                logging.warning(f"Could not fingerprint {media_path}: {e}")
+                return
+            self.prefetch_updated.emit(media_path)
+
+        self.probe_executor.submit(fingerprint)
+
+    def _probe_subtitle_tracks(self, media_path):
+        """Runs on the probe thread when media opens; GUI slots only read the stored result"""
+        try:
+            # Memoized, so the store lookups in the slots only cost a stat
+            media_fingerprint(media_path)
+        except OSError as e:
+            logging.warning(f"Could not fingerprint {media_path}: {e}")
+        tracks = []
+        ffprobe_cmd = self.tool_resolver.resolve("ffprobe")
+        if ffprobe_cmd:
+            try:
+                tracks = probe_subtitle_tracks(ffprobe_cmd, media_path)
+            except Exception as e:
+                logging.warning(f"Could not read subtitle tracks of {media_path}: {e}")
+        self.embedded_subtitle_tracks[media_path] = tracks
+        self.subtitle_tracks_probed.emit(media_path)
+
+    @pyqtSlot(str)
+    def _on_subtitle_tracks_probed(self, media_path):
+        if self.current_media_index == -1 or self.media_queue[self.current_media_index] != media_path:
+            return
+        self._prewarm_models(media_path)
+        self._on_language_changed(self.language_selector_combo.currentText())
+
+    def _find_probed_track(self, media_path, lang_code):
+        """Embedded track for the language from the last probe of the media, without running ffprobe"""
+        return find_text_track(self.embedded_subtitle_tracks.get(media_path) or [], lang_code)
+
+    def _get_embedded_track(self, media_path, lang_code):
+        """Usable text subtitle track for the language inside the media file, if any (runs ffprobe, off the GUI thread only)"""
+        ffprobe_cmd = self.tool_resolver.resolve("ffprobe")
+        if not ffprobe_cmd:
+            return None
+        try:
+            return find_text_track(probe_subtitle_tracks(ffprobe_cmd, media_path), lang_code)
+        except Exception as e:
+            logging.warning(f"Could not read subtitle tracks of {media_path}: {e}")
+            return None
+
+    def _extract_embedded_subtitles(self, media_path, track, output_path, progress=None, cancel_token=None):
+        try:
+            progress = progress or JobProgress()
+            progress.set_stage("Extracting subtitle track")
+            ffmpeg_cmd = self.tool_resolver.resolve("ffmpeg")
+            if not ffmpeg_cmd:
+                raise FileNotFoundError("FFmpeg not found in any expected location")
+            start = time.time()
+            extract_subtitle_track(ffmpeg_cmd, media_path, track["index"], output_path, cancel_token)
+            logging.info(f"Extracted {track['codec']} subtitle track {track['index']} ({track['language']}) "
+                         f"in {time.time() - start:.2f}s")
+            return True
+        except JobCancelled:
+            logging.info(f"Subtitle extraction cancelled: {os.path.basename(media_path)}")
+            return False
+        except Exception as e:
+            logging.error(f"Error extracting embedded subtitle track: {e}")
+            return False
+
+    def _subtitle_available(self, path):
+        """On disk, or finished and still being written in the background"""
+        return path in self.pending_subtitle_writes or os.path.exists(path)
+
+    def _load_subtitle_track(self, path, lang_code=None, data=None):
+        """Show a subtitle in mpv, straight from memory when its text is at hand, reusing a track already added"""
+        # mpv parses memory text directly; no write-then-read through the disk
+        if data is None and path not in self.loaded_subtitle_tracks:
+            data = self.pending_subtitle_writes.get(path)
+        self.loaded_subtitle_tracks.load(path, lang_code, data)
+        # Lookups leave the LRU order alone; watching a subtitle is what counts as using it
+        self.subtitle_store.touch(path)
+
+    def _persist_subtitle(self, path, data, media_path, lang_code, variant=None):
+        """Write a subtitle that so far only exists in memory and index it, on the background writer"""
+        if data and not os.path.exists(path):
+            self.pending_subtitle_writes[path] = data
+
+        def persist():
+            try:
+                if path in self.pending_subtitle_writes:
+                    write_text_atomic(path, data)
+                self._register_subtitle(media_path, lang_code, variant)
+            except Exception as e:
+                logging.error(f"Error saving subtitle file {path}: {e}")
+            finally:
+                self.pending_subtitle_writes.pop(path, None)
+            self.prefetch_updated.emit(media_path)
+
+        self.subtitle_write_executor.submit(persist)
+
+    def _register_subtitle(self, media_path, lang_code, variant=None):
+        """Index a freshly generated subtitle in the store and mirror it next to the media"""
+        try:
+            fingerprint = media_fingerprint(media_path)
+            self.subtitle_store.register(fingerprint, variant or self._get_subtitle_variant(lang_code), lang_code,
+                                         self._get_sidecar_path(media_path, lang_code))
+        except Exception as e:
+            logging.error(f"Error registering subtitle in cache: {e}")
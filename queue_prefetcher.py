@@ -0,0 +1,71 @@
+import time
+import logging
+import threading
+
+from jobs import CancelToken
+
+
+class QueuePrefetcher:
+    """Background walker that prepares subtitles for upcoming media queue items"""
+
+    def __init__(self, prepare_fn, is_foreground_busy, poll_interval=2.0):
+        self.prepare_fn = prepare_fn
+        self.is_foreground_busy = is_foreground_busy
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._pending = []
+        self.current = None
+        self.cancel_token = None
+        self._thread = threading.Thread(target=self._run, name="queue-prefetcher", daemon=True)
+        self._thread.start()
+
+    def update_queue(self, media_paths):
+        """Replace the list of upcoming items; the item being prepared right now is finished first"""
+        with self._lock:
+            self._pending = [path for path in media_paths if path != self.current]
+        self._wakeup.set()
+
+    def cancel_current(self):
+        """Abandon the item being prepared, e.g. because it was removed from the queue"""
+        with self._lock:
+            token = self.cancel_token
+        if token is not None:
+            token.cancel()
+
+    def stop(self):
+        self._stopped = True
+        with self._lock:
+            self._pending = []
+        self.cancel_current()
+        self._wakeup.set()
+
+    def _next_item(self):
+        with self._lock:
+            if not self._pending:
+                return None
+            self.current = self._pending.pop(0)
+            self.cancel_token = CancelToken()
+            return self.current
+
+    def _run(self):
+        while not self._stopped:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            while not self._stopped:
+                # Never compete with the item the user is watching
+                while self.is_foreground_busy() and not self._stopped:
+                    time.sleep(self.poll_interval)
+                media_path = self._next_item()
+                if media_path is None or self._stopped:
+                    break
+                try:
+                    logging.info(f"Prefetching subtitles for {media_path}")
+                    self.prepare_fn(media_path, self.cancel_token)
+                except Exception as e:
+                    logging.error(f"Error prefetching subtitles for {media_path}: {e}")
+                finally:
+                    with self._lock:
+                        self.current = None
+                        self.cancel_token = None
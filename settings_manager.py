@@ -1,13 +1,42 @@
 import os
 import json
 import logging
+import threading
 
 class SettingsManager:
     def __init__(self):
         self.settings_file = os.path.join(os.path.expanduser("~"), ".zestsyncsetting.json")
         self.default_settings = {
-            "accuracy_mode": "fast"  # "fast" or "slow"
+            "accuracy_mode": "fast",  # "fast" or "slow"
+            "inference_mode": "sequential",  # "sequential" or "batched" (VAD chunks decoded together)
+            "batch_size": 8,  # speech chunks per forward pass in batched mode
+            "model_idle_timeout": 600,  # seconds before an unused Whisper model is unloaded
+            "parallel_workers": 0,  # transcription processes for long media, 0 = auto
+            "parallel_min_duration": 900,  # seconds of audio before the process pool is used
+            "live_subtitle_reload": True,  # show cues in mpv while English subtitles are still generating
+            "pipelined_translation": True,  # translate English cues as they are transcribed instead of after the file
+            "measured_speed": {},  # processing seconds per media second, learned from finished jobs
+            "playhead_first": True,  # transcribe the window around the playhead first, then work outward
+            "prefetch_queue": False,  # prepare subtitles for upcoming queue items in the background
+            "prefetch_languages": [],  # translation codes to prefetch, empty = last used language
+            "last_translation_language": None,
+            "subtitle_cache_max_mb": 500,  # size limit of the central subtitle store
+            "mirror_sidecar_subtitles": True,  # also copy generated subtitles next to the media file
+            "audio_cache_max_mb": 4096,  # disk budget for decoded audio reused across runs, 0 = off
+            "speculative_prewarm": True,  # start loading models as soon as media opens
+            "prewarm_reserve_mb": 1536,  # RAM that must stay free after a speculative model load
+            "inference_worker_max_jobs": 20,  # jobs before the inference worker process is replaced
+            "inference_worker_max_rss_mb": 6144,  # worker RSS that triggers a replacement after a job
+            "translation_pool_size": 3,  # opus-mt language models kept loaded between jobs
+            "translation_pool_reserve_mb": 1024,  # RAM kept free; older translation models are evicted first
+            "translation_backend": "auto",  # "auto" (int8 CTranslate2, EasyNMT fallback), "ctranslate2" or "easynmt"
+            "translation_speed": {},  # per language: source tokens/second measured for each translation backend
+            "tuned_whisper": {},  # per accuracy mode: calibrated cpu_threads/compute_type and rtf
+            "whisper_overrides": {}  # per accuracy mode: user-set values that win over the tuned ones
         }
+        # Worker threads record measurements while the GUI changes settings; every mutator holds it
+        # through its save_settings(), which takes it again, hence reentrant
+        self._lock = threading.RLock()
         self.settings = self.load_settings()
     
     def load_settings(self):
@@ -28,8 +57,13 @@ class SettingsManager:
     
     def save_settings(self):
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            with self._lock:
+                text = json.dumps(self.settings, indent=2)
+                # Written beside the real file and renamed, so a crash never leaves it half written
+                temp_file = self.settings_file + ".tmp"
+                with open(temp_file, 'w') as f:
+                    f.write(text)
+                os.replace(temp_file, self.settings_file)
             logging.info(f"Settings saved to {self.settings_file}")
         except Exception as e:
             logging.error(f"Error saving settings: {e}")
@@ -39,8 +73,145 @@ class SettingsManager:
     
     def set_accuracy_mode(self, mode):
         if mode in ["fast", "slow"]:
-            self.settings["accuracy_mode"] = mode
-            self.save_settings()
+            with self._lock:
+                self.settings["accuracy_mode"] = mode
+                self.save_settings()
             logging.info(f"Accuracy mode set to: {mode}")
         else:
-            logging.error(f"Invalid accuracy mode: {mode}")
\ No newline at end of file
+            logging.error(f"Invalid accuracy mode: {mode}")
+
+    def get_inference_mode(self):
+        return self.settings.get("inference_mode", "sequential")
+
+    def set_inference_mode(self, mode):
+        if mode in ["sequential", "batched"]:
+            with self._lock:
+                self.settings["inference_mode"] = mode
+                self.save_settings()
+            logging.info(f"Inference mode set to: {mode}")
+        else:
+            logging.error(f"Invalid inference mode: {mode}")
+
+    def get_batch_size(self):
+        return self.settings.get("batch_size", 8)
+
+    def set_batch_size(self, batch_size):
+        with self._lock:
+            self.settings["batch_size"] = max(1, int(batch_size))
+            self.save_settings()
+
+    def get_model_idle_timeout(self):
+        return self.settings.get("model_idle_timeout", 600)
+
+    def get_parallel_workers(self):
+        return self.settings.get("parallel_workers", 0)
+
+    def get_parallel_min_duration(self):
+        return self.settings.get("parallel_min_duration", 900)
+
+    def get_live_subtitle_reload(self):
+        return self.settings.get("live_subtitle_reload", True)
+
+    def get_pipelined_translation(self):
+        return self.settings.get("pipelined_translation", True)
+
+    def get_measured_speed(self, key):
+        return self.settings.get("measured_speed", {}).get(key)
+
+    def record_measured_speed(self, key, seconds_per_media_second):
+        # Smooth over runs so one unusual file does not swing the next estimate
+        with self._lock:
+            speeds = self.settings.setdefault("measured_speed", {})
+            previous = speeds.get(key)
+            speeds[key] = seconds_per_media_second if previous is None else 0.7 * previous + 0.3 * seconds_per_media_second
+            self.save_settings()
+
+    def get_playhead_first(self):
+        return self.settings.get("playhead_first", True)
+
+    def get_prefetch_queue(self):
+        return self.settings.get("prefetch_queue", False)
+
+    def set_prefetch_queue(self, enabled):
+        with self._lock:
+            self.settings["prefetch_queue"] = bool(enabled)
+            self.save_settings()
+
+    def get_prefetch_languages(self):
+        return self.settings.get("prefetch_languages", [])
+
+    def get_last_translation_language(self):
+        return self.settings.get("last_translation_language")
+
+    def set_last_translation_language(self, lang_code):
+        with self._lock:
+            if self.settings.get("last_translation_language") != lang_code:
+                self.settings["last_translation_language"] = lang_code
+                self.save_settings()
+
+    def get_subtitle_cache_max_mb(self):
+        return self.settings.get("subtitle_cache_max_mb", 500)
+
+    def get_mirror_sidecar_subtitles(self):
+        return self.settings.get("mirror_sidecar_subtitles", True)
+
+    def get_audio_cache_max_mb(self):
+        return self.settings.get("audio_cache_max_mb", 4096)
+
+    def get_speculative_prewarm(self):
+        return self.settings.get("speculative_prewarm", True)
+
+    def get_prewarm_reserve_mb(self):
+        return self.settings.get("prewarm_reserve_mb", 1536)
+
+    def get_inference_worker_max_jobs(self):
+        return self.settings.get("inference_worker_max_jobs", 20)
+
+    def get_inference_worker_max_rss_mb(self):
+        return self.settings.get("inference_worker_max_rss_mb", 6144)
+
+    def get_translation_pool_size(self):
+        return self.settings.get("translation_pool_size", 3)
+
+    def get_translation_pool_reserve_mb(self):
+        return self.settings.get("translation_pool_reserve_mb", 1024)
+
+    def get_translation_backend(self):
+        return self.settings.get("translation_backend", "auto")
+
+    def get_translation_speed(self, lang_code):
+        return self.settings.get("translation_speed", {}).get(lang_code, {})
+
+    def record_translation_speed(self, lang_code, backend, tokens_per_second):
+        # Smoothed like measured_speed so one short file does not decide the comparison
+        with self._lock:
+            speeds = self.settings.setdefault("translation_speed", {}).setdefault(lang_code, {})
+            previous = speeds.get(backend)
+            speeds[backend] = tokens_per_second if previous is None else 0.7 * previous + 0.3 * tokens_per_second
+            self.save_settings()
+
+    def get_tuned_whisper_config(self, mode):
+        return self.settings.get("tuned_whisper", {}).get(mode)
+
+    def set_tuned_whisper_config(self, mode, config):
+        with self._lock:
+            self.settings.setdefault("tuned_whisper", {})[mode] = config
+            self.save_settings()
+
+    def clear_tuned_whisper_config(self, mode):
+        with self._lock:
+            if self.settings.get("tuned_whisper", {}).pop(mode, None) is not None:
+                self.save_settings()
+
+    def get_whisper_overrides(self, mode):
+        return self.settings.get("whisper_overrides", {}).get(mode, {})
+
+    def set_whisper_override(self, mode, key, value):
+        # A falsy value (0, None, "") removes the override and falls back to the tuned value
+        with self._lock:
+            overrides = self.settings.setdefault("whisper_overrides", {}).setdefault(mode, {})
+            if value:
+                overrides[key] = value
+            else:
+                overrides.pop(key, None)
+            self.save_settings()
@@ -0,0 +1,163 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import logging
+import threading
+
+SAMPLE_BLOCK_SIZE = 64 * 1024
+SAMPLE_BLOCK_COUNT = 8
+
+_fingerprint_memo = {}
+_fingerprint_lock = threading.Lock()
+
+
+def media_fingerprint(path):
+    """Fast content fingerprint: file size plus a hash of evenly spaced sample blocks
+
+    Survives renames and moves, and identical copies share it. Memoized per
+    (path, size, mtime) so repeated lookups only cost a stat.
+    """
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime)
+    with _fingerprint_lock:
+        cached = _fingerprint_memo.get(memo_key)
+    if cached:
+        return cached
+
+    size = stat.st_size
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(path, "rb") as f:
+        if size <= SAMPLE_BLOCK_SIZE * SAMPLE_BLOCK_COUNT:
+            digest.update(f.read())
+        else:
+            step = (size - SAMPLE_BLOCK_SIZE) // (SAMPLE_BLOCK_COUNT - 1)
+            for i in range(SAMPLE_BLOCK_COUNT):
+                f.seek(i * step)
+                digest.update(f.read(SAMPLE_BLOCK_SIZE))
+    fingerprint = digest.hexdigest()
+
+    with _fingerprint_lock:
+        _fingerprint_memo[memo_key] = fingerprint
+    return fingerprint
+
+
+def known_fingerprint(path):
+    """The memoized fingerprint of a file if it was already computed, without reading it; None otherwise"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    with _fingerprint_lock:
+        return _fingerprint_memo.get((os.path.abspath(path), stat.st_size, stat.st_mtime))
+
+
+class SubtitleStore:
+    """Central subtitle cache keyed by media fingerprint, model variant and language, with LRU size limit"""
+
+    def __init__(self, root, max_bytes=500 * 1024 * 1024, mirror_sidecar=True):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.mirror_sidecar = mirror_sidecar
+        self.index_file = os.path.join(root, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        self._index = self._load_index()
+        self._dirty = False
+
+    def _load_index(self):
+        try:
+            if os.path.exists(self.index_file):
+                with open(self.index_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            logging.error(f"Error loading subtitle cache index: {e}")
+        return {}
+
+    def flush(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                temp_file = self.index_file + ".tmp"
+                with open(temp_file, 'w') as f:
+                    json.dump(self._index, f)
+                os.replace(temp_file, self.index_file)
+                self._dirty = False
+            except Exception as e:
+                logging.error(f"Error saving subtitle cache index: {e}")
+
+    def make_key(self, fingerprint, variant, lang_code):
+        return f"{fingerprint}.{variant}.{lang_code}"
+
+    def path_for(self, fingerprint, variant, lang_code):
+        """Where this subtitle lives in the store, whether or not it exists yet (the writer creates the directory)"""
+        key = self.make_key(fingerprint, variant, lang_code)
+        return os.path.join(self.root, fingerprint[:2], f"{key}.srt")
+
+    def lookup(self, fingerprint, variant, lang_code):
+        """Return the stored path if present; only a stat, so it is safe to call for every queued file"""
+        key = self.make_key(fingerprint, variant, lang_code)
+        with self._lock:
+            entry = self._index.get(key)
+        if entry is None:
+            return None
+        path = os.path.join(self.root, entry["file"])
+        return path if os.path.exists(path) else None
+
+    def touch(self, path):
+        """Refresh the LRU position of a stored subtitle that is being used"""
+        key = os.path.splitext(os.path.basename(path))[0]
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is not None and os.path.join(self.root, entry["file"]) == path:
+                entry["last_used"] = time.time()
+                self._dirty = True
+
+    def register(self, fingerprint, variant, lang_code, sidecar_path=None):
+        """Record a subtitle written to path_for(), mirror it beside the media and enforce the size limit"""
+        key = self.make_key(fingerprint, variant, lang_code)
+        path = self.path_for(fingerprint, variant, lang_code)
+        if not os.path.exists(path):
+            return None
+        with self._lock:
+            self._index[key] = {
+                "file": os.path.relpath(path, self.root),
+                "size": os.path.getsize(path),
+                "last_used": time.time(),
+            }
+            self._dirty = True
+        self._evict(keep=key)
+        self.flush()
+
+        if self.mirror_sidecar and sidecar_path and not os.path.exists(sidecar_path):
+            try:
+                shutil.copyfile(path, sidecar_path)
+            except OSError as e:
+                # Read-only shares are fine, the store copy is authoritative
+                logging.warning(f"Could not mirror subtitle next to media: {e}")
+        return path
+
+    def _evict(self, keep=None):
+        with self._lock:
+            # Files deleted behind the store's back no longer count toward its size
+            for key in [key for key, entry in self._index.items() if not os.path.exists(os.path.join(self.root, entry["file"]))]:
+                del self._index[key]
+                self._dirty = True
+            total = sum(entry["size"] for entry in self._index.values())
+            if total <= self.max_bytes:
+                return
+            for key, entry in sorted(self._index.items(), key=lambda item: item[1]["last_used"]):
+                if total <= self.max_bytes:
+                    break
+                if key == keep:
+                    continue
+                try:
+                    os.remove(os.path.join(self.root, entry["file"]))
+                except OSError:
+                    pass
+                total -= entry["size"]
+                del self._index[key]
+                self._dirty = True
+                logging.info(f"Evicted cached subtitle {key}")
@@ -0,0 +1,189 @@
+import os
+import json
+import logging
+import threading
+import subprocess
+
+# Codecs ffmpeg can convert to SRT; bitmap formats (PGS, VobSub, DVB) need OCR and are skipped
+TEXT_SUBTITLE_CODECS = {"subrip", "srt", "ass", "ssa", "mov_text", "webvtt", "text"}
+
+# Container language tags (ISO 639-2/B, 639-2/T or 639-1) to the codes used in the language list
+_TAG_TO_LANG = {
+    "eng": "en", "en": "en",
+    "spa": "es", "es": "es",
+    "fre": "fr", "fra": "fr", "fr": "fr",
+    "ger": "de", "deu": "de", "de": "de",
+    "ita": "it", "it": "it",
+    "jpn": "jap", "ja": "jap",
+    "rus": "ru", "ru": "ru",
+    "ara": "ar", "ar": "ar",
+    "chi": "zh", "zho": "zh", "zh": "zh",
+    "hin": "hi", "hi": "hi",
+    "dut": "nl", "nld": "nl", "nl": "nl",
+    "swe": "sv", "sv": "sv",
+    "ukr": "uk", "uk": "uk",
+    "urd": "ur", "ur": "ur",
+}
+
+_inventory_memo = {}
+_inventory_lock = threading.Lock()
+
+
+def probe_subtitle_tracks(ffprobe_cmd, media_path):
+    """List the subtitle streams of a media file, memoized per (path, size, mtime)
+
+    Each entry has the subtitle-relative index used by -map 0:s:N, the codec,
+    the mapped language code (None if unknown), the title and disposition flags.
+    """
+    stat = os.stat(media_path)
+    memo_key = (os.path.abspath(media_path), stat.st_size, stat.st_mtime)
+    with _inventory_lock:
+        cached = _inventory_memo.get(memo_key)
+    if cached is not None:
+        return cached
+
+    command = [ffprobe_cmd, "-v", "error", "-select_streams", "s",
+               "-show_entries", "stream=index,codec_name:stream_tags=language,title:stream_disposition=default,forced,hearing_impaired",
+               "-of", "json", media_path]
+    result = subprocess.run(command, capture_output=True, text=True, timeout=15)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe failed ({result.returncode}): {result.stderr.strip()}")
+
+    tracks = []
+    for position, stream in enumerate(json.loads(result.stdout or "{}").get("streams", [])):
+        tags = stream.get("tags", {})
+        disposition = stream.get("disposition", {})
+        tag = (tags.get("language") or "").lower()
+        tracks.append({
+            "index": position,
+            "stream_index": stream.get("index"),
+            "codec": stream.get("codec_name", ""),
+            "language": _TAG_TO_LANG.get(tag),
+            "title": tags.get("title", ""),
+            "default": bool(disposition.get("default")),
+            "forced": bool(disposition.get("forced")),
+            "hearing_impaired": bool(disposition.get("hearing_impaired")),
+        })
+    logging.info(f"Found {len(tracks)} subtitle track(s) in {os.path.basename(media_path)}: "
+                 f"{[(t['codec'], t['language']) for t in tracks]}")
+
+    with _inventory_lock:
+        _inventory_memo[memo_key] = tracks
+    return tracks
+
+
+def find_text_track(tracks, lang_code):
+    """Best usable text track for a language, or None
+
+    Forced tracks only carry the lines spoken in another language, so they
+    are never used. Full tracks beat SDH ones, and the default flag breaks ties.
+    """
+    candidates = [t for t in tracks
+                  if t["language"] == lang_code and t["codec"] in TEXT_SUBTITLE_CODECS and not t["forced"]]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda t: (t["hearing_impaired"], not t["default"], t["index"]))
+
+
+def extract_subtitle_track(ffmpeg_cmd, media_path, track_index, output_path, cancel_token=None):
+    """Demux one subtitle stream and convert it to SRT, written atomically to output_path"""
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    temp_path = output_path + ".tmp"
+    command = [ffmpeg_cmd, "-nostdin", "-v", "error", "-y", "-i", media_path,
+               "-map", f"0:s:{track_index}", "-c:s", "srt", "-f", "srt", temp_path]
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if cancel_token is not None:
+        cancel_token.attach_process(process)
+    try:
+        _, stderr = process.communicate()
+    finally:
+        if cancel_token is not None:
+            cancel_token.detach_process(process)
+    try:
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        if process.returncode != 0:
+            raise RuntimeError(f"ffmpeg subtitle extraction failed ({process.returncode}): "
+                               f"{stderr.decode('utf-8', errors='replace').strip()}")
+        if os.path.getsize(temp_path) == 0:
+            raise RuntimeError("Subtitle track is empty")
+        os.replace(temp_path, output_path)
+    except Exception:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return output_path
+
+
+class LoadedSubtitleTracks:
+    """External subtitle tracks added to mpv for the media now playing
+
+    One entry per language (None for a manually opened file) holding the
+    mpv track id, the file it shows and that file's mtime when loaded.
+    Choosing the language again selects the existing track; it is reloaded
+    only when the path or the file's mtime changed, and a track whose file
+    is gone is removed from mpv.
+    """
+
+    def __init__(self, player, is_available=os.path.exists):
+        self.player = player
+        self.is_available = is_available
+        self.media_path = None
+        self._tracks = {}  # lang_code -> {"id", "path", "mtime", "source"}
+
+    def reset(self, media_path):
+        # mpv drops external tracks itself when it opens another file
+        self.media_path = media_path
+        self._tracks = {}
+
+    def __contains__(self, path):
+        return any(entry["path"] == path for entry in self._tracks.values())
+
+    def _mtime(self, path):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def _remove(self, lang_code):
+        entry = self._tracks.pop(lang_code)
+        try:
+            self.player.command('sub-remove', entry["id"])
+            logging.info(f"Removed stale subtitle track {entry['id']}: {entry['path']}")
+        except Exception as e:
+            logging.warning(f"Could not remove subtitle track {entry['id']}: {e}")
+
+    def remove_stale(self):
+        for lang_code in [lang_code for lang_code, entry in self._tracks.items() if not self.is_available(entry["path"])]:
+            self._remove(lang_code)
+
+    def load(self, path, lang_code=None, data=None):
+        """Show the subtitle at path (from data, its freshly generated SRT text, when given) and return the mpv track id"""
+        self.remove_stale()
+        mtime = self._mtime(path)
+        entry = self._tracks.get(lang_code)
+        if entry is not None and entry["path"] == path and data is None:
+            if mtime is None or entry["mtime"] in (None, mtime):
+                # Unchanged, or loaded from memory before the same text was written: just switch to it
+                entry["mtime"] = entry["mtime"] or mtime
+                self.player.sid = entry["id"]
+                return entry["id"]
+            if entry["source"] == "file":
+                self.player.command('sub-reload', entry["id"])
+                self.player.sid = entry["id"]
+                entry["mtime"] = mtime
+                return entry["id"]
+        if entry is not None:
+            # A different file for the language (other accuracy mode, embedded track) or new content replaces it
+            self._remove(lang_code)
+
+        if data:
+            self.player.sub_add(f"memory://{data}", title=os.path.basename(path))
+        else:
+            # Convert path to use forward slashes for MPV compatibility
+            self.player.sub_add(path.replace('\\', '/'))
+        track_id = self.player.sid
+        self._tracks[lang_code] = {"id": track_id, "path": path, "mtime": mtime, "source": "memory" if data else "file"}
+        return track_id
@@ -0,0 +1,232 @@
+import os
+import re
+import sys
+import logging
+from array import array
+
+_VTT_TAG = re.compile(r"<[^>]*>")
+_ASS_OVERRIDE = re.compile(r"\{[^}]*\}")
+
+
+def format_srt_timestamp_ms(total_ms):
+    hours, remainder = divmod(max(0, total_ms), 3600000)
+    minutes, remainder = divmod(remainder, 60000)
+    secs, milliseconds = divmod(remainder, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+
+
+def format_srt_cue(index, start_ms, end_ms, text):
+    return f"{index}\n{format_srt_timestamp_ms(start_ms)} --> {format_srt_timestamp_ms(end_ms)}\n{text.strip()}\n\n"
+
+
+def parse_timestamp_ms(text):
+    """Milliseconds from SRT (00:01:02,500), VTT (01:02.500) or ASS (0:01:02.50) timestamps, None if malformed"""
+    text = text.strip()
+    try:
+        clock, _, fraction = text.replace(",", ".").partition(".")
+        parts = [int(part) for part in clock.split(":")]
+        if len(parts) == 2:
+            parts.insert(0, 0)
+        if len(parts) != 3:
+            return None
+        hours, minutes, seconds = parts
+        # Fractions may have 1-3 digits (ASS uses centiseconds)
+        millis = int((fraction + "000")[:3]) if fraction else 0
+        return ((hours * 60 + minutes) * 60 + seconds) * 1000 + millis
+    except ValueError:
+        return None
+
+
+def ensure_parent_dir(path):
+    # Store paths are handed out before their shard directory exists
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def write_text_atomic(path, text):
+    """Write through a temp file and rename, so readers (mpv, the subtitle store) never see half a file"""
+    ensure_parent_dir(path)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+def partial_path(output_path):
+    """Path of the growing file used while a subtitle is still being generated"""
+    return os.path.splitext(output_path)[0] + ".partial.srt"
+
+
+class SrtStreamWriter:
+    """Appends cues to a .partial.srt as they arrive and moves it into place when done"""
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.partial_path = partial_path(output_path)
+        self.count = 0
+        self._parts = []  # the same cues kept in memory, so the result can go to mpv without a re-read
+        ensure_parent_dir(output_path)
+        self._file = open(self.partial_path, "w", encoding="utf-8")
+
+    def write(self, start, end, text):
+        self.count += 1
+        cue = format_srt_cue(self.count, int(round(start * 1000)), int(round(end * 1000)), text)
+        self._parts.append(cue)
+        self._file.write(cue)
+        # Flush whole cues so a reader never sees half of one
+        self._file.flush()
+
+    def rewrite(self, segments):
+        """Replace the partial file with a full, ordered set of segment dicts"""
+        self._file.seek(0)
+        self._file.truncate()
+        self.count = 0
+        self._parts = []
+        for segment in segments:
+            self.count += 1
+            self._parts.append(format_srt_cue(self.count, int(round(segment['start'] * 1000)),
+                                              int(round(segment['end'] * 1000)), segment['text']))
+        self._file.write("".join(self._parts))
+        self._file.flush()
+
+    def text(self):
+        """Everything written so far, as SRT text"""
+        return "".join(self._parts)
+
+    def commit(self):
+        self._file.close()
+        os.replace(self.partial_path, self.output_path)
+        logging.info(f"Wrote {self.count} subtitle cues to {self.output_path}")
+
+    def abort(self):
+        self._file.close()
+        try:
+            os.remove(self.partial_path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+
+class CueStore:
+    """Compact in-memory cues: start/end milliseconds in int arrays, text in one list of interned strings"""
+
+    def __init__(self):
+        self.starts = array("q")
+        self.ends = array("q")
+        self.texts = []
+
+    def append(self, start_ms, end_ms, text):
+        self.starts.append(start_ms)
+        self.ends.append(end_ms)
+        # Repeated lines ("[Music]", names) share one string object
+        self.texts.append(sys.intern(text))
+
+    def __len__(self):
+        return len(self.texts)
+
+    def to_srt(self, texts=None):
+        """SRT text of the cues, optionally with replacement texts (e.g. translations) in the same order"""
+        texts = self.texts if texts is None else texts
+        return "".join(format_srt_cue(index, start, end, text)
+                       for index, (start, end, text) in enumerate(zip(self.starts, self.ends, texts), 1))
+
+    def write_srt(self, output_path, texts=None):
+        write_text_atomic(output_path, self.to_srt(texts))
+
+
+def _iter_text_cues(lines, vtt=False):
+    """Streaming SRT/VTT cue reader; tolerant of CRLF, missing or extra blank lines and missing indexes
+
+    A cue starts at any line containing "-->". The line directly above it
+    (no blank line between) is dropped when it is a bare number (SRT index)
+    or, in VTT only, stands alone after a blank line (cue identifier).
+    Everything else up to the next timing line is cue text, so blank lines
+    inside an SRT cue do not split it.
+    """
+    timing = None
+    text = []
+    block_start = 0
+    skipping = False
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            block_start = len(text)
+            skipping = False
+            continue
+        if skipping:
+            continue
+        if "-->" in stripped:
+            if block_start < len(text) and (text[-1].isdigit() or (vtt and block_start == len(text) - 1)):
+                text.pop()
+            if timing is not None and text:
+                yield timing[0], timing[1], "\n".join(text)
+            start, _, rest = stripped.partition("-->")
+            # VTT cue settings ("align:start line:0") follow the end time
+            rest = rest.split()
+            start_ms = parse_timestamp_ms(start)
+            end_ms = parse_timestamp_ms(rest[0]) if rest else None
+            timing = (start_ms, end_ms) if start_ms is not None and end_ms is not None else None
+            text = []
+            block_start = 0
+            continue
+        if vtt and block_start == len(text) and stripped.split(" ", 1)[0] in ("WEBVTT", "NOTE", "STYLE", "REGION"):
+            # Header and metadata blocks run to the next blank line
+            skipping = True
+            continue
+        text.append(_VTT_TAG.sub("", stripped) if vtt else stripped)
+    if timing is not None and text:
+        yield timing[0], timing[1], "\n".join(text)
+
+
+def _iter_ass_cues(lines):
+    """Dialogue events from an ASS/SSA file, override tags removed"""
+    in_events = False
+    fields = None
+    for line in lines:
+        line = line.strip()
+        if line.startswith("["):
+            in_events = line.lower() == "[events]"
+            continue
+        if not in_events:
+            continue
+        if line.startswith("Format:"):
+            fields = [field.strip().lower() for field in line[len("Format:"):].split(",")]
+        elif line.startswith("Dialogue:") and fields:
+            values = line[len("Dialogue:"):].split(",", len(fields) - 1)
+            if len(values) != len(fields):
+                continue
+            event = dict(zip(fields, values))
+            start_ms = parse_timestamp_ms(event.get("start", ""))
+            end_ms = parse_timestamp_ms(event.get("end", ""))
+            text = _ASS_OVERRIDE.sub("", event.get("text", "")).replace("\\N", "\n").replace("\\n", "\n").replace("\\h", " ")
+            if start_ms is not None and end_ms is not None and text.strip():
+                yield start_ms, end_ms, text.strip()
+
+
+def iter_cues(path):
+    """Stream (start_ms, end_ms, text) cues from an SRT, VTT or ASS/SSA file without reading it whole"""
+    extension = os.path.splitext(path)[1].lower()
+    # utf-8-sig drops a BOM; undecodable bytes should not abort a whole file
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+        if extension in (".ass", ".ssa"):
+            yield from _iter_ass_cues(f)
+        else:
+            yield from _iter_text_cues(f, vtt=extension == ".vtt")
+
+
+def load_cues(path):
+    """Parse a subtitle file into a CueStore"""
+    store = CueStore()
+    for start_ms, end_ms, text in iter_cues(path):
+        store.append(start_ms, end_ms, text)
+    return store
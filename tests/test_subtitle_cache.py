@@ -0,0 +1,74 @@
+import os
+import itertools
+
+import pytest
+
+import subtitle_cache
+from subtitle_cache import SubtitleStore
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Strictly increasing time so LRU order does not depend on timer resolution"""
+    ticks = itertools.count(1000)
+
+    class Clock:
+        @staticmethod
+        def time():
+            return next(ticks)
+
+    monkeypatch.setattr(subtitle_cache, "time", Clock)
+
+
+def store_subtitle(store, fingerprint, lang_code, text, sidecar_path=None):
+    path = store.path_for(fingerprint, "fast", lang_code)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+    return store.register(fingerprint, "fast", lang_code, sidecar_path)
+
+
+def test_lookup_is_pure(tmp_path):
+    store = SubtitleStore(str(tmp_path / "store"))
+    path = store.path_for("abcdef", "fast", "en")
+    assert store.lookup("abcdef", "fast", "en") is None
+    assert not os.path.exists(os.path.dirname(path))
+
+
+def test_register_and_lookup(tmp_path, clock):
+    store = SubtitleStore(str(tmp_path / "store"))
+    sidecar = str(tmp_path / "movie.en.srt")
+    path = store_subtitle(store, "abcdef", "en", "subtitle", sidecar)
+    assert store.lookup("abcdef", "fast", "en") == path
+    assert open(sidecar).read() == "subtitle"
+    # The index survives a restart
+    assert SubtitleStore(str(tmp_path / "store")).lookup("abcdef", "fast", "en") == path
+
+
+def test_eviction_drops_least_recently_used(tmp_path, clock):
+    store = SubtitleStore(str(tmp_path / "store"), max_bytes=25)
+    first = store_subtitle(store, "aa1111", "en", "x" * 10)
+    second = store_subtitle(store, "bb2222", "en", "x" * 10)
+    store.touch(first)
+    store_subtitle(store, "cc3333", "en", "x" * 10)
+    assert store.lookup("aa1111", "fast", "en") == first
+    assert store.lookup("bb2222", "fast", "en") is None
+    assert not os.path.exists(second)
+    assert store.lookup("cc3333", "fast", "en") is not None
+
+
+def test_newest_entry_is_kept_even_when_oversized(tmp_path, clock):
+    store = SubtitleStore(str(tmp_path / "store"), max_bytes=5)
+    assert store_subtitle(store, "aa1111", "en", "x" * 10) is not None
+    assert store.lookup("aa1111", "fast", "en") is not None
+
+
+def test_files_deleted_outside_the_store_are_pruned(tmp_path, clock):
+    store = SubtitleStore(str(tmp_path / "store"), max_bytes=25)
+    first = store_subtitle(store, "aa1111", "en", "x" * 10)
+    os.remove(first)
+    assert store.lookup("aa1111", "fast", "en") is None
+    store_subtitle(store, "bb2222", "en", "x" * 10)
+    # Only the live file counts toward the limit, so the next one fits without evicting it
+    store_subtitle(store, "cc3333", "en", "x" * 10)
+    assert store.lookup("bb2222", "fast", "en") is not None
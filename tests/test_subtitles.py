@@ -0,0 +1,66 @@
+from subtitles import iter_cues, load_cues, parse_timestamp_ms
+
+
+def write(tmp_path, name, text, newline="\n"):
+    path = tmp_path / name
+    path.write_bytes(text.replace("\n", newline).encode("utf-8"))
+    return str(path)
+
+
+def cues(path):
+    return list(iter_cues(path))
+
+
+def test_parse_timestamp():
+    assert parse_timestamp_ms("00:01:02,345") == 62345
+    assert parse_timestamp_ms("01:02.345") == 62345
+    assert parse_timestamp_ms("0:00:01.50") == 1500
+    assert parse_timestamp_ms("garbage") is None
+
+
+def test_srt_with_crlf_and_bom(tmp_path):
+    path = write(tmp_path, "a.srt", "﻿1\n00:00:01,000 --> 00:00:02,000\nHello\n\n2\n00:00:03,000 --> 00:00:04,000\nWorld\n",
+                 newline="\r\n")
+    assert cues(path) == [(1000, 2000, "Hello"), (3000, 4000, "World")]
+
+
+def test_srt_without_indexes_or_blank_lines(tmp_path):
+    path = write(tmp_path, "a.srt", "00:00:01,000 --> 00:00:02,000\nFirst\nline two\n00:00:03,000 --> 00:00:04,000\nSecond\n")
+    assert cues(path) == [(1000, 2000, "First\nline two"), (3000, 4000, "Second")]
+
+
+def test_srt_blank_line_inside_cue(tmp_path):
+    path = write(tmp_path, "a.srt", "00:00:01,000 --> 00:00:02,000\nFirst\n\nstill first\n00:00:03,000 --> 00:00:04,000\nSecond\n")
+    assert cues(path) == [(1000, 2000, "First\nstill first"), (3000, 4000, "Second")]
+    path = write(tmp_path, "b.srt", "1\n00:00:01,000 --> 00:00:02,000\nFirst\n\nstill first\n\n2\n00:00:03,000 --> 00:00:04,000\nSecond\n")
+    assert cues(path) == [(1000, 2000, "First\nstill first"), (3000, 4000, "Second")]
+
+
+def test_srt_extra_blank_lines_and_empty_cue(tmp_path):
+    path = write(tmp_path, "a.srt", "\n\n1\n00:00:01,000 --> 00:00:02,000\n\n\n2\n00:00:03,000 --> 00:00:04,000\nKept\n\n\n")
+    assert cues(path) == [(3000, 4000, "Kept")]
+
+
+def test_vtt_header_notes_identifiers_and_tags(tmp_path):
+    path = write(tmp_path, "a.vtt", "WEBVTT - title\nKind: captions\n\nNOTE a comment\nspanning lines\n\n"
+                                    "intro\n00:01.000 --> 00:02.000 align:start line:0\n<v Bob>Hi</v> <i>there</i>\n\n"
+                                    "00:03.000 --> 00:04.000\nBye\n")
+    assert cues(path) == [(1000, 2000, "Hi there"), (3000, 4000, "Bye")]
+
+
+def test_ass_dialogue(tmp_path):
+    path = write(tmp_path, "a.ass", "[Script Info]\nTitle: x\n\n[Events]\n"
+                                    "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+                                    "Comment: 0,0:00:00.00,0:00:01.00,Default,,0,0,0,,ignored\n"
+                                    "Dialogue: 0,0:00:01.00,0:00:02.50,Default,,0,0,0,,{\\i1}Hello{\\i0}, you\\Nthere\n"
+                                    "Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,{\\pos(1,1)}\n")
+    assert cues(path) == [(1000, 2500, "Hello, you\nthere")]
+
+
+def test_cue_store_round_trip(tmp_path):
+    path = write(tmp_path, "a.srt", "1\n00:00:01,000 --> 00:00:02,000\nHello\n\n2\n00:00:03,000 --> 00:00:04,000\nWorld\n")
+    store = load_cues(path)
+    assert len(store) == 2
+    srt = store.to_srt(["Hola", "Mundo"])
+    assert srt.startswith("1\n00:00:01,000 --> 00:00:02,000\nHola\n")
+    assert cues(write(tmp_path, "b.srt", srt)) == [(1000, 2000, "Hola"), (3000, 4000, "Mundo")]
@@ -0,0 +1,39 @@
+from translation_planner import TranslationPlan, approx_tokens
+
+
+def test_duplicates_collapse_to_unique_lines():
+    plan = TranslationPlan(["Hello", "Bye", "Hello", "Hello"])
+    assert plan.unique == ["Hello", "Bye"]
+    assert plan.index == [0, 1, 0, 0]
+
+
+def test_batches_are_sorted_by_length():
+    lines = ["a much longer line of dialogue than the others", "hi", "a medium line", "ok"]
+    plan = TranslationPlan(lines)
+    lengths = [plan.lengths[i] for batch in plan.batches for i in batch]
+    assert lengths == sorted(lengths)
+
+
+def test_batch_limits():
+    lines = [f"line number {i}" for i in range(10)]
+    plan = TranslationPlan(lines, max_batch_lines=3)
+    assert all(len(batch) <= 3 for batch in plan.batches)
+    assert sorted(i for batch in plan.batches for i in batch) == list(range(10))
+
+    plan = TranslationPlan(lines, max_batch_tokens=2 * approx_tokens(lines[0]))
+    assert all(len(batch) <= 2 for batch in plan.batches)
+
+
+def test_scatter_restores_file_order():
+    lines = ["a fairly long line of dialogue here", "short", "mid length line", "short", "x"]
+    plan = TranslationPlan(lines, max_batch_lines=2)
+    # Echo each unique line back as its "translation"
+    results = [[text.upper() for text in batch] for batch in plan.batch_texts()]
+    assert plan.scatter(results) == [line.upper() for line in lines]
+
+
+def test_empty_plan():
+    plan = TranslationPlan([])
+    assert plan.batches == []
+    assert plan.scatter([]) == []
+    assert "0 lines" in plan.summary()
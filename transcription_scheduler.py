@@ -0,0 +1,67 @@
+import threading
+
+from ffmpeg_tools import SAMPLE_RATE
+
+
+def split_fixed(total_samples, window_seconds=60):
+    """Fallback windows of a fixed length for when VAD is not available"""
+    window = int(window_seconds * SAMPLE_RATE)
+    return [(start, min(start + window, total_samples)) for start in range(0, total_samples, window)]
+
+
+class PlayheadScheduler:
+    """Hands out audio windows nearest to the playhead first and merges their segments"""
+
+    def __init__(self, playhead=0):
+        self._lock = threading.Lock()
+        self.playhead = playhead
+        self.chunks = []
+        self._pending = set()
+        self._results = {}
+
+    def set_chunks(self, chunks):
+        with self._lock:
+            self.chunks = list(chunks)
+            self._pending = set(range(len(self.chunks)))
+            self._results = {}
+
+    def set_playhead(self, seconds):
+        """Called on every time-pos change, so seeks re-prioritize the remaining windows"""
+        with self._lock:
+            self.playhead = seconds
+
+    def _distance(self, index):
+        start, end = self.chunks[index]
+        start_seconds = start / SAMPLE_RATE
+        end_seconds = end / SAMPLE_RATE
+        if start_seconds <= self.playhead < end_seconds:
+            return 0
+        if start_seconds >= self.playhead:
+            return start_seconds - self.playhead
+        # Viewers move forward, so windows behind the playhead count double
+        return 2 * (self.playhead - end_seconds)
+
+    def next_chunk(self):
+        """Return the index of the most urgent pending window, or None when all are handed out"""
+        with self._lock:
+            if not self._pending:
+                return None
+            index = min(self._pending, key=self._distance)
+            self._pending.discard(index)
+            return index
+
+    def add_result(self, index, segments):
+        with self._lock:
+            self._results[index] = segments
+
+    def covered_seconds(self):
+        with self._lock:
+            return sum((self.chunks[i][1] - self.chunks[i][0]) / SAMPLE_RATE for i in self._results)
+
+    def merged_segments(self):
+        """All finished segments in timeline order"""
+        with self._lock:
+            segments = []
+            for index in sorted(self._results):
+                segments.extend(self._results[index])
+            return segments
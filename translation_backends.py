@@ -0,0 +1,118 @@
+import os
+import gc
+import shutil
+import logging
+
+# One EasyNMT instance per worker process; language pairs are loaded into it on demand
+_easynmt = None
+
+
+def _get_easynmt():
+    global _easynmt
+    if _easynmt is None:
+        from easynmt import EasyNMT
+        _easynmt = EasyNMT('opus-mt')
+        _easynmt.sentence_splitter = lambda text, lang: [text]
+        # Which pairs stay loaded is decided by the TranslationModelPool
+        _easynmt.translator.max_loaded_models = 1000
+    return _easynmt
+
+
+def opus_mt_name(source_lang, target_lang):
+    return f"Helsinki-NLP/opus-mt-{source_lang}-{target_lang}"
+
+
+def converted_model_dir(snapshot_dir):
+    """int8 CTranslate2 copy lives beside the snapshots of the same HF cache entry, one per revision"""
+    repo_dir = os.path.dirname(os.path.dirname(snapshot_dir))
+    return os.path.join(repo_dir, f"ct2-int8-{os.path.basename(snapshot_dir)}")
+
+
+class EasyNMTBackend:
+    """PyTorch opus-mt through EasyNMT, the original path and the fallback"""
+
+    name = "easynmt"
+    compute_type = "float32"
+
+    def __init__(self, source_lang, target_lang, cpu_threads=0):
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.model_name = opus_mt_name(source_lang, target_lang)
+        _get_easynmt().translator.load_model(self.model_name)
+
+    def translate(self, lines):
+        return _get_easynmt().translate(lines, source_lang=self.source_lang, target_lang=self.target_lang,
+                                        batch_size=len(lines))
+
+    def close(self):
+        if _easynmt is not None:
+            _easynmt.translator.models.pop(self.model_name, None)
+        gc.collect()
+
+
+class CTranslate2Backend:
+    """The same opus-mt checkpoint converted once to int8 CTranslate2 for fast CPU decoding"""
+
+    name = "ctranslate2"
+    compute_type = "int8"
+
+    def __init__(self, source_lang, target_lang, cpu_threads=0):
+        import ctranslate2
+        from huggingface_hub import snapshot_download
+        from transformers import AutoTokenizer
+
+        self.model_name = opus_mt_name(source_lang, target_lang)
+        snapshot_dir = snapshot_download(self.model_name, local_files_only=True)
+        model_dir = converted_model_dir(snapshot_dir)
+        if not os.path.exists(os.path.join(model_dir, "model.bin")):
+            self._convert(snapshot_dir, model_dir)
+        self.tokenizer = AutoTokenizer.from_pretrained(snapshot_dir)
+        self.translator = ctranslate2.Translator(model_dir, device="cpu", compute_type=self.compute_type, intra_threads=cpu_threads)
+
+    def _convert(self, snapshot_dir, model_dir):
+        from ctranslate2.converters import TransformersConverter
+
+        logging.info(f"Converting {self.model_name} to int8 CTranslate2 at {model_dir}")
+        temp_dir = model_dir + ".tmp"
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        TransformersConverter(snapshot_dir).convert(temp_dir, quantization="int8", force=True)
+        # Rename last so a half-written conversion is never picked up
+        shutil.rmtree(model_dir, ignore_errors=True)
+        os.replace(temp_dir, model_dir)
+
+    def translate(self, lines):
+        sources = [self.tokenizer.convert_ids_to_tokens(self.tokenizer.encode(line)) for line in lines]
+        # Beam size matches EasyNMT's default so output quality is comparable
+        results = self.translator.translate_batch(sources, max_batch_size=len(lines), beam_size=5)
+        return [self.tokenizer.decode(self.tokenizer.convert_tokens_to_ids(result.hypotheses[0]), skip_special_tokens=True)
+                for result in results]
+
+    def close(self):
+        del self.translator
+        gc.collect()
+
+
+BACKENDS = {
+    CTranslate2Backend.name: CTranslate2Backend,
+    EasyNMTBackend.name: EasyNMTBackend,
+}
+
+
+def revision_tag(preferred):
+    """Backend and compute type a translation came from, as recorded alongside it in the translation memory"""
+    backend_class = CTranslate2Backend if preferred == "auto" else BACKENDS.get(preferred, EasyNMTBackend)
+    return f"{backend_class.name}-{backend_class.compute_type}"
+
+
+def create_backend(preferred, source_lang, target_lang, cpu_threads=0):
+    """Load a language pair with the preferred backend ("auto" = CTranslate2), falling back to EasyNMT"""
+    order = [CTranslate2Backend, EasyNMTBackend] if preferred == "auto" else [BACKENDS.get(preferred, EasyNMTBackend)]
+    if EasyNMTBackend not in order:
+        order.append(EasyNMTBackend)
+    for backend_class in order:
+        try:
+            return backend_class(source_lang, target_lang, cpu_threads)
+        except Exception as e:
+            if backend_class is EasyNMTBackend:
+                raise
+            logging.warning(f"{backend_class.name} backend unavailable for {source_lang}-{target_lang}, falling back: {e}")
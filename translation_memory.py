@@ -0,0 +1,94 @@
+import os
+import time
+import sqlite3
+import logging
+import threading
+import unicodedata
+
+# SQLite limits bound parameters per statement; stay well below it
+LOOKUP_CHUNK = 500
+
+
+def normalize_text(text):
+    """Key form of a subtitle line: NFC, single spaces, no outer whitespace (case is kept)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class TranslationMemory:
+    """SQLite store of past line translations keyed by (normalized source, target language, model revision)"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS memory ("
+            " source TEXT NOT NULL, lang TEXT NOT NULL, revision TEXT NOT NULL, target TEXT NOT NULL,"
+            " hits INTEGER NOT NULL DEFAULT 0, created REAL NOT NULL,"
+            " PRIMARY KEY (source, lang, revision))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS stats ("
+            " lang TEXT PRIMARY KEY, lookups INTEGER NOT NULL DEFAULT 0, hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.commit()
+
+    def lookup_many(self, texts, lang_code, revision):
+        """Return {normalized text: translation} for every line already in memory, counting hits"""
+        keys = list({normalize_text(text) for text in texts})
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), LOOKUP_CHUNK):
+                chunk = keys[start:start + LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT source, target FROM memory WHERE lang = ? AND revision = ? AND source IN ({placeholders})",
+                    [lang_code, revision] + chunk,
+                ).fetchall()
+                found.update(rows)
+            if found:
+                self._conn.executemany(
+                    "UPDATE memory SET hits = hits + 1 WHERE source = ? AND lang = ? AND revision = ?",
+                    [(source, lang_code, revision) for source in found],
+                )
+            # Stats count subtitle lines, so a repeated line inside one file counts every time
+            line_hits = sum(1 for text in texts if normalize_text(text) in found)
+            self._conn.execute(
+                "INSERT INTO stats (lang, lookups, hits) VALUES (?, ?, ?) "
+                "ON CONFLICT(lang) DO UPDATE SET lookups = lookups + excluded.lookups, hits = hits + excluded.hits",
+                (lang_code, len(texts), line_hits),
+            )
+            self._conn.commit()
+        return found
+
+    def store_many(self, pairs, lang_code, revision):
+        """Remember (source text, translation) pairs produced by the model"""
+        now = time.time()
+        rows = [(normalize_text(source), lang_code, revision, target, now) for source, target in pairs if source.strip()]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO memory (source, lang, revision, target, created) VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def get_stats(self, lang_code=None):
+        """Cumulative line lookups and hits, for one language or all of them"""
+        with self._lock:
+            if lang_code:
+                row = self._conn.execute("SELECT lookups, hits FROM stats WHERE lang = ?", (lang_code,)).fetchone()
+            else:
+                row = self._conn.execute("SELECT SUM(lookups), SUM(hits) FROM stats").fetchone()
+            entries = self._conn.execute("SELECT COUNT(*) FROM memory").fetchone()[0]
+        lookups, hits = (row or (0, 0))
+        lookups, hits = lookups or 0, hits or 0
+        return {"lookups": lookups, "hits": hits, "hit_rate": hits / lookups if lookups else 0.0, "entries": entries}
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception as e:
+                logging.error(f"Error closing translation memory: {e}")
@@ -0,0 +1,150 @@
+import time
+import logging
+import threading
+from queue import Queue, Empty, Full
+
+from jobs import JobCancelled
+from subtitles import SrtStreamWriter
+
+_END = object()
+
+
+class _TeeWriter:
+    """Passes cues to the English writer and hands every new one to the pipeline"""
+
+    def __init__(self, writer, pipeline):
+        self._writer = writer
+        self._pipeline = pipeline
+
+    def write(self, start, end, text):
+        self._writer.write(start, end, text)
+        self._pipeline.submit(start, end, text)
+
+    def rewrite(self, segments):
+        # Playhead-first runs rewrite the whole file per chunk; only cues not seen before are new
+        self._writer.rewrite(segments)
+        for segment in segments:
+            self._pipeline.submit(segment['start'], segment['end'], segment['text'])
+
+
+class TranslationPipeline:
+    """Translates English cues while they are still being transcribed and grows the target SRT alongside
+
+    The transcription thread submit()s cues into a bounded queue; a consumer
+    thread gathers them into small batches, runs translate_fn(texts) and
+    appends the results to the target's .partial.srt. A full queue blocks the
+    producer, so a slow translator holds transcription back instead of
+    buffering without limit.
+    """
+
+    def __init__(self, output_path, translate_fn, cancel_token, max_queued=256, batch_lines=16, flush_seconds=2.0):
+        self.translate_fn = translate_fn
+        self.cancel_token = cancel_token
+        self.batch_lines = batch_lines
+        self.flush_seconds = flush_seconds
+        self.error = None
+        self.translated = 0
+        self._queue = Queue(maxsize=max_queued)
+        self._seen = set()
+        self._cues = []  # (start, end, translated text) in the order written
+        self._writer = SrtStreamWriter(output_path)
+        self._thread = threading.Thread(target=self._run, name="translation-pipeline", daemon=True)
+        self._thread.start()
+
+    def tee(self, writer):
+        return _TeeWriter(writer, self)
+
+    def _put(self, item):
+        while True:
+            if self.cancel_token.cancelled or self.error is not None:
+                # Neither a cancel nor a translation failure may take the English transcription down with it;
+                # the transcription checks the token itself and finish() reports both
+                return
+            try:
+                self._queue.put(item, timeout=0.2)
+                return
+            except Full:
+                continue
+
+    def submit(self, start, end, text):
+        key = (start, end, text)
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        self._put(key)
+
+    def _next_batch(self):
+        """Block for one cue, then take what else arrives within flush_seconds; (batch, finished)"""
+        first = self._queue.get()
+        if first is _END:
+            return [], True
+        batch = [first]
+        deadline = time.time() + self.flush_seconds
+        while len(batch) < self.batch_lines:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.time()))
+            except Empty:
+                break
+            if item is _END:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _write(self, cues):
+        if self._cues and cues[0][0] < self._cues[-1][0]:
+            # A chunk ahead of the playhead landed first; keep the file in time order
+            self._cues = sorted(self._cues + cues, key=lambda cue: cue[0])
+            self._writer.rewrite([{'start': s, 'end': e, 'text': t} for s, e, t in self._cues])
+        else:
+            self._cues.extend(cues)
+            for start, end, text in cues:
+                self._writer.write(start, end, text)
+
+    def _run(self):
+        finished = False
+        while not finished:
+            batch, finished = self._next_batch()
+            if not batch or self.error is not None:
+                continue
+            try:
+                batch.sort(key=lambda cue: cue[0])
+                translations = self.translate_fn([text for _, _, text in batch])
+                self._write([(start, end, translated) for (start, end, _), translated in zip(batch, translations)])
+                self.translated += len(batch)
+            except Exception as e:
+                # Remembered for finish(); keep draining so the producer never blocks on a full queue
+                self.error = e
+                if not isinstance(e, JobCancelled):
+                    logging.error(f"Pipelined translation failed: {e}")
+
+    def finish(self):
+        """Wait for every submitted cue to be translated, then move the target SRT into place"""
+        try:
+            self._put(_END)
+            while self._thread.is_alive() and self.error is None:
+                self._thread.join(timeout=0.2)
+                self.cancel_token.raise_if_cancelled()
+            if self.error is not None:
+                raise self.error
+        except BaseException:
+            self.abort()
+            raise
+        self._writer.commit()
+
+    def text(self):
+        """The translated SRT as written so far"""
+        return self._writer.text()
+
+    def abort(self):
+        """Stop the consumer and drop the partial target file"""
+        self.error = self.error or JobCancelled()
+        # Nothing queued will be translated now; clear it so the end marker always fits
+        while True:
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                break
+        self._queue.put_nowait(_END)
+        # A batch already in translate_fn would otherwise write into the file after it is removed
+        self._thread.join()
+        self._writer.abort()
@@ -0,0 +1,54 @@
+def approx_tokens(text):
+    """Cheap stand-in for the SentencePiece length: roughly one token per word piece of ~4 characters"""
+    return max(1, sum((len(word) + 3) // 4 for word in text.split()))
+
+
+def _padded_tokens(batches, lengths):
+    return sum(len(batch) * max(lengths[i] for i in batch) for batch in batches if batch)
+
+
+class TranslationPlan:
+    """Unique lines grouped into length-sorted batches, with the map back to the original order"""
+
+    def __init__(self, lines, max_batch_lines=32, max_batch_tokens=1024):
+        self.unique = list(dict.fromkeys(lines))
+        position = {text: i for i, text in enumerate(self.unique)}
+        self.index = [position[text] for text in lines]
+        self.lengths = [approx_tokens(text) for text in self.unique]
+
+        # Similar lengths share a batch so short lines are not padded up to long ones
+        order = sorted(range(len(self.unique)), key=lambda i: self.lengths[i])
+        self.batches = []
+        batch = []
+        for i in order:
+            longest = max([self.lengths[j] for j in batch] + [self.lengths[i]])
+            if batch and (len(batch) >= max_batch_lines or (len(batch) + 1) * longest > max_batch_tokens):
+                self.batches.append(batch)
+                batch = []
+            batch.append(i)
+        if batch:
+            self.batches.append(batch)
+
+        # What the old file-order, duplicates-included batching of the same size would have padded to
+        naive_lengths = [approx_tokens(text) for text in lines]
+        naive_batches = [list(range(start, min(start + max_batch_lines, len(lines))))
+                         for start in range(0, len(lines), max_batch_lines)]
+        self.naive_padded_tokens = _padded_tokens(naive_batches, naive_lengths)
+        self.padded_tokens = _padded_tokens(self.batches, self.lengths)
+        self.real_tokens = sum(self.lengths)
+
+    def batch_texts(self):
+        return [[self.unique[i] for i in batch] for batch in self.batches]
+
+    def scatter(self, batch_results):
+        """Turn per-batch results (same shape as batch_texts) back into one result per original line"""
+        by_unique = [None] * len(self.unique)
+        for batch, results in zip(self.batches, batch_results):
+            for i, result in zip(batch, results):
+                by_unique[i] = result
+        return [by_unique[i] for i in self.index]
+
+    def summary(self):
+        waste = 1 - self.real_tokens / self.padded_tokens if self.padded_tokens else 0.0
+        return (f"{len(self.index)} lines -> {len(self.unique)} unique in {len(self.batches)} batches, "
+                f"~{self.padded_tokens} padded tokens ({waste:.0%} padding) vs ~{self.naive_padded_tokens} in file order")
@@ -0,0 +1,78 @@
+import gc
+import time
+import logging
+from collections import OrderedDict
+
+import psutil
+
+from translation_backends import create_backend, opus_mt_name
+
+
+class TranslationModelPool:
+    """Keeps the last few opus-mt language models loaded, bounded by count and free memory
+
+    Lives inside the inference worker. Each entry is a translation backend
+    (int8 CTranslate2 by default, EasyNMT as fallback); this pool decides
+    which of them stay.
+    """
+
+    def __init__(self, max_models=3, reserve_mb=1024, backend="auto", cpu_threads=0):
+        self.max_models = max_models
+        self.reserve_mb = reserve_mb
+        self.backend = backend
+        self.cpu_threads = cpu_threads
+        self._loaded = OrderedDict()  # model name -> {"model", "size_mb", "load_time"}, oldest first
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "load_times": []}
+
+    def _available_mb(self):
+        return psutil.virtual_memory().available // (1024 * 1024)
+
+    def _evict_one(self):
+        model_name, entry = self._loaded.popitem(last=False)
+        entry["model"].close()
+        self._stats["evictions"] += 1
+        gc.collect()
+        logging.info(f"Translation model evicted: {model_name}")
+
+    def acquire(self, source_lang, target_lang):
+        """Return the loaded backend for the pair, loading and evicting as needed"""
+        model_name = opus_mt_name(source_lang, target_lang)
+        if model_name in self._loaded:
+            self._loaded.move_to_end(model_name)
+            self._stats["hits"] += 1
+            return self._loaded[model_name]["model"]
+
+        # Make room first: by count, then until the last known model size fits above the reserve
+        while len(self._loaded) >= self.max_models:
+            self._evict_one()
+        expected_mb = max((entry["size_mb"] for entry in self._loaded.values()), default=0)
+        while self._loaded and self._available_mb() - expected_mb < self.reserve_mb:
+            self._evict_one()
+
+        rss_before = psutil.Process().memory_info().rss
+        start = time.time()
+        model = create_backend(self.backend, source_lang, target_lang, self.cpu_threads)
+        load_time = time.time() - start
+        size_mb = max(0, psutil.Process().memory_info().rss - rss_before) // (1024 * 1024)
+        self._loaded[model_name] = {"model": model, "size_mb": size_mb, "load_time": load_time}
+        self._stats["misses"] += 1
+        self._stats["load_times"].append(load_time)
+        logging.info(f"Translation model loaded with {model.name} in {load_time:.1f}s (~{size_mb}MB): {model_name}")
+        return model
+
+    def is_loaded(self, source_lang, target_lang):
+        return opus_mt_name(source_lang, target_lang) in self._loaded
+
+    def get_stats(self):
+        load_times = self._stats["load_times"]
+        requests = self._stats["hits"] + self._stats["misses"]
+        return {
+            "hits": self._stats["hits"],
+            "misses": self._stats["misses"],
+            "hit_rate": self._stats["hits"] / requests if requests else 0.0,
+            "evictions": self._stats["evictions"],
+            "loaded": list(self._loaded),
+            "backends": {name: entry["model"].name for name, entry in self._loaded.items()},
+            "avg_load_time": sum(load_times) / len(load_times) if load_times else 0.0,
+            "last_load_time": load_times[-1] if load_times else 0.0,
+        }